@@ -13,6 +13,11 @@ Usage:
     python main.py --task 2     # Run only Task 2
     python main.py --task 3     # Run only Task 3
     python main.py --input path/to/video.mp4
+    python main.py --task 1 --stream          # Constant-memory Task 1 on huge inputs
+    python main.py --live udp://127.0.0.1:1234  # Rolling stats of a live MPEG-TS feed
+    python main.py --task 2 --preview 30 20   # 20 s MV proxy from t=30 s
+    python main.py --task 3 --resume          # Resumable, checkpointed render
+    python main.py --task 3 --plan            # Predict render time and size first
 """
 
 import argparse
@@ -26,12 +31,13 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from src.config import LOG_CONFIG_PATH
 from src.utils.paths import get_input_video, ensure_output_dirs
 from src.utils.logger import setup_logger, print_log_status
+from src.utils.cli import parse_args, run_live
 from src.utils.validators import validate_input_video, validate_ffmpeg
 
 
 def main() -> None:
     """Parse arguments, validate environment, and run selected tasks."""
-    args = _parse_args()
+    args = parse_args()
     logger = setup_logger("main", LOG_CONFIG_PATH)
 
     print("=" * 60)
@@ -43,6 +49,10 @@ def main() -> None:
     validate_ffmpeg()
     print("  FFmpeg and FFprobe OK")
 
+    if args.live:
+        run_live(args.live, logger)
+        return
+
     # --- Locate input video ---
     if args.input:
         video_path = Path(args.input)
@@ -59,7 +69,7 @@ def main() -> None:
     tasks_to_run = [args.task] if args.task else [1, 2, 3]
 
     for t in tasks_to_run:
-        _run_task(int(t), video_path, logger)
+        _run_task(int(t), video_path, logger, args)
 
     elapsed = time.time() - start
     print(f"\nAll done in {elapsed:.1f}s")
@@ -67,33 +77,36 @@ def main() -> None:
     print_log_status(logger)
 
 
-def _run_task(task_num: int, video_path: Path, logger) -> None:
+def _run_task(task_num: int, video_path: Path, logger, args: argparse.Namespace) -> None:
     """Dispatch to the appropriate task runner."""
     print(f"\n{'='*60}")
     print(f"  TASK {task_num}")
     print(f"{'='*60}")
 
+    if args.plan and task_num in (2, 3):
+        from src.config import TASK2_OUTPUT_DIR, TASK3_OUTPUT_DIR
+        from src.utils.render_planner import predict_render
+        job, out_dir = ("mv", TASK2_OUTPUT_DIR) if task_num == 2 else ("overlay", TASK3_OUTPUT_DIR)
+        plan = predict_render(video_path, job, out_dir)
+        rt, size = plan["runtime_sec"], plan["output_bytes"]
+        print(f"  Estimated render: {rt['estimate']:.0f} s ({rt['low']:.0f}-{rt['high']:.0f} s), "
+              f"{size['estimate'] / 1e6:.1f} MB ({size['low'] / 1e6:.1f}-{size['high'] / 1e6:.1f} MB)")
+        return
+
     if task_num == 1:
         from src.task1 import run_task1
-        run_task1(video_path)
+        run_task1(video_path, args.sample, args.stream)
     elif task_num == 2:
         from src.task2 import run_task2
-        run_task2(video_path)
+        run_task2(video_path, args.preview, args.preview_height)
     elif task_num == 3:
         from src.task3 import run_task3
-        run_task3(video_path)
+        scene = Path(args.scene) if args.scene else None
+        run_task3(video_path, scene, args.scene_objects, args.resume, args.sweep,
+                  [Path(p) for p in args.ladder] if args.ladder else None)
     else:
         print(f"  Unknown task number: {task_num}")
 
 
-def _parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="L35 Video Compression Toolkit")
-    parser.add_argument("--task", type=int, choices=[1, 2, 3],
-                        help="Run a single task (1, 2, or 3)")
-    parser.add_argument("--input", type=str,
-                        help="Path to input MP4 video")
-    return parser.parse_args()
-
-
 if __name__ == "__main__":
     main()
@@ -23,6 +23,7 @@ TASK1_OUTPUT_DIR = OUTPUT_DIR / "task 1 - video information"
 TASK2_OUTPUT_DIR = OUTPUT_DIR / "task 2 - motion vectors"
 TASK2_FRAMES_DIR = TASK2_OUTPUT_DIR / "sample_frames"
 TASK3_OUTPUT_DIR = OUTPUT_DIR / "task 3 - rotating rectangle"
+FRAME_CACHE_DIR = OUTPUT_DIR / ".frame_cache"   # Extracted-frame cache (Task 2)
 
 # ---------------------------------------------------------------------------
 # FFmpeg binary paths — winget installs to this location
@@ -40,6 +41,55 @@ FFMPEG_DIR: Path | None = _WINGET_FFMPEG if _WINGET_FFMPEG.exists() else None
 # ---------------------------------------------------------------------------
 CRF_VALUE = 18          # Constant Rate Factor: 18 = visually lossless
 PRESET = "medium"       # Speed/compression trade-off for libx264
+CAPTURE_ENCODER_STATS = True  # Keep libx264's per-frame type/QP/bits as a CSV sidecar
+FRAME_RING_SIZE = 4     # Reusable decode buffers in FrameSource (frames in flight)
+PLAN_SAMPLES = 4        # --plan: evenly spaced keyframe-aligned sample encodes
+PLAN_SAMPLE_SEC = 1.0   # --plan: length of each sample in seconds
+THREAD_BUDGET = None    # Threads shared by concurrent FFmpeg/x264/OpenCV jobs (None = all cores)
+
+# ---------------------------------------------------------------------------
+# Task 1: Sampled analysis (--sample N)
+# ---------------------------------------------------------------------------
+SAMPLE_INTERVAL_SEC = 10.0  # Length of each sampled interval (trimmed to whole GOPs)
+SAMPLE_RANDOM = False       # Random instead of evenly spaced interval starts
+SAMPLE_SEED = 0             # RNG seed for random interval starts
+
+# ---------------------------------------------------------------------------
+# Task 1: Streaming analysis (--stream)
+# ---------------------------------------------------------------------------
+STREAM_MAX_BINS = 2000      # Bitrate-timeline windows kept; neighbours merge when full
+STREAM_PATTERN_MAX = 300    # Longest GOP pattern string kept for the report
+STREAM_EXACT_VALUES = 1000  # Sizes per frame type kept exactly before quartiles go P-square
+
+# ---------------------------------------------------------------------------
+# Task 1: Live MPEG-TS analysis (--live SOURCE)
+# ---------------------------------------------------------------------------
+LIVE_WINDOWS_SEC = (1.0, 10.0, 60.0)  # Sliding windows reported in every JSON line
+LIVE_EMIT_SEC = 0.5         # Media time between JSON lines (sub-second updates)
+LIVE_UDP_TIMEOUT_SEC = 30.0 # Give up when a UDP feed stays silent this long
+
+# ---------------------------------------------------------------------------
+# Task 2: MV overlay rendering
+# ---------------------------------------------------------------------------
+MV_SEGMENT_PARALLEL = False  # Split at keyframes and encode segments concurrently
+MV_SEGMENT_WORKERS = None    # Parallel segment encodes; None = one per CPU core
+PREVIEW_HEIGHT = 360         # Proxy overlay height in pixels (0 = keep original)
+PREVIEW_PRESET = "ultrafast" # Proxy encodes trade size for speed
+PREVIEW_BFRAMES = 3          # ultrafast disables B-frames; keep them for the B-frame sample
+PREVIEW_CRF = 28             # Proxy quality — good enough to eyeball arrows
+THUMB_INTERVAL_SEC = 10.0    # Keyframe thumbnail spacing (every keyframe if GOPs are longer)
+THUMB_WIDTH = 160            # Thumbnail width in pixels (height keeps aspect ratio)
+THUMB_COLUMNS = 10           # Contact sheet grid: thumbnails per row ...
+THUMB_ROWS = 10              # ... and rows per sheet
+
+# ---------------------------------------------------------------------------
+# Task 2: Sample frame selection
+# ---------------------------------------------------------------------------
+MOTION_SELECT_MODE = "mv"   # "mv" = rank by real MV magnitude, "pkt_size" = heuristic
+MOTION_RANK_K = 3           # High/low-motion frames kept in the bounded ranking heaps
+GM_ITERATIONS = 3           # Outlier-rejection refits for global (camera) motion
+GM_INLIER_PX = 1.0          # Min residual (px) still counted as camera motion
+FRAME_CACHE_BYTES = 256 * 1024 * 1024  # Extracted-frame cache budget, LRU-evicted (0 = off)
 
 # ---------------------------------------------------------------------------
 # Task 3: Rectangle overlay parameters
@@ -51,6 +101,24 @@ ROTATION_PERIOD = 5.0   # Seconds for one full 360-degree rotation
 VELOCITY_X = 5          # Horizontal speed in pixels per frame
 VELOCITY_Y = 3          # Vertical speed in pixels per frame
 RECT_COLOR = (0, 0, 255)  # BGR red — high contrast on most backgrounds
+OVERLAY_ENGINE = "opencv"  # "opencv" = Python frame loop; "ffmpeg" = one filtergraph
+OVERLAY_BLEND = "roi"   # "roi" = cached sprite, bounding box only; "full" = whole-frame blend;
+                        # "yuv" = sprite blended into native YUV420 planes (no BGR conversion)
+SPRITE_ANGLE_STEP = 0.5 # Degrees between cached pre-rotated sprites
+SPRITE_CACHE_SIZE = 360 # Max sprites kept (~50 KB each at 200x100)
+RENDER_WORKERS = 2      # Compositor threads in the render pipeline (0 = single loop)
+RENDER_QUEUE_SIZE = 8   # Frames per pipeline queue — bounds memory via backpressure
+RENDER_SEGMENT_PARALLEL = False  # Render keyframe-aligned segments in a process pool
+RENDER_SEGMENT_WORKERS = None    # Segment processes (None = all CPU cores)
+RENDER_CHECKPOINT = False        # Commit segments to disk so a crashed render can resume
+CHECKPOINT_SEGMENT_SEC = 10.0    # Approximate length of one checkpointed segment
+SCENE_SEED = 0          # RNG seed for --scene-objects random stress scenes
+SCENE_SPRITE_CACHE = 1024  # Cached (object, angle) sprites in scene renders (~80 KB per 150 px box)
+COMPARE_PER_FRAME = False # Per-frame PSNR/SSIM + sizes (frame_comparison.csv); decodes both files again
+SWEEP_CRFS = (18, 23, 28)  # CRF values of the --sweep encode grid
+SWEEP_PRESETS = ("veryfast", "medium", "slow")  # x264 presets of the --sweep grid
+SWEEP_MAX_FRAMES = 600  # Frames composited for the sweep (bounds the raw cache; None = all)
+SWEEP_WORKERS = None    # Parallel sweep encodes (None = all CPU cores)
 
 # ---------------------------------------------------------------------------
 # Visualization / graph styling
@@ -0,0 +1,91 @@
+"""
+Capture libx264's own per-frame statistics during a re-encode.
+
+libx264 can write a first-pass stats log with one line per frame::
+
+    in:2 out:1 type:P dur:2 cpbdur:2 q:23.26 aq:15.72 tex:42298 mv:3850 misc:524 ...
+
+Asking for it costs nothing extra (``-fastfirstpass 0`` keeps the
+encode bit-identical to a normal CRF run) and tells us the frame type,
+QP and bits of every frame — so nothing has to re-probe the output.
+
+The parsed table is stored as a ``<video>.x264stats.csv`` sidecar next to
+the encoded file, the same way Task 1 keeps ``frame_statistics.csv``.
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger("encoder_stats")
+
+_LINE = re.compile(
+    r"in:(\d+) out:(\d+) type:(\w).*?q:([\d.]+).*?tex:(\d+) mv:(\d+) misc:(\d+)"
+)
+_COLUMNS = ["frame_number", "coded_number", "pict_type", "qp",
+            "tex_bits", "mv_bits", "misc_bits"]
+
+
+def x264_stats_args(prefix: Path) -> list[str]:
+    """FFmpeg output options that make libx264 log per-frame stats to *prefix*."""
+    return ["-pass", "1", "-passlogfile", str(prefix), "-fastfirstpass", "0"]
+
+
+def parse_x264_stats(prefix: Path, frame_offset: int = 0) -> pd.DataFrame:
+    """
+    Parse the stats log written via :func:`x264_stats_args`, then delete it.
+
+    Args:
+        prefix: The ``-passlogfile`` prefix used for the encode.
+        frame_offset: Added to frame numbers (for segment encodes).
+
+    Returns:
+        DataFrame in display order with columns frame_number, coded_number,
+        pict_type (I/P/B), idr, is_ref, qp, tex_bits, mv_bits, misc_bits,
+        size_bytes.
+    """
+    log_path = Path(f"{prefix}-0.log")
+    rows = []
+    for line in log_path.read_text(encoding="utf-8").splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append(m.groups())
+    for leftover in (log_path, Path(f"{log_path}.mbtree")):
+        leftover.unlink(missing_ok=True)
+
+    df = pd.DataFrame(rows, columns=_COLUMNS)
+    for col in _COLUMNS:
+        if col != "pict_type":
+            df[col] = pd.to_numeric(df[col])
+    df["frame_number"] += frame_offset
+    # x264 types: I = IDR, i = non-IDR I, B = reference B, b = non-reference B
+    x264_type = df["pict_type"]
+    df["pict_type"] = x264_type.str.upper()
+    df.insert(3, "idr", x264_type == "I")
+    df.insert(4, "is_ref", x264_type != "b")
+    df["size_bytes"] = (df["tex_bits"] + df["mv_bits"] + df["misc_bits"]) / 8
+    return df.sort_values("frame_number").reset_index(drop=True)
+
+
+def stats_sidecar(video_path: Path) -> Path:
+    """Path of the encoder-stats CSV that belongs to *video_path*."""
+    return video_path.with_suffix(".x264stats.csv")
+
+
+def save_encoder_stats(df: pd.DataFrame, video_path: Path) -> Path:
+    """Write *df* as the sidecar CSV of *video_path*."""
+    path = stats_sidecar(video_path)
+    df.to_csv(path, index=False)
+    logger.info("Saved %s (%d frames)", path.name, len(df))
+    return path
+
+
+def load_encoder_stats(video_path: Path) -> Optional[pd.DataFrame]:
+    """Return the sidecar stats of *video_path* if they are up to date."""
+    path = stats_sidecar(video_path)
+    if not path.exists() or path.stat().st_mtime < video_path.stat().st_mtime:
+        return None
+    return pd.read_csv(path)
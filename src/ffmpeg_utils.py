@@ -1,17 +1,19 @@
 """
 Thin wrappers around FFmpeg and FFprobe subprocess calls.
 
-Every function uses ``subprocess.run()`` with **list** arguments
-(never ``shell=True``) to prevent command-injection vulnerabilities.
+Every function uses ``subprocess.run()`` with **list** arguments (never
+``shell=True``) to prevent command-injection vulnerabilities. Per-frame
+listings live in ``src.ffprobe_frames``.
 """
 
 import json
 import logging
 import subprocess
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from src.config import FFMPEG_DIR
+from src.utils.thread_budget import claim, ffmpeg_thread_args
 
 logger = logging.getLogger("ffmpeg_utils")
 
@@ -48,20 +50,23 @@ def run_ffprobe_json(input_path: Path) -> dict[str, Any]:
     return json.loads(result.stdout)
 
 
-def run_ffprobe_frames(input_path: Path) -> str:
+def run_ffprobe_packets(
+    input_path: Path, entries: str = "pts_time,size,flags", stream: Optional[str] = "v:0"
+) -> str:
     """
-    Extract per-frame data (picture type, size, timestamps) as CSV text.
+    List packets (no decoding — only a demux pass) as ``key=value`` lines.
 
-    Returns raw CSV lines — one row per frame — with columns:
-    ``key_frame, pict_type, pts_time, pkt_size, coded_picture_number``.
+    Each line looks like ``pts_time=0.041667|size=1234|flags=K__``; keys
+    are spelled out because ffprobe does not honour the order of
+    *entries* in its output. Packets arrive in decode order; with
+    *stream* ``None``, every stream's packets arrive in file order.
     """
     cmd = [
         _bin("ffprobe"),
         "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries",
-        "frame=key_frame,pict_type,pts_time,pkt_size,coded_picture_number",
-        "-of", "csv=p=0",
+        *(["-select_streams", stream] if stream else []),
+        "-show_entries", f"packet={entries}",
+        "-of", "compact=p=0:nk=0",
         str(input_path),
     ]
     logger.info("Running: %s", " ".join(cmd))
@@ -69,6 +74,15 @@ def run_ffprobe_frames(input_path: Path) -> str:
     return result.stdout
 
 
+def parse_compact(text: str) -> list[dict[str, str]]:
+    """Parse ``key=value|key=value`` lines from :func:`run_ffprobe_packets`."""
+    rows = []
+    for line in text.splitlines():
+        if line.strip():
+            rows.append(dict(kv.split("=", 1) for kv in line.strip().split("|")))
+    return rows
+
+
 # ---------------------------------------------------------------------------
 # FFmpeg execution
 # ---------------------------------------------------------------------------
@@ -78,6 +92,8 @@ def run_ffmpeg(args: list[str], timeout: int = 300) -> subprocess.CompletedProce
     Execute an FFmpeg command given as a list of arguments.
 
     The first element should be the ffmpeg binary or it will be prepended.
+    Unless the command sets ``-threads`` itself, the process gets its share
+    of the CPU budget (see ``src.utils.thread_budget``) for as long as it runs.
 
     Args:
         args: Full argument list, e.g. ["-i", "in.mp4", "-c:v", ...].
@@ -94,13 +110,15 @@ def run_ffmpeg(args: list[str], timeout: int = 300) -> subprocess.CompletedProce
     elif not Path(args[0]).is_absolute():
         args[0] = _bin("ffmpeg")
 
-    logger.info("Running: %s", " ".join(args))
-    result = subprocess.run(
-        args,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-    )
+    with claim() as threads:
+        args = ffmpeg_thread_args(args, threads)
+        logger.info("Running: %s", " ".join(args))
+        result = subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
     if result.returncode != 0:
         logger.error("FFmpeg stderr: %s", result.stderr[-500:])
         raise subprocess.CalledProcessError(
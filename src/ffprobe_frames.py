@@ -0,0 +1,69 @@
+"""
+Per-frame ffprobe listings of the first video stream, as CSV.
+
+Unlike the packet listing in ``ffmpeg_utils``, these decode the video
+to report each frame's picture type. ``run_ffprobe_frames`` returns the
+whole listing (optionally only some ``read_intervals``);
+``iter_ffprobe_frames`` streams it line by line through a ``Popen`` pipe
+so arbitrarily long inputs are analysed in constant memory. Arguments
+are always passed as a list (never ``shell=True``).
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import Iterator, Optional
+
+from src.ffmpeg_utils import _bin
+
+logger = logging.getLogger("ffprobe_frames")
+
+
+def run_ffprobe_frames(input_path: Path, read_intervals: Optional[str] = None,
+                       threads: Optional[int] = None) -> str:
+    """
+    Extract per-frame data (picture type, size, timestamps) as CSV text.
+
+    Returns raw CSV lines — one row per frame — with columns:
+    ``key_frame, pict_type, pts_time, pkt_size, coded_picture_number``.
+    With *read_intervals* (e.g. ``"120%+10"``) only those parts are decoded;
+    *threads* caps the decoder's threads (default: FFmpeg's own choice).
+    """
+    cmd = _frames_cmd(input_path, read_intervals, threads)
+    logger.info("Running: %s", " ".join(cmd))
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def iter_ffprobe_frames(input_path: Path) -> Iterator[str]:
+    """Yield :func:`run_ffprobe_frames` CSV lines as ffprobe emits them (constant memory)."""
+    cmd = _frames_cmd(input_path, None)
+    logger.info("Running: %s", " ".join(cmd))
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        for line in proc.stdout:
+            if line.strip():
+                yield line
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()   # consumer stopped early
+        returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _frames_cmd(input_path: Path, read_intervals: Optional[str],
+                threads: Optional[int] = None) -> list[str]:
+    """ffprobe command listing per-frame data of the first video stream as CSV."""
+    return [
+        _bin("ffprobe"),
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries",
+        "frame=key_frame,pict_type,pts_time,pkt_size,coded_picture_number",
+        "-of", "csv=p=0",
+        *(["-read_intervals", read_intervals] if read_intervals else []),
+        *(["-threads", str(threads)] if threads else []),
+        str(input_path),
+    ]
@@ -0,0 +1,119 @@
+"""
+Stream raw frames straight into a single FFmpeg libx264 encode.
+
+Instead of writing an intermediate file with OpenCV's ``mp4v`` codec and
+re-encoding it afterwards, frames are piped as raw pixels into FFmpeg's
+stdin. FFmpeg encodes them once with libx264 and muxes the original
+audio in the same process — one encode, one generation, no temp file.
+
+Think of it like pouring water straight into the bottle instead of
+filling a jug first and then pouring the jug into the bottle.
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.config import CRF_VALUE, PRESET
+from src.ffmpeg_utils import _bin
+from src.utils.thread_budget import acquire, release
+
+logger = logging.getLogger("frame_sink")
+
+
+class FrameSink:
+    """Pipe raw uint8 frames (``bgr24`` or planar ``yuv420p``) into libx264."""
+
+    def __init__(
+        self,
+        output: Path,
+        width: int,
+        height: int,
+        fps: float,
+        audio_from: Optional[Path] = None,
+        pix_fmt: str = "bgr24",
+        extra_args: Optional[list[str]] = None,
+        crf: int = CRF_VALUE,
+        preset: str = PRESET,
+    ) -> None:
+        """
+        Start the encoder process.
+
+        Args:
+            output: Final video path.
+            width, height: Frame size in pixels.
+            fps: Frame rate of the piped frames.
+            audio_from: Copy audio from this file (if it has any).
+            pix_fmt: Raw input layout — ``bgr24`` matches OpenCV frames;
+                ``yuv420p`` is encoded with no colour conversion at all.
+            extra_args: Additional output options (e.g. encoder stats).
+                Without ``-threads`` here, libx264 gets this job's share
+                of the CPU budget.
+            crf, preset: libx264 rate control and speed preset.
+        """
+        self.output = output
+        self._threads = acquire()
+        if "-threads" not in (extra_args or []):
+            extra_args = [*(extra_args or []), "-threads", str(self._threads)]
+        cmd = [
+            _bin("ffmpeg"), "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", pix_fmt,
+            "-s", f"{width}x{height}", "-framerate", f"{fps:.6f}",
+            "-i", "pipe:0",
+        ]
+        if audio_from is not None:
+            cmd += ["-i", str(audio_from), "-map", "0:v:0", "-map", "1:a?",
+                    "-c:a", "copy", "-shortest"]
+        cmd += [
+            "-c:v", "libx264", "-crf", str(crf), "-preset", preset,
+            "-pix_fmt", "yuv420p",
+            *(extra_args or []),
+            str(output),
+        ]
+        logger.info("Running: %s", " ".join(cmd))
+        self._cmd = cmd
+        try:
+            self._proc = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except BaseException:
+            self._release()                # no process: give the slot back
+            raise
+        self.frames_written = 0
+
+    def write(self, frame: np.ndarray) -> None:
+        """Send one frame (must be C-contiguous uint8)."""
+        self._proc.stdin.write(np.ascontiguousarray(frame).data)
+        self.frames_written += 1
+
+    def close(self, timeout: int = 600) -> None:
+        """Finish the encode; raise ``CalledProcessError`` if FFmpeg failed."""
+        self._proc.stdin.close()
+        stderr = self._proc.stderr.read().decode(errors="replace")
+        returncode = self._proc.wait(timeout=timeout)
+        self._release()
+        if returncode != 0:
+            logger.error("FFmpeg stderr: %s", stderr[-500:])
+            raise subprocess.CalledProcessError(returncode, self._cmd, None, stderr)
+        logger.info("Encoded %d frames into %s", self.frames_written, self.output.name)
+
+    def __enter__(self) -> "FrameSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._proc.kill()
+            self._proc.wait()
+            self._release()
+
+    def _release(self) -> None:
+        """Return this encode's CPU share (once)."""
+        if self._threads:
+            release()
+            self._threads = 0
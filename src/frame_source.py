@@ -0,0 +1,150 @@
+"""
+Read decoded frames from an FFmpeg pipe into a preallocated buffer ring.
+
+``cv2.VideoCapture.read()`` allocates a fresh array for every frame and
+trusts the container's frame count, which is often wrong for VFR or
+edited files. This reader instead:
+
+- decodes with FFmpeg to raw pixels on stdout (``-fps_mode passthrough``,
+  so every decoded frame arrives exactly once — no duplicates or drops);
+- ``readinto()``s each frame into one of N preallocated numpy buffers;
+- reads the exact PTS and picture type of each frame from ``showinfo``.
+
+Think of it like a conveyor belt with a fixed number of trays: the trays
+are reused in rotation instead of building a new tray for every item.
+"""
+
+import logging
+import queue
+import re
+import subprocess
+import threading
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from src.config import FRAME_RING_SIZE
+from src.ffmpeg_utils import _bin, run_ffprobe_json
+from src.utils.thread_budget import acquire, release
+from src.yuv_layout import frame_shape
+
+logger = logging.getLogger("frame_source")
+
+_SHOWINFO = re.compile(r"pts_time:(\S+).*?type:(\S)")
+
+
+class Frame(NamedTuple):
+    """One decoded frame. ``image`` is a ring buffer — copy it to keep it."""
+
+    frame_number: int
+    pts_time: float
+    pict_type: str
+    image: np.ndarray
+
+
+class FrameSource:
+    """Iterate over decoded frames of *path* with exact timestamps."""
+
+    def __init__(self, path: Path, ring_size: int = FRAME_RING_SIZE,
+                 pix_fmt: str = "bgr24", input_args: Optional[list[str]] = None,
+                 max_frames: Optional[int] = None, start_frame: int = 0) -> None:
+        """
+        Probe the video geometry and allocate the buffer ring.
+
+        Args:
+            path: Video file to decode.
+            ring_size: Number of reusable frame buffers. A yielded frame's
+                buffer is overwritten *ring_size* frames later.
+            pix_fmt: Raw output layout — ``bgr24`` matches OpenCV,
+                ``yuv420p`` is the decoder's native planar layout.
+            input_args: Extra input options, e.g. a keyframe seek.
+            max_frames: Stop after this many frames (``-frames:v``).
+            start_frame: Frame number of the first decoded frame.
+        """
+        self.path = path
+        self.pix_fmt = pix_fmt
+        self.input_args = input_args or []
+        self.max_frames = max_frames
+        self.start_frame = start_frame
+        probe = run_ffprobe_json(path)
+        video = next(s for s in probe["streams"] if s.get("codec_type") == "video")
+        # FFmpeg shifts output timestamps by this unless -copyts is given
+        self.start_time = float(probe.get("format", {}).get("start_time") or 0.0)
+        self.width = int(video["width"])
+        self.height = int(video["height"])
+        num, den = (int(x) for x in video.get("r_frame_rate", "30/1").split("/"))
+        self.fps = num / den if den else 30.0
+
+        self.resize_ring(ring_size)
+        self.frames_read = 0
+
+    def resize_ring(self, ring_size: int) -> None:
+        """(Re)allocate the buffer ring — call before iterating."""
+        shape = frame_shape(self.pix_fmt, self.width, self.height)
+        self._ring = [np.empty(shape, dtype=np.uint8) for _ in range(max(ring_size, 1))]
+
+    def __iter__(self) -> Iterator[Frame]:
+        threads = str(acquire())           # decoder share of the CPU budget
+        cmd = [
+            _bin("ffmpeg"), "-hide_banner", "-nostats", "-loglevel", "info",
+            "-filter_threads", threads, "-threads", threads,
+            *self.input_args,
+            "-i", str(self.path),
+            "-map", "0:v:0",
+            *(["-frames:v", str(self.max_frames)] if self.max_frames else []),
+            "-vf", "showinfo=checksum=0",
+            "-fps_mode", "passthrough",
+            "-f", "rawvideo", "-pix_fmt", self.pix_fmt,
+            "pipe:1",
+        ]
+        logger.info("Running: %s", " ".join(cmd))
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except BaseException:
+            release()                      # no process: give the slot back
+            raise
+        infos: queue.Queue = queue.Queue()
+        reader = threading.Thread(target=_parse_showinfo, args=(proc.stderr, infos), daemon=True)
+        reader.start()
+        self.frames_read = 0
+        try:
+            while True:
+                buf = self._ring[self.frames_read % len(self._ring)]
+                if not _read_exact(proc.stdout, memoryview(buf).cast("B")):
+                    break
+                pts, ptype = infos.get(timeout=60)
+                yield Frame(self.start_frame + self.frames_read, pts, ptype, buf)
+                self.frames_read += 1
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()   # consumer stopped early
+            returncode = proc.wait()
+            reader.join(timeout=5)
+            release()
+
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+        logger.info("Decoded %d frames from %s", self.frames_read, self.path.name)
+
+
+def _read_exact(stream, view: memoryview) -> bool:
+    """Fill *view* completely from *stream*; False on clean end of stream."""
+    got = 0
+    while got < len(view):
+        n = stream.readinto(view[got:])
+        if not n:
+            return False
+        got += n
+    return True
+
+
+def _parse_showinfo(stderr, out: queue.Queue) -> None:
+    """Background thread: push ``(pts_time, pict_type)`` for every showinfo line."""
+    for raw in iter(stderr.readline, b""):
+        m = _SHOWINFO.search(raw.decode(errors="replace"))
+        if m:
+            pts = m.group(1)
+            out.put((float(pts) if pts != "NOPTS" else float("nan"), m.group(2)))
+    stderr.close()
@@ -12,37 +12,72 @@ from pathlib import Path
 from .metadata_extractor import extract_metadata
 from .frame_statistics import extract_frame_data
 from .gop_analyzer import analyze_gop
-from .visualizer import generate_task1_graphs
+from .visualizer import generate_task1_graphs, generate_streaming_graphs
 from .report_generator import generate_report
+from .sampled_analysis import analyze_sampled
+from .streaming_analysis import analyze_streaming
+from .live_analysis import analyze_live
+from .stream_analyzer import analyze_all_streams
 
 logger = logging.getLogger("task1")
 
 
-def run_task1(input_path: Path) -> None:
+def run_task1(input_path: Path, samples: int = 0, stream: bool = False) -> None:
     """
     Orchestrate all Task 1 steps end-to-end.
 
-    Pipeline: metadata -> frame stats -> GOP analysis -> graphs -> report.
+    Pipeline: metadata -> all-streams packets -> frame stats -> GOP analysis
+    -> graphs -> report.
+
+    With *samples* > 0, only metadata plus an approximate analysis of that
+    many sampled intervals is produced (see ``sampled_analysis``). With
+    *stream*, frames are never held in memory (see ``streaming_analysis``).
     """
     from src.config import TASK1_OUTPUT_DIR
 
     start = time.time()
     logger.info("=== Task 1 START ===")
 
-    print("  [1/5] Extracting metadata ...")
+    if samples > 0:
+        print("  [1/2] Extracting metadata ...")
+        extract_metadata(input_path, TASK1_OUTPUT_DIR)
+        print(f"  [2/2] Sampling {samples} intervals ...")
+        result = analyze_sampled(input_path, TASK1_OUTPUT_DIR, samples)
+        share = result["frame_type_share"]
+        print("  Frame types (share ± 95% CI): " + ", ".join(
+            f"{t} {v['mean']} ± {v['ci95']}" for t, v in share.items()))
+        logger.info("=== Task 1 (sampled) DONE in %.1f s ===", time.time() - start)
+        return
+
+    if stream:
+        print("  [1/4] Extracting metadata ...")
+        metadata = extract_metadata(input_path, TASK1_OUTPUT_DIR)
+        print("  [2/4] Streaming frame statistics ...")
+        stats = analyze_streaming(input_path, TASK1_OUTPUT_DIR)
+        print("  [3/4] Generating visualizations ...")
+        generate_streaming_graphs(stats, TASK1_OUTPUT_DIR)
+        print("  [4/4] Writing summary report ...")
+        generate_report(metadata, stats.gop_info(), None, TASK1_OUTPUT_DIR)
+        logger.info("=== Task 1 (streamed) DONE in %.1f s ===", time.time() - start)
+        return
+
+    print("  [1/6] Extracting metadata ...")
     metadata = extract_metadata(input_path, TASK1_OUTPUT_DIR)
 
-    print("  [2/5] Extracting frame statistics ...")
+    print("  [2/6] Analyzing all streams (one demux pass) ...")
+    streams = analyze_all_streams(input_path, TASK1_OUTPUT_DIR)
+
+    print("  [3/6] Extracting frame statistics ...")
     frame_df = extract_frame_data(input_path, TASK1_OUTPUT_DIR)
 
-    print("  [3/5] Analyzing GOP structure ...")
+    print("  [4/6] Analyzing GOP structure ...")
     gop_info = analyze_gop(frame_df, TASK1_OUTPUT_DIR)
 
-    print("  [4/5] Generating visualizations ...")
+    print("  [5/6] Generating visualizations ...")
     generate_task1_graphs(frame_df, TASK1_OUTPUT_DIR)
 
-    print("  [5/5] Writing summary report ...")
-    generate_report(metadata, gop_info, frame_df, TASK1_OUTPUT_DIR)
+    print("  [6/6] Writing summary report ...")
+    generate_report(metadata, gop_info, frame_df, TASK1_OUTPUT_DIR, streams)
 
     elapsed = time.time() - start
     logger.info("=== Task 1 DONE in %.1f s ===", elapsed)
@@ -11,7 +11,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from src.ffmpeg_utils import run_ffprobe_frames
+from src.ffprobe_frames import run_ffprobe_frames
 
 logger = logging.getLogger("task1.frames")
 
@@ -28,8 +28,17 @@ def extract_frame_data(input_path: Path, output_dir: Path) -> pd.DataFrame:
         DataFrame with columns:
         frame_number, pict_type, key_frame, pkt_size, pts_time.
     """
-    raw_csv = run_ffprobe_frames(input_path)
+    df = parse_frame_csv(run_ffprobe_frames(input_path))
 
+    csv_path = output_dir / "frame_statistics.csv"
+    df.to_csv(csv_path, index=False)
+    logger.info("Saved frame_statistics.csv (%d frames)", len(df))
+
+    return df
+
+
+def parse_frame_csv(raw_csv: str) -> pd.DataFrame:
+    """Turn ``run_ffprobe_frames`` output into the frame statistics table."""
     df = pd.read_csv(
         io.StringIO(raw_csv),
         header=None,
@@ -45,10 +54,4 @@ def extract_frame_data(input_path: Path, output_dir: Path) -> pd.DataFrame:
     df.insert(0, "frame_number", range(len(df)))
 
     # Reorder columns to match PRD specification
-    df = df[["frame_number", "pict_type", "key_frame", "pkt_size", "pts_time"]]
-
-    csv_path = output_dir / "frame_statistics.csv"
-    df.to_csv(csv_path, index=False)
-    logger.info("Saved frame_statistics.csv (%d frames)", len(df))
-
-    return df
+    return df[["frame_number", "pict_type", "key_frame", "pkt_size", "pts_time"]]
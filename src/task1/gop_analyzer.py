@@ -3,16 +3,21 @@ GOP (Group of Pictures) structure analysis.
 
 Detects the GOP pattern (e.g. IBBBPBBBP), calculates GOP length,
 determines if it is fixed or variable, and computes I-frame statistics.
+
+Both Task 1 pipelines use the same ``GopAccumulator``: the exact one
+feeds it the rows of the frame table, the streaming one feeds it each
+frame as ffprobe emits it.
 """
 
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-import numpy as np
 import pandas as pd
 
+from src.utils.online_stats import RunningStats
+
 logger = logging.getLogger("task1.gop")
 
 
@@ -25,51 +30,11 @@ def analyze_gop(
     Returns dict with pattern, lengths, I-frame stats, bitrate-per-type,
     and peak bitrate info. Also saves ``gop_analysis.json``.
     """
-    types = frame_df["pict_type"].values
-    sizes = frame_df["pkt_size"].values.astype(float)
-    times = frame_df["pts_time"].values.astype(float)
-
-    # --- frame type counts ---
-    counts = frame_df["pict_type"].value_counts().to_dict()
-    total = len(frame_df)
-
-    # --- detect GOP pattern ---
-    pattern, gop_lengths = _detect_gop(types)
-    gop_lengths_arr = np.array(gop_lengths) if gop_lengths else np.array([total])
-    is_fixed = bool(np.std(gop_lengths_arr) < 1.0) if len(gop_lengths_arr) > 1 else True
-
-    # --- I-frame statistics ---
-    i_sizes = sizes[types == "I"]
-    i_indices = np.where(types == "I")[0]
-    i_distances = np.diff(i_indices) if len(i_indices) > 1 else np.array([0])
-
-    fps = _estimate_fps(times, total)
-    i_stats = _iframe_stats(i_sizes, i_distances, fps)
-
-    # --- bitrate per frame type ---
-    bitrate_by_type = {
-        t: float(np.mean(sizes[types == t])) for t in ["I", "P", "B"] if (types == t).any()
-    }
-
-    # --- peak bitrate moment ---
-    peak_idx = int(np.argmax(sizes))
-    peak_info = {
-        "frame_number": peak_idx,
-        "timestamp_sec": round(float(times[peak_idx]), 3),
-        "size_bytes": int(sizes[peak_idx]),
-    }
-
-    result: dict[str, Any] = {
-        "gop_pattern": pattern,
-        "gop_lengths": gop_lengths,
-        "avg_gop_length": round(float(np.mean(gop_lengths_arr)), 1),
-        "is_fixed_gop": is_fixed,
-        "frame_counts": counts,
-        "total_frames": total,
-        "i_frame_stats": i_stats,
-        "avg_size_by_type_bytes": bitrate_by_type,
-        "peak_bitrate": peak_info,
-    }
+    acc = GopAccumulator(keep_lengths=True)
+    for ptype, size, pts in zip(frame_df["pict_type"], frame_df["pkt_size"].astype(float),
+                                frame_df["pts_time"].astype(float)):
+        acc.update(ptype, size, pts)
+    result = acc.result()
 
     (output_dir / "gop_analysis.json").write_text(
         json.dumps(result, indent=2), encoding="utf-8"
@@ -78,40 +43,93 @@ def analyze_gop(
     return result
 
 
-# --------------------------------------------------------------------------
-# Internal helpers
-# --------------------------------------------------------------------------
-
-def _detect_gop(types: np.ndarray) -> tuple[str, list[int]]:
-    """Return the first GOP pattern string and a list of all GOP lengths."""
-    i_positions = np.where(types == "I")[0]
-    if len(i_positions) < 2:
-        return "".join(types[:30]), [len(types)]
-
-    # First full GOP: from first I-frame to (but not including) second I-frame
-    first_gop = types[i_positions[0]: i_positions[1]]
-    pattern = "".join(first_gop)
-
-    lengths = [int(i_positions[i + 1] - i_positions[i]) for i in range(len(i_positions) - 1)]
-    return pattern, lengths
-
-
-def _estimate_fps(times: np.ndarray, total: int) -> float:
-    """Estimate FPS from PTS timestamps."""
-    duration = times[-1] - times[0] if len(times) > 1 else 1.0
-    return total / duration if duration > 0 else 30.0
-
-
-def _iframe_stats(sizes: np.ndarray, distances: np.ndarray, fps: float) -> dict:
-    """Compute aggregate I-frame statistics (count, avg/min/max/std size, interval)."""
-    if len(sizes) == 0:
-        return {}
-    return {
-        "count": int(len(sizes)),
-        "avg_size_bytes": round(float(np.mean(sizes)), 1),
-        "min_size_bytes": int(np.min(sizes)),
-        "max_size_bytes": int(np.max(sizes)),
-        "std_size_bytes": round(float(np.std(sizes)), 1),
-        "avg_distance_frames": round(float(np.mean(distances)), 1),
-        "avg_distance_sec": round(float(np.mean(distances)) / fps, 3) if fps else 0,
-    }
+class GopAccumulator:
+    """GOP structure and per-type sizes, updated one frame at a time."""
+
+    def __init__(self, keep_lengths: bool = False, pattern_max: Optional[int] = None) -> None:
+        """
+        Args:
+            keep_lengths: List every GOP length (``gop_lengths``) instead of
+                only their running statistics (``gop_length_stats``).
+            pattern_max: Longest GOP pattern string kept (None = no limit).
+        """
+        self.total = 0
+        self.counts: dict[str, int] = {}
+        self.sizes = {t: RunningStats() for t in "IPB"}
+        self.gop = RunningStats()
+        self.lengths: Optional[list[int]] = [] if keep_lengths else None
+        self.pattern_max = pattern_max
+        self.head = ""                     # first frame types (fallback pattern)
+        self.pattern = ""                  # first I-frame up to the second one
+        self.first_pts = self.last_pts = 0.0
+        self.peak = (-1.0, 0, 0.0)         # (size, frame number, pts)
+        self._i_first = self._i_last = -1
+
+    def update(self, pict_type: str, pkt_size: float, pts_time: float) -> None:
+        """Account for the next frame in decode-output order."""
+        n = self.total
+        self.total += 1
+        self.counts[pict_type] = self.counts.get(pict_type, 0) + 1
+        if pict_type in self.sizes:
+            self.sizes[pict_type].add(pkt_size)
+        if n == 0:
+            self.first_pts = pts_time
+        self.last_pts = pts_time
+        if pkt_size > self.peak[0]:
+            self.peak = (pkt_size, n, pts_time)
+        if n < 30:
+            self.head += pict_type
+
+        if pict_type == "I":
+            if self._i_first < 0:
+                self._i_first = n
+            else:
+                self.gop.add(n - self._i_last)
+                if self.lengths is not None:
+                    self.lengths.append(n - self._i_last)
+            self._i_last = n
+        if self._i_first >= 0 and self.gop.count == 0 and (
+                self.pattern_max is None or len(self.pattern) < self.pattern_max):
+            self.pattern += pict_type
+
+    def result(self) -> dict[str, Any]:
+        """The ``gop_analysis.json`` dict."""
+        multi = self.gop.count > 0
+        duration = self.last_pts - self.first_pts if self.total > 1 else 1.0
+        fps = self.total / duration if duration > 0 else 30.0
+        i_sizes = self.sizes["I"]
+        distance = (self._i_last - self._i_first) / self.gop.count if multi else 0.0
+
+        result: dict[str, Any] = {"gop_pattern": self.pattern if multi else self.head}
+        if self.lengths is not None:
+            result["gop_lengths"] = self.lengths if multi else [self.total]
+        else:
+            result["gop_length_stats"] = {
+                "count": self.gop.count if multi else 1,
+                "min": int(self.gop.min) if multi else self.total,
+                "max": int(self.gop.max) if multi else self.total,
+                "std": round(self.gop.std, 2),
+            }
+        result.update({
+            "avg_gop_length": round(self.gop.mean if multi else float(self.total), 1),
+            "is_fixed_gop": bool(self.gop.std < 1.0) if self.gop.count > 1 else True,
+            "frame_counts": dict(sorted(self.counts.items(), key=lambda kv: -kv[1])),
+            "total_frames": self.total,
+            "i_frame_stats": {} if not i_sizes.count else {
+                "count": i_sizes.count,
+                "avg_size_bytes": round(i_sizes.mean, 1),
+                "min_size_bytes": int(i_sizes.min),
+                "max_size_bytes": int(i_sizes.max),
+                "std_size_bytes": round(i_sizes.std, 1),
+                "avg_distance_frames": round(distance, 1),
+                "avg_distance_sec": round(distance / fps, 3) if fps else 0,
+            },
+            "avg_size_by_type_bytes": {t: round(s.mean, 1)
+                                       for t, s in self.sizes.items() if s.count},
+            "peak_bitrate": {
+                "frame_number": self.peak[1],
+                "timestamp_sec": round(self.peak[2], 3),
+                "size_bytes": int(self.peak[0]),
+            },
+        })
+        return result
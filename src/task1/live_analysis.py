@@ -0,0 +1,138 @@
+"""
+Live MPEG-TS analysis over a pipe, FIFO or localhost UDP socket.
+
+A contribution feed never ends, so there is no file to probe. PyAV
+demuxes the transport stream as it arrives and decodes only the first
+video stream (for picture types). Every packet and frame goes into
+deques that hold at most the longest of ``LIVE_WINDOWS_SEC``. Each time
+media time advances by ``LIVE_EMIT_SEC``, one JSON line with the rolling
+statistics of every window is appended to ``live_stats.jsonl`` and
+flushed, so ``tail -f`` or a log shipper sees it at once.
+
+Memory is bounded by the longest window, and a packet reaches the
+statistics as soon as it is demuxed. PTS discontinuities are unwrapped
+with an offset, so media time stays continuous: any step back further
+than B-frame reordering explains (a splice, or the 33-bit PTS wrap after
+about 26.5 h) and any jump forward by more than the longest window
+(which is what the demuxer may turn that wrap into). Frame threading is
+left off so the decoder adds no extra frames of delay.
+"""
+
+import json
+import logging
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from src.config import LIVE_WINDOWS_SEC, LIVE_EMIT_SEC, LIVE_UDP_TIMEOUT_SEC
+
+logger = logging.getLogger("task1.live")
+
+
+def analyze_live(source: str, output_dir: Path) -> int:
+    """
+    Analyse *source* (``-``, a FIFO path or ``udp://127.0.0.1:PORT``) until it ends.
+
+    Stops cleanly on end of stream, a silent UDP feed or Ctrl+C.
+
+    Returns:
+        Number of JSON lines written to ``output_dir/live_stats.jsonl``.
+    """
+    import av
+
+    horizon = max(LIVE_WINDOWS_SEC)
+    packets: deque = deque()       # (t, size, is_key)
+    frames: deque = deque()        # (t, pict_type)
+    gops: deque = deque()          # (t, length) of completed GOPs
+    gop_len, first, next_emit, lines = -1, None, None, 0
+    offset, last_t = 0.0, None     # unwraps PTS discontinuities
+
+    out_path = output_dir / "live_stats.jsonl"
+    with _open_source(av, source) as container, open(out_path, "a", encoding="utf-8") as out:
+        stream = container.streams.video[0]
+        rate = stream.guessed_rate or stream.average_rate
+        # Decode order steps back a few frames for B-frames; further back is a splice
+        max_back = max(LIVE_EMIT_SEC, 8 / float(rate)) if rate else LIVE_EMIT_SEC
+        logger.info("Live analysis of %s -> %s", source, out_path.name)
+        try:
+            for packet in container.demux(stream):
+                if packet.size == 0 or (packet.pts is None and packet.dts is None):
+                    continue                            # flush packet
+                t = float((packet.pts if packet.pts is not None else packet.dts)
+                          * packet.time_base) + offset
+                if last_t is not None and (t - last_t > horizon or last_t - t > max_back):
+                    logger.warning("PTS jumped %+.1f s; unwrapping", t - last_t)
+                    offset += last_t - t
+                    t = last_t
+                last_t = t if last_t is None else max(last_t, t)
+                if packet.is_keyframe:
+                    if gop_len > 0:
+                        gops.append((t, gop_len))
+                    gop_len = 0
+                if gop_len >= 0:
+                    gop_len += 1
+                packets.append((t, packet.size, packet.is_keyframe))
+                for frame in packet.decode():
+                    ptype = getattr(frame.pict_type, "name", str(frame.pict_type))
+                    ft = float(frame.time) + offset if frame.time else t
+                    frames.append((ft if abs(ft - t) <= horizon else t, ptype))
+
+                for q in (packets, frames, gops):       # bound memory by the longest window
+                    while q and q[0][0] < t - horizon:
+                        q.popleft()
+                if first is None:
+                    first, next_emit = t, t + LIVE_EMIT_SEC
+                if t >= next_emit:
+                    snap = _snapshot(t, t - first, packets, frames, gops, gop_len)
+                    out.write(json.dumps(snap) + "\n")
+                    out.flush()
+                    lines += 1
+                    next_emit = t + LIVE_EMIT_SEC
+        except KeyboardInterrupt:
+            logger.info("Live analysis stopped by user")
+        except av.error.ExitError:
+            logger.info("No data for %.0f s; live source ended", LIVE_UDP_TIMEOUT_SEC)
+    logger.info("Wrote %d live stats lines", lines)
+    return lines
+
+
+def _open_source(av: Any, source: str) -> Any:
+    """Open stdin, a FIFO/file or a localhost UDP socket as an MPEG-TS container."""
+    if source == "-":
+        return av.open(sys.stdin.buffer, format="mpegts")
+    if source.startswith("udp://"):
+        return av.open(source, format="mpegts", timeout=LIVE_UDP_TIMEOUT_SEC,
+                       options={"overrun_nonfatal": "1", "fifo_size": "1000000"})
+    return av.open(source, format="mpegts")
+
+
+def _snapshot(now: float, elapsed: float, packets: deque, frames: deque, gops: deque,
+              gop_len: int) -> dict[str, Any]:
+    """Rolling statistics of every window ending at media time *now*."""
+    windows = {}
+    for span in LIVE_WINDOWS_SEC:
+        start = now - span
+        seen = min(span, max(elapsed, LIVE_EMIT_SEC))   # young feeds fill part of a window
+        sizes = [s for t, s, _ in packets if t > start]
+        keys = sum(1 for t, _, k in packets if t > start and k)
+        types: dict[str, int] = {}
+        for t, p in frames:
+            if t > start:
+                types[p] = types.get(p, 0) + 1
+        lengths = [n for t, n in gops if t > start]
+        windows[f"{span:g}s"] = {
+            "frames": len(sizes),
+            "bitrate_kbps": round(sum(sizes) * 8 / seen / 1000, 1),
+            "max_packet_bytes": max(sizes, default=0),
+            "frame_types": types,
+            "keyframes": keys,
+            "avg_gop_length": round(sum(lengths) / len(lengths), 1) if lengths else None,
+        }
+    return {
+        "media_time_sec": round(now, 3),
+        "wall_time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "current_gop_length": max(gop_len, 0),
+        "windows": windows,
+    }
@@ -18,16 +18,24 @@ logger = logging.getLogger("task1.report")
 def generate_report(
     metadata: dict[str, Any],
     gop_info: dict[str, Any],
-    frame_df: pd.DataFrame,
+    frame_df: pd.DataFrame | None,
     output_dir: Path,
+    streams: dict[str, Any] | None = None,
 ) -> None:
-    """Write ``summary_report.txt`` to *output_dir*."""
+    """
+    Write ``summary_report.txt`` to *output_dir*.
+
+    *frame_df* is None when streamed; *streams* is the optional
+    ``analyze_all_streams`` result.
+    """
     lines: list[str] = []
     _header(lines)
     _video_props(lines, metadata)
     _gop_section(lines, gop_info)
     _frame_counts(lines, gop_info)
     _iframe_stats(lines, gop_info)
+    if streams:
+        _streams_section(lines, streams)
     _key_findings(lines, metadata, gop_info, frame_df)
 
     report_path = output_dir / "summary_report.txt"
@@ -102,7 +110,21 @@ def _iframe_stats(lines: list[str], gop: dict) -> None:
     lines.append("")
 
 
-def _key_findings(lines: list[str], meta: dict, gop: dict, df: pd.DataFrame) -> None:
+def _streams_section(lines: list[str], streams: dict) -> None:
+    """Append one line per stream plus its A/V offsets against the video."""
+    lines.append("--- All Streams ---")
+    for st in streams.get("streams", []):
+        lines.append(f"  #{st['index']} {st['codec_type']:<6} {st['codec_name'] or '?':<6} "
+                     f"{st['bitrate_kbps']:>8.1f} kbps  {st['packets']:>7} packets")
+        sync = st.get("vs_video")
+        if sync:
+            lines.append(f"      vs video: start {sync['start_offset_ms']:+.1f} ms, "
+                         f"end {sync['end_offset_ms']:+.1f} ms, "
+                         f"max interleave {sync['interleave_ahead_max_ms']:.0f} ms")
+    lines.append("")
+
+
+def _key_findings(lines: list[str], meta: dict, gop: dict, df: pd.DataFrame | None) -> None:
     """Derive and append plain-English observations from the analysis data."""
     lines.append("--- Key Findings ---")
     sizes = gop.get("avg_size_by_type_bytes", {})
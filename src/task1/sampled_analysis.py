@@ -0,0 +1,117 @@
+"""
+Approximate Task 1 statistics from a few sampled intervals.
+
+For triage across a large archive, exact per-frame statistics are not
+needed. Instead of decoding the whole file, ffprobe reads only N
+intervals (``-read_intervals``), either evenly spaced or random. Each
+interval starts at the keyframe the seek lands on and is trimmed to
+whole GOPs, so every sample is made of complete GOPs.
+
+Each interval is one observation of the frame-type mix, the mean size
+of each type, the bitrate and the GOP length. Their spread gives 95%
+confidence intervals, and the type mix is extrapolated to the whole
+file from the container duration. The cost depends on the number and
+length of the samples, not on the file's length.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.config import SAMPLE_INTERVAL_SEC, SAMPLE_RANDOM, SAMPLE_SEED
+from src.ffmpeg_utils import run_ffprobe_json
+from src.ffprobe_frames import run_ffprobe_frames
+from src.utils.confidence import mean_interval
+from src.utils.thread_budget import claim, cpu_budget, reserve
+from .frame_statistics import parse_frame_csv
+
+logger = logging.getLogger("task1.sampled")
+
+
+def analyze_sampled(input_path: Path, output_dir: Path, samples: int,
+                    random: bool = SAMPLE_RANDOM,
+                    interval_sec: float = SAMPLE_INTERVAL_SEC) -> dict[str, Any]:
+    """
+    Estimate frame statistics from *samples* GOP-aligned intervals.
+
+    Saves ``sampled_analysis.json`` and returns the same dict: estimates
+    as ``{"mean", "ci95"}`` pairs plus extrapolated frame counts.
+    """
+    raw = run_ffprobe_json(input_path)
+    duration = float(raw.get("format", {}).get("duration", 0))
+    video = next((s for s in raw.get("streams", []) if s.get("codec_type") == "video"), {})
+    rate = video.get("avg_frame_rate", "0/0")
+    if rate == "0/0":
+        rate = video.get("r_frame_rate", "30/1")
+    num, den = (int(x) for x in rate.split("/"))
+    fps = num / den if den else 30.0
+
+    span = max(duration - interval_sec, 0.0)
+    if random:
+        starts = np.sort(np.random.default_rng(SAMPLE_SEED).uniform(0, span, samples))
+    else:
+        starts = np.linspace(0, span, samples) if samples > 1 else np.array([span / 2])
+    intervals = [f"{s:.3f}%+{interval_sec}" for s in starts]
+
+    def probe(interval: str) -> pd.DataFrame:
+        with claim() as threads:           # this ffprobe's share of the CPU budget
+            return parse_frame_csv(run_ffprobe_frames(input_path, interval, threads))
+
+    workers = max(min(samples, cpu_budget()), 1)
+    with reserve(workers), ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(probe, intervals))
+    per_interval = pd.DataFrame([_interval_stats(df, fps) for df in frames])
+    per_interval.insert(0, "interval", intervals)
+
+    est_frames = duration * fps
+    result: dict[str, Any] = {
+        "mode": "random" if random else "even",
+        "samples": samples,
+        "interval_sec": interval_sec,
+        "sampled_frames": int(per_interval["frames"].sum()),
+        "estimated_total_frames": int(round(est_frames)),
+        "frame_type_share": {t: _ci(per_interval[f"share_{t}"], 4) for t in "IPB"},
+        "estimated_frame_counts": {
+            t: int(round(np.nanmean(per_interval[f"share_{t}"]) * est_frames)) for t in "IPB"
+        },
+        "avg_size_by_type_bytes": {t: _ci(per_interval[f"size_{t}"], 1) for t in "IPB"},
+        "bitrate_kbps": _ci(per_interval["bitrate_kbps"], 1),
+        "avg_gop_length": _ci(per_interval["gop_length"], 1),
+    }
+    (output_dir / "sampled_analysis.json").write_text(json.dumps(result, indent=2),
+                                                      encoding="utf-8")
+    per_interval.to_csv(output_dir / "sampled_intervals.csv", index=False)
+    logger.info("Saved sampled_analysis.json (%d intervals, %d frames decoded)",
+                samples, result["sampled_frames"])
+    return result
+
+
+def _interval_stats(df: pd.DataFrame, fps: float) -> dict[str, float]:
+    """One interval, trimmed to whole GOPs, as a single observation."""
+    keys = np.flatnonzero(df["key_frame"].to_numpy() == 1)
+    gop_length = float(np.diff(keys).mean()) if len(keys) > 1 else np.nan
+    if len(keys) > 1:
+        df = df.iloc[keys[0]:keys[-1]]          # complete GOPs only
+    elif len(keys) == 1:
+        df = df.iloc[keys[0]:]                  # GOP longer than the interval
+
+    types, sizes = df["pict_type"].to_numpy(), df["pkt_size"].to_numpy(dtype=float)
+    stats: dict[str, float] = {"frames": len(df), "gop_length": gop_length}
+    for t in "IPB":
+        mask = types == t
+        stats[f"share_{t}"] = float(mask.mean()) if len(df) else np.nan
+        stats[f"size_{t}"] = float(sizes[mask].mean()) if mask.any() else np.nan
+    stats["bitrate_kbps"] = sizes.sum() * 8 / (len(df) / fps) / 1000 if len(df) else np.nan
+    return stats
+
+
+def _ci(values: pd.Series, digits: int) -> dict[str, Any]:
+    """Mean and 95% half-width of per-interval *values* (None when undefined)."""
+    mean, half = mean_interval(values.to_numpy())
+    return {"mean": None if np.isnan(mean) else round(mean, digits),
+            "ci95": None if np.isnan(half) else round(half, digits)}
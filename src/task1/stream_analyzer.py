@@ -0,0 +1,127 @@
+"""
+Every stream of the file, audio included, from one demux pass.
+
+Frame statistics cover only the first video stream, and the metadata
+lists audio codec fields only. Files with several camera angles or
+audio languages would need one run per track. Here a single ffprobe
+packet listing without ``-select_streams`` returns the packets of all
+streams in file order, split by ``stream_index``. Nothing is decoded.
+
+For each stream:
+
+- packet count, bytes, average bitrate and a bitrate timeline
+  (``BITRATE_WINDOW_SEC`` windows, saved to ``stream_bitrate.csv``);
+- timestamp drift: each packet's pts minus the pts implied by the
+  durations of the packets before it. Gaps, overlaps and a creeping
+  audio clock show up here.
+
+For each stream against the first video stream:
+
+- start and end offsets of the two timelines (A/V sync at both ends);
+- interleave distance: how far this stream's dts runs ahead of or
+  behind the video in muxing order. A player has to buffer that much.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.config import BITRATE_WINDOW_SEC
+from src.ffmpeg_utils import parse_compact, run_ffprobe_json, run_ffprobe_packets
+
+logger = logging.getLogger("task1.streams")
+
+_ENTRIES = "stream_index,pts_time,dts_time,duration_time,size,flags"
+
+
+def analyze_all_streams(input_path: Path, output_dir: Path) -> dict[str, Any]:
+    """
+    Per-stream packet statistics and A/V sync measurements.
+
+    Saves ``all_streams.json`` and ``stream_bitrate.csv`` in *output_dir*
+    and returns the JSON dict.
+    """
+    streams = run_ffprobe_json(input_path).get("streams", [])
+    df = pd.DataFrame(parse_compact(run_ffprobe_packets(input_path, _ENTRIES, stream=None)))
+    if df.empty:
+        return {"streams": []}
+    for col in ("stream_index", "pts_time", "dts_time", "duration_time", "size"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df["dts_time"] = df["dts_time"].fillna(df["pts_time"])
+
+    video = next((int(s["index"]) for s in streams if s.get("codec_type") == "video"), None)
+    if video is not None:   # video dts at each point of the file, in muxing order
+        df["video_dts"] = df["dts_time"].where(df["stream_index"] == video).ffill()
+
+    end = float(df["pts_time"].max())
+    bins = np.arange(0, end + BITRATE_WINDOW_SEC, BITRATE_WINDOW_SEC)
+    timeline = pd.DataFrame({"time_sec": bins[:-1]})
+    report = []
+    for info in streams:
+        index = int(info["index"])
+        pkts = df[df["stream_index"] == index]
+        if pkts.empty:
+            continue
+        entry = _stream_stats(info, pkts)
+        if video is not None and index != video:
+            entry["vs_video"] = _sync_stats(pkts, df[df["stream_index"] == video])
+        report.append(entry)
+
+        slot = np.clip((pkts["pts_time"].fillna(0).to_numpy() // BITRATE_WINDOW_SEC).astype(int),
+                       0, len(bins) - 2)
+        kbps = np.bincount(slot, weights=pkts["size"].to_numpy() * 8, minlength=len(bins) - 1)
+        timeline[f"stream{index}_{entry['codec_type']}_kbps"] = np.round(
+            kbps / 1000 / BITRATE_WINDOW_SEC, 1)
+
+    result = {"packets": int(len(df)), "streams": report}
+    (output_dir / "all_streams.json").write_text(json.dumps(result, indent=2), encoding="utf-8")
+    timeline.to_csv(output_dir / "stream_bitrate.csv", index=False)
+    logger.info("Saved all_streams.json (%d streams, %d packets, one demux pass)",
+                len(report), len(df))
+    return result
+
+
+def _stream_stats(info: dict, pkts: pd.DataFrame) -> dict[str, Any]:
+    """Packet count, bytes, bitrate and timestamp drift of one stream."""
+    ordered = pkts.dropna(subset=["pts_time"]).sort_values("pts_time")
+    pts = ordered["pts_time"].to_numpy()
+    dur = ordered["duration_time"].fillna(0).to_numpy()
+    span = float(pts[-1] + dur[-1] - pts[0]) if len(pts) else 0.0
+    expected = pts[0] + np.concatenate(([0.0], np.cumsum(dur)[:-1])) if len(pts) else pts
+    drift = pts - expected
+
+    size = int(pkts["size"].sum())
+    return {
+        "index": int(info["index"]),
+        "codec_type": info.get("codec_type"),
+        "codec_name": info.get("codec_name"),
+        "language": info.get("tags", {}).get("language"),
+        "packets": int(len(pkts)),
+        "bytes": size,
+        "keyframes": int(pkts["flags"].str.startswith("K").sum()),
+        "start_sec": round(float(pts[0]), 6) if len(pts) else None,
+        "duration_sec": round(span, 3),
+        "bitrate_kbps": round(size * 8 / span / 1000, 1) if span > 0 else 0.0,
+        "timestamp_drift_ms": {
+            "final": round(float(drift[-1]) * 1000, 3) if len(drift) else 0.0,
+            "max_abs": round(float(np.abs(drift).max()) * 1000, 3) if len(drift) else 0.0,
+        },
+    }
+
+
+def _sync_stats(pkts: pd.DataFrame, video: pd.DataFrame) -> dict[str, Any]:
+    """Start/end offsets and muxing interleave of *pkts* against the video stream."""
+    lead = (pkts["dts_time"] - pkts["video_dts"]).dropna().to_numpy()
+    v_end = float((video["pts_time"] + video["duration_time"].fillna(0)).max())
+    s_end = float((pkts["pts_time"] + pkts["duration_time"].fillna(0)).max())
+    return {
+        "start_offset_ms": round((float(pkts["pts_time"].min())
+                                  - float(video["pts_time"].min())) * 1000, 3),
+        "end_offset_ms": round((s_end - v_end) * 1000, 3),
+        "interleave_ahead_max_ms": round(float(lead.max(initial=0)) * 1000, 3),
+        "interleave_behind_max_ms": round(abs(min(float(lead.min(initial=0)), 0.0)) * 1000, 3),
+    }
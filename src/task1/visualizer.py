@@ -5,6 +5,9 @@ Task 1 visualizations — three publication-quality graphs.
 2. Frame Size Distribution by Type (box plot)
 3. Bitrate Over Time (line chart with I-frame markers)
 
+``generate_streaming_graphs`` draws the same graphs from the online
+accumulators of ``analyze_streaming`` instead of the frame table.
+
 All saved as 300 DPI PNGs in both the task output folder and results/graphs/.
 """
 
@@ -20,6 +23,7 @@ from src.config import (
     COLOR_I_FRAME, COLOR_P_FRAME, COLOR_B_FRAME,
     GRAPH_DPI, FIGURE_SIZE, BITRATE_WINDOW_SEC, GRAPHS_DIR,
 )
+from .streaming_analysis import StreamingFrameStats
 
 logger = logging.getLogger("task1.viz")
 _COLORS = {"I": COLOR_I_FRAME, "P": COLOR_P_FRAME, "B": COLOR_B_FRAME}
@@ -27,11 +31,28 @@ _COLORS = {"I": COLOR_I_FRAME, "P": COLOR_P_FRAME, "B": COLOR_B_FRAME}
 
 def generate_task1_graphs(frame_df: pd.DataFrame, output_dir: Path) -> None:
     """Create and save all three Task 1 graphs."""
-    _pie_chart(frame_df, output_dir)
+    _pie_chart(frame_df["pict_type"].value_counts(), output_dir)
     _box_plot(frame_df, output_dir)
     _bitrate_line(frame_df, output_dir)
 
 
+def generate_streaming_graphs(stats: StreamingFrameStats, output_dir: Path) -> None:
+    """The same three graphs from ``analyze_streaming`` accumulators (no frame table)."""
+    _pie_chart(pd.Series(stats.counts).sort_values(ascending=False), output_dir)
+    present = [t for t in ["I", "P", "B"] if stats.boxes[t].stats.count]
+    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
+    bp = ax.bxp([stats.boxes[t].bxp_stats(t) for t in present],
+                patch_artist=True, shownotches=True)
+    _style_box_plot(fig, ax, bp, present, output_dir)
+
+    rate = stats.rate
+    if stats.gop.last_pts > 0 and rate.bytes:
+        starts = np.arange(len(rate.bytes)) * rate.window_sec
+        bitrate = np.array(rate.bytes) * 8 / 1000 / rate.window_sec
+        _plot_bitrate(starts + rate.window_sec / 2, bitrate, starts[np.array(rate.has_i)],
+                      output_dir)
+
+
 def _save(fig: plt.Figure, output_dir: Path, name: str) -> None:
     """Save to task output AND results/graphs/."""
     fig.savefig(output_dir / name, dpi=GRAPH_DPI, bbox_inches="tight")
@@ -41,9 +62,8 @@ def _save(fig: plt.Figure, output_dir: Path, name: str) -> None:
     logger.info("Saved %s", name)
 
 
-def _pie_chart(df: pd.DataFrame, out: Path) -> None:
+def _pie_chart(counts: pd.Series, out: Path) -> None:
     """Pie chart showing I/P/B frame percentage distribution."""
-    counts = df["pict_type"].value_counts()
     labels = [f"{t} ({counts[t]:,})" for t in counts.index]
     colors = [_COLORS.get(t, "#999") for t in counts.index]
 
@@ -58,12 +78,17 @@ def _box_plot(df: pd.DataFrame, out: Path) -> None:
     """Box plot of frame sizes (bytes) grouped by type I/P/B."""
     present = [t for t in ["I", "P", "B"] if t in df["pict_type"].values]
     data = [df.loc[df["pict_type"] == t, "pkt_size"].values for t in present]
-    colors = [_COLORS.get(t, "#999") for t in present]
 
     fig, ax = plt.subplots(figsize=FIGURE_SIZE)
     bp = ax.boxplot(data, labels=present, patch_artist=True, notch=True)
-    for patch, c in zip(bp["boxes"], colors):
-        patch.set_facecolor(c)
+    _style_box_plot(fig, ax, bp, present, out)
+
+
+def _style_box_plot(fig: plt.Figure, ax: plt.Axes, bp: dict, present: list[str],
+                    out: Path) -> None:
+    """Colour the boxes by frame type, label the axes and save."""
+    for patch, t in zip(bp["boxes"], present):
+        patch.set_facecolor(_COLORS.get(t, "#999"))
         patch.set_alpha(0.7)
 
     ax.set_title("Frame Size Distribution by Type", fontsize=14, fontweight="bold")
@@ -90,15 +115,19 @@ def _bitrate_line(df: pd.DataFrame, out: Path) -> None:
         bitrate[i] = np.sum(sizes[mask]) * 8 / 1000 / BITRATE_WINDOW_SEC
 
     bin_centers = (bins[:-1] + bins[1:]) / 2
+    _plot_bitrate(bin_centers, bitrate, times[df["pict_type"].values == "I"], out)
+
 
+def _plot_bitrate(centers: np.ndarray, bitrate: np.ndarray, i_times: np.ndarray,
+                  out: Path) -> None:
+    """Draw the bitrate line and mark I-frame positions."""
     fig, ax = plt.subplots(figsize=FIGURE_SIZE)
-    ax.plot(bin_centers, bitrate, linewidth=1.5, color="#2E86AB", label="Bitrate (kbps)")
+    ax.plot(centers, bitrate, linewidth=1.5, color="#2E86AB", label="Bitrate (kbps)")
 
-    # Mark I-frame positions
-    i_times = times[df["pict_type"].values == "I"]
     for t in i_times:
         ax.axvline(t, color=COLOR_I_FRAME, alpha=0.25, linewidth=0.8)
-    ax.axvline(t, color=COLOR_I_FRAME, alpha=0.25, linewidth=0.8, label="I-frame")
+    if len(i_times):
+        ax.axvline(i_times[-1], color=COLOR_I_FRAME, alpha=0.25, linewidth=0.8, label="I-frame")
 
     ax.set_title("Bitrate Over Time", fontsize=14, fontweight="bold")
     ax.set_xlabel("Time (seconds)")
@@ -2,39 +2,65 @@
 Task 2 — Motion Vector & Macroblock Visualization.
 
 Generates an overlay video showing motion vectors and macroblock grid,
-extracts representative sample frames, and computes MV statistics.
+extracts representative sample frames, computes MV statistics, and
+builds a keyframe thumbnail index.
 """
 
 import time
 import logging
 from pathlib import Path
+from typing import Optional
 
 from .mv_visualizer import generate_mv_video
+from .mv_preview import generate_mv_preview
 from .frame_extractor import extract_sample_frames
+from .thumbnail_index import generate_thumbnail_index
 from .mv_analyzer import analyze_motion_vectors
 
 logger = logging.getLogger("task2")
 
 
-def run_task2(input_path: Path) -> None:
+def run_task2(
+    input_path: Path,
+    preview_range: Optional[tuple[float, float]] = None,
+    preview_height: Optional[int] = None,
+) -> None:
     """
     Orchestrate all Task 2 steps.
 
-    Pipeline: overlay video -> sample frames -> MV statistics.
+    With *preview_range* ``(start_sec, duration_sec)`` a fast, downscaled
+    proxy of that window replaces the full overlay render; MV statistics
+    cover only that window and sample frames are extracted from the proxy.
+
+    Pipeline: overlay video -> MV statistics -> sample frames -> thumbnails.
+
+    MV statistics run before frame extraction so the high/low-motion
+    samples can use the real-MV ranking from the same streaming pass.
     """
-    from src.config import TASK2_OUTPUT_DIR, TASK2_FRAMES_DIR
+    from src.config import TASK2_OUTPUT_DIR, TASK2_FRAMES_DIR, PREVIEW_HEIGHT
 
     start = time.time()
     logger.info("=== Task 2 START ===")
 
-    print("  [1/3] Generating motion vector overlay video ...")
-    overlay_path = generate_mv_video(input_path, TASK2_OUTPUT_DIR)
+    window = frame_range = None
+    if preview_range:
+        print("  [1/4] Generating motion vector preview proxy ...")
+        height = PREVIEW_HEIGHT if preview_height is None else preview_height
+        clip = generate_mv_preview(input_path, TASK2_OUTPUT_DIR, *preview_range, height)
+        overlay_path, window, frame_range = clip.path, clip.segment, clip.frame_range
+    else:
+        print("  [1/4] Generating motion vector overlay video ...")
+        overlay_path = generate_mv_video(input_path, TASK2_OUTPUT_DIR)
+
+    print("  [2/4] Computing MV statistics ...")
+    mv_stats = analyze_motion_vectors(input_path, TASK2_OUTPUT_DIR, window)
 
-    print("  [2/3] Extracting sample frames ...")
-    extract_sample_frames(input_path, overlay_path, TASK2_FRAMES_DIR)
+    print("  [3/4] Extracting sample frames ...")
+    extract_sample_frames(input_path, overlay_path, TASK2_FRAMES_DIR,
+                          mv_stats.get("motion_ranking"), frame_range)
 
-    print("  [3/3] Computing MV statistics ...")
-    analyze_motion_vectors(input_path, TASK2_OUTPUT_DIR)
+    print("  [4/4] Building keyframe thumbnail index ...")
+    generate_thumbnail_index(input_path, TASK2_OUTPUT_DIR)
 
     elapsed = time.time() - start
     logger.info("=== Task 2 DONE in %.1f s ===", elapsed)
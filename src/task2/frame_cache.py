@@ -0,0 +1,105 @@
+"""
+On-disk LRU cache for extracted frames.
+
+Review tools ask for the same frames again and again ("frame 1234 with
+the MV overlay"), and each request used to re-run FFmpeg. Every
+extracted image is now stored under ``FRAME_CACHE_DIR``, keyed on:
+
+- the input's fingerprint (resolved path, size, modification time), so
+  a re-rendered video never serves stale frames;
+- the frame selector (frame number, or picture type plus offset);
+- the filter chain;
+- the output format (file suffix).
+
+A hit copies the cached file to the requested path and refreshes its
+modification time, which is what the LRU order uses. After every lookup
+the oldest entries are evicted until the cache fits ``FRAME_CACHE_BYTES``.
+Because the state is plain files, it persists across runs and processes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Callable
+
+from src.config import FRAME_CACHE_DIR, FRAME_CACHE_BYTES
+
+logger = logging.getLogger("task2.frame_cache")
+
+
+def cache_key(video: Path, selector: str, filter_chain: str, fmt: str) -> str:
+    """Stable hex key for one extracted frame."""
+    st = video.stat()
+    parts = [str(video.resolve()), st.st_size, st.st_mtime_ns, selector, filter_chain, fmt]
+    return hashlib.sha1(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def cached_extract(
+    video: Path, dest: Path, selector: str, filter_chain: str,
+    extract: Callable[[], object],
+    cache_dir: Path = FRAME_CACHE_DIR, budget: int = FRAME_CACHE_BYTES,
+) -> bool:
+    """
+    Produce *dest* from the cache, or run *extract* and cache its output.
+
+    Returns:
+        True on a cache hit, False if *extract* ran.
+    """
+    if budget <= 0:
+        extract()
+        return False
+
+    fmt = dest.suffix.lower()
+    entry = cache_dir / (cache_key(video, selector, filter_chain, fmt) + fmt)
+    try:
+        shutil.copyfile(entry, dest)
+        os.utime(entry)                     # most recently used
+    except FileNotFoundError:
+        pass                                # miss, or evicted by another process
+    else:
+        logger.info("Frame cache hit: %s", dest.name)
+        evict(cache_dir, budget)            # the budget may have shrunk
+        return True
+
+    dest.unlink(missing_ok=True)            # a stale file must not be cached as new
+    extract()
+    if dest.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(dest, tmp)
+        os.replace(tmp, entry)              # never expose half-written entries
+        evict(cache_dir, budget)
+    return False
+
+
+def evict(cache_dir: Path = FRAME_CACHE_DIR, budget: int = FRAME_CACHE_BYTES) -> int:
+    """
+    Delete least recently used entries until the cache fits *budget*; return count.
+
+    Other processes may evict the same entries concurrently; files that
+    vanish mid-scan are skipped.
+    """
+    entries = []
+    for path in cache_dir.iterdir():
+        if path.suffix != ".tmp":
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+    entries.sort()
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= budget:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    if removed:
+        logger.info("Frame cache evicted %d entries (%.1f MB kept)", removed, total / 1e6)
+    return removed
@@ -7,13 +7,20 @@ Saves 5-8 PNGs categorised by frame type and motion intensity:
 - B-frame with bi-directional MVs (if present)
 - Highest-motion frame (auto-detected)
 - Lowest-motion frame (auto-detected)
+
+Motion extremes come from the real-MV ranking produced by
+``mv_analyzer`` when available, otherwise from packet sizes. Every
+extraction goes through the on-disk LRU cache in ``frame_cache``.
 """
 
 import logging
 from pathlib import Path
+from typing import Any, Optional
 
-from src.ffmpeg_utils import run_ffmpeg, run_ffprobe_frames
-from src.config import TASK1_OUTPUT_DIR
+from src.ffmpeg_utils import run_ffmpeg
+from src.ffprobe_frames import run_ffprobe_frames
+from src.config import TASK1_OUTPUT_DIR, MOTION_SELECT_MODE
+from .frame_cache import cached_extract
 
 logger = logging.getLogger("task2.frames")
 
@@ -22,12 +29,19 @@ def extract_sample_frames(
     original_path: Path,
     overlay_path: Path,
     frames_dir: Path,
+    motion_ranking: Optional[dict[str, Any]] = None,
+    frame_range: Optional[tuple[int, int]] = None,
 ) -> None:
     """
     Pull representative frames from the overlay video.
 
-    Uses FFmpeg ``select`` filter to pick specific frame types,
-    and heuristic packet-size ranking for motion intensity.
+    Uses FFmpeg ``select`` filter to pick specific frame types. Motion
+    extremes use *motion_ranking* (``mv_analysis.json`` → ``motion_ranking``)
+    when ``MOTION_SELECT_MODE == "mv"``, else packet-size ranking.
+
+    When *overlay_path* is a preview proxy, pass its *frame_range*
+    (original frame numbers, half-open) so motion extremes are chosen
+    inside the window and mapped onto the proxy's frame numbers.
     """
     frames_dir.mkdir(parents=True, exist_ok=True)
 
@@ -35,7 +49,28 @@ def extract_sample_frames(
     _extract_by_type(overlay_path, frames_dir, "P", "frame_pframe_050.png", count=1)
     _extract_by_type(overlay_path, frames_dir, "P", "frame_pframe_100.png", count=1, skip=60)
     _extract_by_type(overlay_path, frames_dir, "B", "frame_bframe_075.png", count=1)
-    _extract_motion_extremes(original_path, overlay_path, frames_dir)
+
+    start, end = frame_range or (0, 2**31)
+    extremes = None
+    if MOTION_SELECT_MODE == "mv" and motion_ranking:
+        extremes = _ranked_extremes(motion_ranking, start, end)
+    if extremes is None:
+        extremes = _pkt_size_extremes(original_path, start, end)
+    if extremes is None:
+        return
+
+    hi_idx, lo_idx = extremes
+    _extract_frame_number(overlay_path, frames_dir, hi_idx - start, "frame_high_motion.png")
+    _extract_frame_number(overlay_path, frames_dir, lo_idx - start, "frame_low_motion.png")
+
+
+def _ranked_extremes(
+    ranking: dict[str, Any], start: int, end: int
+) -> Optional[tuple[int, int]]:
+    """Best high/low frame of a ranking computed over the window [start, end)."""
+    hi = [r["frame_number"] for r in ranking.get("highest", []) if start <= r["frame_number"] < end]
+    lo = [r["frame_number"] for r in ranking.get("lowest", []) if start <= r["frame_number"] < end]
+    return (hi[0], lo[0]) if hi and lo else None
 
 
 def _extract_by_type(
@@ -44,15 +79,13 @@ def _extract_by_type(
 ) -> None:
     """Extract *count* frame(s) of a given picture type via FFmpeg select."""
     # select filter: eq(pict_type,I) where I=1, P=2, B=3
-    type_map = {"I": "I", "P": "P", "B": "B"}
-    select_expr = f"eq(pict_type\\,{type_map[ptype]})"
-
+    vf = f"select='eq(pict_type\\,{ptype})',setpts=N/TB"
     out_path = out_dir / filename
     args = [
         "ffmpeg", "-y",
         "-flags2", "+export_mvs",
         "-i", str(video),
-        "-vf", f"select='{select_expr}',setpts=N/TB",
+        "-vf", vf,
         "-vsync", "vfr",
         "-frames:v", str(count),
         "-ss", str(skip / 30) if skip else "0",
@@ -60,23 +93,22 @@ def _extract_by_type(
     ]
 
     try:
-        run_ffmpeg(args, timeout=120)
+        cached_extract(video, out_path, f"type={ptype} count={count} skip={skip}", vf,
+                       lambda: run_ffmpeg(args, timeout=120))
         logger.info("Extracted %s (%s-frame)", filename, ptype)
     except Exception as exc:
         logger.warning("Could not extract %s-frame: %s", ptype, exc)
 
 
-def _extract_motion_extremes(
-    original: Path, overlay: Path, out_dir: Path
-) -> None:
+def _pkt_size_extremes(
+    original: Path, start: int, end: int
+) -> Optional[tuple[int, int]]:
     """
-    Auto-detect high-motion and low-motion frames by packet size.
+    Auto-detect high-motion and low-motion frames in [start, end) by packet size.
 
-    Larger packets in P/B-frames indicate more residual data,
-    which correlates with higher motion activity.
+    Larger P/B packets carry more residual data, which correlates with motion.
     """
     import pandas as pd
-    import numpy as np
 
     csv_path = TASK1_OUTPUT_DIR / "frame_statistics.csv"
     if csv_path.exists():
@@ -89,30 +121,30 @@ def _extract_motion_extremes(
         df["pkt_size"] = pd.to_numeric(df["pkt_size"], errors="coerce").fillna(0)
         df.insert(0, "frame_number", range(len(df)))
 
-    # Only consider P/B frames for motion detection
-    pb = df[df["pict_type"].isin(["P", "B"])].copy()
+    # Only consider P/B frames (inside the window) for motion detection
+    in_range = df["frame_number"].between(start, end - 1)
+    pb = df[df["pict_type"].isin(["P", "B"]) & in_range]
     if pb.empty:
-        return
+        return None
 
     hi_idx = int(pb.loc[pb["pkt_size"].idxmax(), "frame_number"])
     lo_idx = int(pb.loc[pb["pkt_size"].idxmin(), "frame_number"])
-
-    _extract_frame_number(overlay, out_dir, hi_idx, "frame_high_motion.png")
-    _extract_frame_number(overlay, out_dir, lo_idx, "frame_low_motion.png")
+    return hi_idx, lo_idx
 
 
 def _extract_frame_number(video: Path, out_dir: Path, n: int, fname: str) -> None:
     """Extract a specific frame by number from the overlay video."""
+    vf = f"select='eq(n\\,{n})'"
     args = [
         "ffmpeg", "-y",
         "-i", str(video),
-        "-vf", f"select='eq(n\\,{n})'",
+        "-vf", vf,
         "-vsync", "vfr",
         "-frames:v", "1",
         str(out_dir / fname),
     ]
     try:
-        run_ffmpeg(args, timeout=60)
+        cached_extract(video, out_dir / fname, f"n={n}", vf, lambda: run_ffmpeg(args, timeout=60))
         logger.info("Extracted %s (frame #%d)", fname, n)
     except Exception as exc:
         logger.warning("Could not extract frame #%d: %s", n, exc)
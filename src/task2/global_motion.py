@@ -0,0 +1,134 @@
+"""
+Global (camera) motion estimation from decoder motion vectors.
+
+Fits a per-frame translation + zoom model to the whole MV field::
+
+    displacement(x, y) = (tx, ty) + zoom * ((x, y) - frame_centre)
+
+The fit is a closed-form weighted least squares over all blocks of a
+frame at once, repeated a few times with outlier rejection so moving
+objects do not drag the camera estimate. Whatever the model cannot
+explain is reported as residual "object motion" energy.
+
+Think of it like a security camera on a slowly turning mount: the pan
+moves *every* block the same way, a walking person moves only a few.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from src.config import GM_ITERATIONS, GM_INLIER_PX
+
+logger = logging.getLogger("task2.global_motion")
+
+
+def fit_global_motion(
+    mvs: np.ndarray, frame_w: int, frame_h: int
+) -> Optional[dict[str, float]]:
+    """
+    Robustly fit translation + zoom to one frame's MV field.
+
+    Only past-referencing vectors (``source < 0``) are used so every
+    frame is measured in the same temporal direction.
+
+    Returns:
+        Dict with tx, ty (px), zoom (per-px scale), inlier_ratio and
+        object_energy (area-weighted mean squared residual, px^2),
+        or ``None`` if the frame has too few vectors.
+    """
+    mvs = mvs[mvs["source"] < 0] if len(mvs) else mvs
+    if len(mvs) < 3:
+        return None
+
+    scale = np.maximum(mvs["motion_scale"].astype(np.float64), 1.0)
+    # FFmpeg stores src = dst + motion, so the block moved by -motion
+    vx = -mvs["motion_x"] / scale
+    vy = -mvs["motion_y"] / scale
+    x = mvs["dst_x"] - frame_w / 2.0
+    y = mvs["dst_y"] - frame_h / 2.0
+    area = mvs["w"].astype(np.float64) * mvs["h"]
+
+    inliers = np.ones(len(mvs), dtype=bool)
+    for _ in range(GM_ITERATIONS):
+        tx, ty, zoom = _weighted_fit(x, y, vx, vy, area * inliers)
+        resid = np.hypot(vx - tx - zoom * x, vy - ty - zoom * y)
+        thresh = max(GM_INLIER_PX, 2.5 * float(np.median(resid[inliers])))
+        new_inliers = resid <= thresh
+        if new_inliers.sum() < 3 or np.array_equal(new_inliers, inliers):
+            break
+        inliers = new_inliers
+
+    return {
+        "tx": float(tx),
+        "ty": float(ty),
+        "zoom": float(zoom),
+        "inlier_ratio": float(area[resid <= thresh].sum() / area.sum()),
+        "object_energy": float(np.sum(area * resid**2) / area.sum()),
+    }
+
+
+def _weighted_fit(
+    x: np.ndarray, y: np.ndarray, vx: np.ndarray, vy: np.ndarray, w: np.ndarray
+) -> tuple[float, float, float]:
+    """Closed-form weighted LS for (tx, ty, zoom) — no matrix solve needed."""
+    sw = w.sum()
+    if sw <= 0:
+        return 0.0, 0.0, 0.0
+    mx, my = (w * x).sum() / sw, (w * y).sum() / sw
+    mvx, mvy = (w * vx).sum() / sw, (w * vy).sum() / sw
+    dx, dy = x - mx, y - my
+    denom = (w * (dx * dx + dy * dy)).sum()
+    zoom = (w * (dx * (vx - mvx) + dy * (vy - mvy))).sum() / denom if denom else 0.0
+    return mvx - zoom * mx, mvy - zoom * my, zoom
+
+
+class GlobalMotionTimeline:
+    """Accumulate per-frame camera-motion fits fed from the MV stream."""
+
+    def __init__(self, frame_w: int, frame_h: int) -> None:
+        self.frame_w = frame_w
+        self.frame_h = frame_h
+        self.rows: list[list[float]] = []   # frame, t, tx, ty, zoom, inliers, energy
+
+    def push(self, frame_number: int, pts_time: float, mvs: np.ndarray) -> None:
+        """Fit one frame and append it to the timeline (skips MV-less frames)."""
+        fit = fit_global_motion(mvs, self.frame_w, self.frame_h)
+        if fit is None:
+            return
+        self.rows.append([frame_number, pts_time, fit["tx"], fit["ty"], fit["zoom"],
+                          fit["inlier_ratio"], fit["object_energy"]])
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregate camera vs. object motion over the whole clip."""
+        if not self.rows:
+            return {"frames_fitted": 0}
+        arr = np.array(self.rows)
+        cam = np.hypot(arr[:, 2], arr[:, 3])
+        return {
+            "frames_fitted": int(len(arr)),
+            "mean_camera_motion_px": round(float(cam.mean()), 3),
+            "max_camera_motion_px": round(float(cam.max()), 3),
+            "mean_abs_zoom": round(float(np.abs(arr[:, 4]).mean()), 6),
+            "mean_inlier_ratio": round(float(arr[:, 5].mean()), 3),
+            "mean_object_energy_px2": round(float(arr[:, 6].mean()), 3),
+        }
+
+    def save(self, output_dir: Path) -> dict[str, Any]:
+        """Write ``global_motion.json`` (summary + timeline) and return the summary."""
+        keys = ["frame_number", "pts_time", "tx", "ty", "zoom",
+                "inlier_ratio", "object_energy"]
+        timeline = [
+            {k: (int(v) if k == "frame_number" else round(v, 4)) for k, v in zip(keys, r)}
+            for r in self.rows
+        ]
+        summary = self.summary()
+        (output_dir / "global_motion.json").write_text(
+            json.dumps({"summary": summary, "timeline": timeline}, indent=2),
+            encoding="utf-8",
+        )
+        logger.info("Saved global_motion.json (%d frames)", len(timeline))
+        return summary
@@ -0,0 +1,53 @@
+"""
+Bounded top-K / bottom-K ranking of frames by motion intensity.
+
+Fed one frame at a time from the MV stream, it keeps two fixed-size
+heaps — the K highest-motion and K lowest-motion frames seen so far —
+so ranking a two-hour file costs O(K) memory instead of a full table.
+"""
+
+import heapq
+from typing import Any
+
+
+class MotionRanker:
+    """Keep the K highest- and K lowest-scoring frames seen so far."""
+
+    def __init__(self, k: int = 3) -> None:
+        """
+        Args:
+            k: Number of frames to keep at each extreme.
+        """
+        self.k = max(int(k), 1)
+        self._high: list[tuple[float, int]] = []   # min-heap of (score, frame)
+        self._low: list[tuple[float, int]] = []    # min-heap of (-score, -frame)
+
+    def push(self, frame_number: int, score: float) -> None:
+        """Offer a frame; it is kept only if it ranks in either top-K."""
+        hi_item = (score, frame_number)
+        if len(self._high) < self.k:
+            heapq.heappush(self._high, hi_item)
+        elif hi_item > self._high[0]:
+            heapq.heapreplace(self._high, hi_item)
+
+        # Negate so the heap root is the *largest* of the low set
+        lo_item = (-score, -frame_number)
+        if len(self._low) < self.k:
+            heapq.heappush(self._low, lo_item)
+        elif lo_item > self._low[0]:
+            heapq.heapreplace(self._low, lo_item)
+
+    def highest(self) -> list[tuple[int, float]]:
+        """Return ``(frame_number, score)`` pairs, highest score first."""
+        return [(f, s) for s, f in sorted(self._high, reverse=True)]
+
+    def lowest(self) -> list[tuple[int, float]]:
+        """Return ``(frame_number, score)`` pairs, lowest score first."""
+        return [(-f, -s) for s, f in sorted(self._low, reverse=True)]
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly summary used in ``mv_analysis.json``."""
+        def fmt(pairs: list[tuple[int, float]]) -> list[dict[str, Any]]:
+            return [{"frame_number": f, "mean_mv_px": round(s, 3)} for f, s in pairs]
+
+        return {"k": self.k, "highest": fmt(self.highest()), "lowest": fmt(self.lowest())}
@@ -2,32 +2,41 @@
 Motion vector statistics analysis.
 
 Produces ``mv_analysis.json`` with frame counts, B-frame presence,
-and video characteristics that affect MV density.
+video characteristics that affect MV density, and — when PyAV is
+available — real MV magnitude statistics plus a high/low-motion ranking
+computed in a single streaming decode pass.
 """
 
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
 
 from src.ffmpeg_utils import run_ffprobe_json
-from src.config import TASK1_OUTPUT_DIR
+from src.config import TASK1_OUTPUT_DIR, MOTION_RANK_K
+from src.utils.segments import Segment
+from .global_motion import GlobalMotionTimeline
+from .motion_ranking import MotionRanker
+from .mv_stream import iter_motion_vectors, mean_mv_magnitude, mv_stream_available
 
 logger = logging.getLogger("task2.mv_stats")
 
 
 def analyze_motion_vectors(
-    input_path: Path, output_dir: Path
+    input_path: Path, output_dir: Path, window: Optional[Segment] = None
 ) -> dict[str, Any]:
     """
     Compute motion-vector related statistics and save to JSON.
 
     Uses per-frame data (from Task 1 CSV if available, else re-extracts)
-    and video metadata to compile the analysis.
+    and video metadata to compile the analysis. With *window* (a preview
+    clip) only its frames are counted, decoded and ranked.
     """
     frame_df = _load_frame_data(input_path)
+    if window is not None:
+        frame_df = frame_df.iloc[window.start_frame:window.start_frame + window.num_frames]
     meta = run_ffprobe_json(input_path)
     video_stream = next(
         (s for s in meta.get("streams", []) if s.get("codec_type") == "video"), {}
@@ -59,12 +68,58 @@ def analyze_motion_vectors(
         },
     }
 
+    if mv_stream_available():
+        timeline = GlobalMotionTimeline(
+            int(video_stream.get("width") or 0), int(video_stream.get("height") or 0)
+        )
+        result["mv_magnitude_stats"], result["motion_ranking"] = _stream_mv_stats(
+            input_path, timeline, window
+        )
+        result["global_motion"] = timeline.save(output_dir)
+    else:
+        logger.warning("PyAV not installed — skipping real MV magnitude statistics")
+
     out_path = output_dir / "mv_analysis.json"
     out_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
     logger.info("Saved mv_analysis.json")
     return result
 
 
+def _stream_mv_stats(
+    input_path: Path, timeline: GlobalMotionTimeline, window: Optional[Segment]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    One decode pass: running MV magnitude totals, bounded motion ranking,
+    and the global (camera) motion fit fed into *timeline*.
+
+    Only P/B frames carrying MVs are ranked; no MV fields are retained.
+    """
+    ranker = MotionRanker(MOTION_RANK_K)
+    frames = vectors = 0
+    mag_sum = 0.0
+    mag_max = 0.0
+
+    for fr in iter_motion_vectors(input_path, window):
+        if len(fr.mvs) == 0:
+            continue
+        score = mean_mv_magnitude(fr.mvs)
+        ranker.push(fr.frame_number, score)
+        timeline.push(fr.frame_number, fr.pts_time, fr.mvs)
+        frames += 1
+        vectors += len(fr.mvs)
+        mag_sum += score
+        mag_max = max(mag_max, score)
+
+    stats = {
+        "frames_ranked": frames,
+        "total_vectors": vectors,
+        "avg_vectors_per_frame": round(vectors / frames, 1) if frames else 0,
+        "mean_mv_px": round(mag_sum / frames, 3) if frames else 0.0,
+        "max_frame_mean_mv_px": round(mag_max, 3),
+    }
+    return stats, ranker.to_dict()
+
+
 def _load_frame_data(input_path: Path) -> pd.DataFrame:
     """Load frame data from Task 1 CSV or re-extract if not available."""
     csv_path = TASK1_OUTPUT_DIR / "frame_statistics.csv"
@@ -73,7 +128,7 @@ def _load_frame_data(input_path: Path) -> pd.DataFrame:
 
     # Fall back to fresh extraction
     import io
-    from src.ffmpeg_utils import run_ffprobe_frames
+    from src.ffprobe_frames import run_ffprobe_frames
 
     raw = run_ffprobe_frames(input_path)
     cols = ["key_frame", "pts_time", "pkt_size", "pict_type", "coded_picture_number"]
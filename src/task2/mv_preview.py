@@ -0,0 +1,99 @@
+"""
+Fast preview / proxy render of the motion-vector overlay.
+
+Instead of the full-length, full-resolution ``CRF_VALUE`` / ``PRESET``
+render, a preview clips a time window (starting on the keyframe at or
+before the requested start, so MVs decode correctly), downscales after
+``codecview`` has drawn the arrows, and encodes with a fast preset.
+
+Think of it like a director's dailies: a quick, low-res cut to check
+the shot before paying for the full-quality render.
+"""
+
+import logging
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from src.config import PREVIEW_BFRAMES, PREVIEW_CRF, PREVIEW_HEIGHT, PREVIEW_PRESET
+from src.ffmpeg_utils import run_ffmpeg
+from src.utils.segments import Segment, probe_keyframes, seek_args
+
+logger = logging.getLogger("task2.mv_preview")
+
+
+class PreviewClip(NamedTuple):
+    """A rendered proxy and where it sits in the original (display order)."""
+
+    path: Path
+    segment: Segment   # the keyframe-aligned window of the original
+
+    @property
+    def frame_range(self) -> tuple[int, int]:
+        """Half-open ``(start, end)`` range of original frame numbers covered."""
+        return self.segment.start_frame, self.segment.start_frame + self.segment.num_frames
+
+
+def generate_mv_preview(
+    input_path: Path,
+    output_dir: Path,
+    start_sec: float = 0.0,
+    duration_sec: float = 20.0,
+    height: int = PREVIEW_HEIGHT,
+) -> PreviewClip:
+    """
+    Render ``motion_vectors_preview.mp4`` for a time window.
+
+    Args:
+        input_path: Path to the original H.264 MP4 video.
+        output_dir: Directory where the proxy will be saved.
+        start_sec: Requested window start; snapped back to a keyframe.
+        duration_sec: Window length in seconds (from *start_sec*).
+        height: Output height in pixels (width keeps aspect ratio);
+            ``0`` keeps the original resolution.
+
+    Returns:
+        :class:`PreviewClip` with the proxy path and its window, so MV
+        statistics and sample frames can be restricted to it.
+    """
+    seg = _window_segment(input_path, start_sec, duration_sec)
+    output_path = output_dir / "motion_vectors_preview.mp4"
+
+    vf = "codecview=mv=pf+bf+bb:block=1"
+    if height:
+        vf += f",scale=-2:{int(height)}"   # scale after drawing: arrows stay exact
+
+    run_ffmpeg([
+        "ffmpeg", "-y",
+        "-flags2", "+export_mvs",
+        *seek_args(seg),
+        "-i", str(input_path),
+        "-frames:v", str(seg.num_frames),
+        "-vf", vf,
+        "-c:v", "libx264", "-crf", str(PREVIEW_CRF), "-preset", PREVIEW_PRESET,
+        "-bf", str(PREVIEW_BFRAMES),
+        "-an",
+        str(output_path),
+    ], timeout=600)
+
+    logger.info("Created %s (frames %d-%d)", output_path.name,
+                seg.start_frame, seg.start_frame + seg.num_frames - 1)
+    return PreviewClip(output_path, seg)
+
+
+def _window_segment(input_path: Path, start_sec: float, duration_sec: float) -> Segment:
+    """Map a time window onto a keyframe-aligned :class:`Segment`."""
+    pts, keys = probe_keyframes(input_path)
+    if len(pts) == 0:
+        raise ValueError(f"No video frames found in {input_path}")
+    if len(keys) == 0 or keys[0] != 0:
+        keys = np.concatenate(([0], keys))
+
+    t0 = pts[0] + max(start_sec, 0.0)
+    first = int(keys[max(np.searchsorted(pts[keys], t0, side="right") - 1, 0)])
+    end = int(np.searchsorted(pts, t0 + duration_sec, side="left"))
+    end = min(max(end, first + 1), len(pts))
+
+    margin = 0.25 * float(np.median(np.diff(pts))) if len(pts) > 1 else 0.0
+    return Segment(0, first, end - first, float(pts[first]) + margin)
@@ -0,0 +1,91 @@
+"""
+Streaming access to the decoder's real motion vectors.
+
+Decodes the video once with ``+export_mvs`` (the same flag ``codecview``
+uses) and yields the motion-vector field of every frame as a numpy
+structured array, so callers never hold more than one frame in memory.
+
+Requires PyAV (``av``). Callers should check :func:`mv_stream_available`
+and fall back to packet-size heuristics when it is missing.
+"""
+
+import logging
+from pathlib import Path
+from itertools import islice
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from src.utils.segments import Segment
+
+logger = logging.getLogger("task2.mv_stream")
+
+
+class MVFrame(NamedTuple):
+    """One decoded frame's motion-vector field (display order)."""
+
+    frame_number: int
+    pict_type: str
+    pts_time: float
+    mvs: np.ndarray   # fields: source, w, h, src_x, src_y, dst_x, dst_y, motion_x, ...
+
+
+def mv_stream_available() -> bool:
+    """Return True if PyAV is installed and real MVs can be read."""
+    try:
+        import av  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def iter_motion_vectors(input_path: Path,
+                        window: Optional[Segment] = None) -> Iterator[MVFrame]:
+    """
+    Yield an :class:`MVFrame` for every video frame of *input_path*.
+
+    I-frames (and any frame without MV side data) get an empty array,
+    so frame numbers stay aligned with ``select='eq(n,N)'`` indices.
+    With *window*, decoding seeks to its keyframe and stops after its
+    frames; frame numbers stay those of the whole file.
+    """
+    import av
+
+    with av.open(str(input_path)) as container:
+        stream = container.streams.video[0]
+        stream.codec_context.options = {"flags2": "+export_mvs"}
+        stream.thread_type = "AUTO"
+        start, limit = (window.start_frame, window.num_frames) if window else (0, None)
+        if start:   # backward seek lands on the window's keyframe, like -noaccurate_seek
+            container.seek(int(window.seek_sec / stream.time_base), stream=stream, backward=True)
+
+        for n, frame in enumerate(islice(container.decode(stream), limit), start):
+            side = frame.side_data.get("MOTION_VECTORS")
+            mvs = side.to_ndarray() if side is not None else _EMPTY
+            ptype = getattr(frame.pict_type, "name", str(frame.pict_type))
+            yield MVFrame(n, ptype, float(frame.time or 0.0), mvs)
+
+    logger.info("Streamed motion vectors from %s", input_path.name)
+
+
+def mv_magnitudes(mvs: np.ndarray) -> np.ndarray:
+    """Per-block motion magnitude in pixels (``motion_x/y`` / ``motion_scale``)."""
+    if len(mvs) == 0:
+        return np.zeros(0)
+    scale = np.maximum(mvs["motion_scale"].astype(np.float64), 1.0)
+    return np.hypot(mvs["motion_x"] / scale, mvs["motion_y"] / scale)
+
+
+def mean_mv_magnitude(mvs: np.ndarray) -> float:
+    """Block-area-weighted mean MV magnitude of one frame (0 if no MVs)."""
+    if len(mvs) == 0:
+        return 0.0
+    area = mvs["w"].astype(np.float64) * mvs["h"]
+    return float(np.sum(mv_magnitudes(mvs) * area) / np.sum(area))
+
+
+_EMPTY = np.zeros(0, dtype=[
+    ("source", "i4"), ("w", "u1"), ("h", "u1"),
+    ("src_x", "i2"), ("src_y", "i2"), ("dst_x", "i2"), ("dst_y", "i2"),
+    ("flags", "u8"), ("motion_x", "i4"), ("motion_y", "i4"), ("motion_scale", "u2"),
+])
@@ -6,24 +6,47 @@ The output shows:
 - Blue arrows for B-frame forward motion vectors
 - Red arrows for B-frame backward motion vectors
 - 16x16 macroblock grid on every frame
+
+Optionally the video is split at keyframes and the segments are rendered
+in parallel, then losslessly concatenated (see ``src.utils.segments``).
 """
 
 import logging
 from pathlib import Path
+from typing import Optional
+
+import pandas as pd
 
-from src.config import CRF_VALUE, PRESET
+from src.config import (
+    CRF_VALUE, PRESET, MV_SEGMENT_PARALLEL, MV_SEGMENT_WORKERS, CAPTURE_ENCODER_STATS,
+)
+from src.encoder_stats import parse_x264_stats, save_encoder_stats, x264_stats_args
 from src.ffmpeg_utils import run_ffmpeg
+from src.utils.segments import (
+    Segment, concat_segments, default_workers, plan_segments, run_parallel, seek_args,
+)
 
 logger = logging.getLogger("task2.mv_viz")
 
+_CODECVIEW = "codecview=mv=pf+bf+bb:block=1"
+
 
-def generate_mv_video(input_path: Path, output_dir: Path) -> Path:
+def generate_mv_video(
+    input_path: Path,
+    output_dir: Path,
+    parallel: bool = MV_SEGMENT_PARALLEL,
+    workers: Optional[int] = MV_SEGMENT_WORKERS,
+    capture_stats: bool = CAPTURE_ENCODER_STATS,
+) -> Path:
     """
     Create ``motion_vectors_overlay.mp4`` with MV arrows and block grid.
 
     Args:
         input_path: Path to the original H.264 MP4 video.
         output_dir: Directory where the overlay video will be saved.
+        parallel: Render keyframe-aligned segments concurrently.
+        workers: Number of concurrent segment encodes (default: all cores).
+        capture_stats: Save libx264's per-frame stats as a CSV sidecar.
 
     Returns:
         Path to the generated overlay video.
@@ -36,19 +59,89 @@ def generate_mv_video(input_path: Path, output_dir: Path) -> Path:
     """
     output_path = output_dir / "motion_vectors_overlay.mp4"
 
+    if parallel:
+        workers = workers or default_workers()
+        segments = plan_segments(input_path, workers)
+        if len(segments) > 1:
+            return _render_segmented(input_path, output_path, segments, workers,
+                                     capture_stats)
+        logger.info("Only one keyframe-aligned segment — rendering in one pass")
+
+    stats_prefix = output_dir / "_mv_x264"
     args = [
         "ffmpeg",
         "-y",                          # Overwrite if exists
         "-flags2", "+export_mvs",      # Export motion vector side data
         "-i", str(input_path),
-        "-vf", "codecview=mv=pf+bf+bb:block=1",
+        "-vf", _CODECVIEW,
         "-c:v", "libx264",
         "-crf", str(CRF_VALUE),
         "-preset", PRESET,
         "-an",                         # Drop audio (visual-only output)
+        *(x264_stats_args(stats_prefix) if capture_stats else []),
         str(output_path),
     ]
 
     run_ffmpeg(args, timeout=600)
+    if capture_stats:
+        save_encoder_stats(parse_x264_stats(stats_prefix), output_path)
     logger.info("Created %s", output_path.name)
     return output_path
+
+
+def _render_segmented(
+    input_path: Path, output_path: Path, segments: list[Segment], workers: int,
+    capture_stats: bool,
+) -> Path:
+    """
+    Render each segment with ``codecview`` + libx264 in parallel, then concat.
+
+    Every segment decodes from its own closed-GOP keyframe, so the drawn
+    MVs and block grid match a single-pass render frame for frame.
+    """
+    seg_dir = output_path.parent / "_mv_segments"
+    seg_dir.mkdir(exist_ok=True)
+
+    def render(seg: Segment) -> tuple[Path, Optional[pd.DataFrame]]:
+        part = seg_dir / f"seg_{seg.index:04d}.mp4"
+        prefix = seg_dir / f"seg_{seg.index:04d}_x264" if capture_stats else None
+        render_mv_segment(input_path, part, seg, prefix)
+        stats = parse_x264_stats(prefix, seg.start_frame) if capture_stats else None
+        return part, stats
+
+    logger.info("Rendering %d segments with %d workers", len(segments), workers)
+    results = run_parallel(render, segments, workers)
+    parts = [part for part, _ in results]
+    concat_segments(parts, output_path)
+    if capture_stats:
+        save_encoder_stats(pd.concat([st for _, st in results], ignore_index=True),
+                           output_path)
+
+    for part in parts:
+        part.unlink(missing_ok=True)
+    seg_dir.rmdir()
+    logger.info("Created %s (segment-parallel)", output_path.name)
+    return output_path
+
+
+def render_mv_segment(input_path: Path, part: Path, seg: Segment,
+                      stats_prefix: Optional[Path] = None) -> Path:
+    """
+    Encode the overlay of one keyframe-aligned *seg* into *part*.
+
+    Used by the segment-parallel render and by the render planner's
+    sample encodes. With *stats_prefix*, libx264's stats are captured.
+    """
+    run_ffmpeg([
+        "ffmpeg", "-y",
+        "-flags2", "+export_mvs",
+        *seek_args(seg),
+        "-i", str(input_path),
+        "-frames:v", str(seg.num_frames),
+        "-vf", _CODECVIEW,
+        "-c:v", "libx264", "-crf", str(CRF_VALUE), "-preset", PRESET,
+        "-an",
+        *(x264_stats_args(stats_prefix) if stats_prefix else []),
+        str(part),
+    ], timeout=600)
+    return part
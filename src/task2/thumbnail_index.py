@@ -0,0 +1,89 @@
+"""
+Keyframe-only thumbnail index and contact sheets.
+
+A visual index needs one small picture every few seconds, not every
+frame decoded. One FFmpeg pass does it all:
+
+- ``-skip_frame nokey`` makes the decoder skip everything but keyframes;
+- ``select`` keeps the first keyframe at least ``THUMB_INTERVAL_SEC``
+  after the previous pick (every keyframe if GOPs are longer);
+- ``showinfo`` logs each pick's timestamp; ``scale`` shrinks it;
+- ``split`` writes each thumbnail as a JPEG and ``tile`` packs the
+  same thumbnails into ``THUMB_COLUMNS`` x ``THUMB_ROWS`` sprite sheets.
+
+``thumbnail_index.json`` maps every tile to its timestamp, sheet and
+pixel position, so a player or web page can show hover previews.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any
+
+from src.config import THUMB_INTERVAL_SEC, THUMB_WIDTH, THUMB_COLUMNS, THUMB_ROWS
+from src.ffmpeg_utils import run_ffmpeg
+
+logger = logging.getLogger("task2.thumbnails")
+
+_SHOWINFO = re.compile(r"n:\s*(\d+)\s+pts:\s*\S+\s+pts_time:(\S+)")
+
+
+def generate_thumbnail_index(input_path: Path, output_dir: Path) -> dict[str, Any]:
+    """
+    Write keyframe thumbnails, sprite sheets and ``thumbnail_index.json``.
+
+    Returns:
+        The index dict (also saved as JSON in ``output_dir/thumbnails``).
+    """
+    import cv2
+
+    thumb_dir = output_dir / "thumbnails"
+    thumb_dir.mkdir(parents=True, exist_ok=True)
+    for old in thumb_dir.glob("*.jpg"):
+        old.unlink()
+
+    pick = rf"select='isnan(prev_selected_t)+gte(t-prev_selected_t\,{THUMB_INTERVAL_SEC})'"
+    result = run_ffmpeg([
+        "ffmpeg", "-y", "-hide_banner", "-nostats",
+        "-skip_frame", "nokey",            # decode keyframes only
+        "-i", str(input_path),
+        "-filter_complex",
+        f"[0:v]{pick},showinfo,scale={THUMB_WIDTH}:-2,split[thumb][s];"
+        f"[s]tile={THUMB_COLUMNS}x{THUMB_ROWS}[sheet]",
+        "-map", "[thumb]", "-fps_mode", "passthrough", str(thumb_dir / "thumb_%05d.jpg"),
+        "-map", "[sheet]", "-fps_mode", "passthrough", str(thumb_dir / "sheet_%03d.jpg"),
+    ], timeout=1800)
+
+    times = [float(m.group(2)) for m in _SHOWINFO.finditer(result.stderr)]
+    sheets = sorted(p.name for p in thumb_dir.glob("sheet_*.jpg"))
+    first = cv2.imread(str(thumb_dir / "thumb_00001.jpg")) if times else None
+    thumb_h = int(first.shape[0]) if first is not None else 0
+
+    per_sheet = THUMB_COLUMNS * THUMB_ROWS
+    tiles = []
+    for i, t in enumerate(times):
+        row, col = divmod(i % per_sheet, THUMB_COLUMNS)
+        tiles.append({
+            "index": i,
+            "timestamp_sec": round(t, 3),
+            "thumbnail": f"thumb_{i + 1:05d}.jpg",
+            "sheet": sheets[i // per_sheet] if i // per_sheet < len(sheets) else None,
+            "x": col * THUMB_WIDTH,
+            "y": row * thumb_h,
+        })
+
+    index = {
+        "source": input_path.name,
+        "interval_sec": THUMB_INTERVAL_SEC,
+        "thumb_width": THUMB_WIDTH,
+        "thumb_height": thumb_h,
+        "columns": THUMB_COLUMNS,
+        "rows": THUMB_ROWS,
+        "sheets": sheets,
+        "tiles": tiles,
+    }
+    (thumb_dir / "thumbnail_index.json").write_text(json.dumps(index, indent=2),
+                                                    encoding="utf-8")
+    logger.info("Saved %d thumbnails on %d sheets", len(tiles), len(sheets))
+    return index
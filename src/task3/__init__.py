@@ -9,27 +9,64 @@ then measuring the compression impact.
 import time
 import logging
 from pathlib import Path
+from typing import Optional
 
 from .rectangle_overlay import render_overlay
+from .ffmpeg_overlay import render_overlay_ffmpeg
+from .scene_compositor import render_scene
+from .encode_sweep import run_sweep
+from .ladder_analyzer import analyze_ladder
 from .compression_analyzer import compare_compression
 from .visualizer import generate_compression_chart
 
 logger = logging.getLogger("task3")
 
 
-def run_task3(input_path: Path) -> None:
+def run_task3(input_path: Path, scene_path: Optional[Path] = None,
+              scene_objects: int = 0, resume: bool = False, sweep: bool = False,
+              ladder: Optional[list[Path]] = None) -> None:
     """
     Orchestrate all Task 3 steps.
 
     Pipeline: render overlay -> analyze compression -> generate chart.
+
+    With *scene_path* (JSON) or *scene_objects* > 0, a multi-object stress
+    scene is rendered instead of the single rectangle. With *resume*, the
+    rectangle render is checkpointed and continues an interrupted run.
+    With *sweep*, a CRF x preset encode sweep runs instead (see
+    ``encode_sweep``). With *ladder*, those renditions are compared with
+    *input_path* as an ABR ladder instead (see ``ladder_analyzer``).
     """
-    from src.config import TASK3_OUTPUT_DIR
+    from src.config import TASK3_OUTPUT_DIR, OVERLAY_ENGINE, RENDER_CHECKPOINT
 
     start = time.time()
     logger.info("=== Task 3 START ===")
 
-    print("  [1/3] Rendering rectangle overlay ...")
-    overlay_path = render_overlay(input_path, TASK3_OUTPUT_DIR)
+    if ladder:
+        print(f"  [1/1] Analyzing encoding ladder of {len(ladder)} renditions ...")
+        table = analyze_ladder(input_path, ladder, TASK3_OUTPUT_DIR)
+        print(table.to_string(index=False))
+        logger.info("=== Task 3 ladder DONE in %.1f s ===", time.time() - start)
+        return
+
+    if sweep:
+        print("  [1/1] Running CRF x preset encode sweep ...")
+        table = run_sweep(input_path, TASK3_OUTPUT_DIR)
+        print(table.to_string(index=False))
+        logger.info("=== Task 3 sweep DONE in %.1f s ===", time.time() - start)
+        return
+
+    if scene_path is not None or scene_objects > 0:
+        print("  [1/3] Rendering multi-object scene ...")
+        overlay_path = render_scene(input_path, TASK3_OUTPUT_DIR, scene_path, scene_objects)
+    else:
+        print("  [1/3] Rendering rectangle overlay ...")
+        if resume or RENDER_CHECKPOINT:
+            overlay_path = render_overlay(input_path, TASK3_OUTPUT_DIR, checkpoint=True)
+        elif OVERLAY_ENGINE == "ffmpeg":
+            overlay_path = render_overlay_ffmpeg(input_path, TASK3_OUTPUT_DIR)
+        else:
+            overlay_path = render_overlay(input_path, TASK3_OUTPUT_DIR)
 
     print("  [2/3] Analyzing compression impact ...")
     comparison = compare_compression(input_path, overlay_path, TASK3_OUTPUT_DIR)
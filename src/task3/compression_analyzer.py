@@ -4,6 +4,14 @@ Compression impact analysis — before vs. after overlay.
 Compares file size, average bitrate, and average frame size between
 the original video and the rectangle-overlay video to quantify how
 adding new visual content affects H.264 compression efficiency.
+
+If the overlay encode left a libx264 stats sidecar (see
+``src.encoder_stats``), the modified metrics come from it — exact frame
+count plus per-type QP and size — instead of a second ffprobe run.
+
+With ``COMPARE_PER_FRAME`` the comparison also goes frame by frame
+(PSNR/SSIM joined with coded sizes, see ``frame_compare``) and adds the
+aggregates under ``"per_frame"``.
 """
 
 import json
@@ -11,7 +19,12 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
+
+from src.config import COMPARE_PER_FRAME
+from src.encoder_stats import load_encoder_stats
 from src.ffmpeg_utils import run_ffprobe_json
+from .frame_compare import compare_per_frame
 
 logger = logging.getLogger("task3.compression")
 
@@ -24,11 +37,16 @@ def compare_compression(
     """
     Compare compression metrics for original vs. overlay video.
 
-    Returns dict with original, modified, and delta metrics.
+    Returns dict with original, modified, and delta metrics (plus
+    per-frame aggregates with ``COMPARE_PER_FRAME``).
     Also saves ``compression_comparison.json``.
     """
-    orig = _get_metrics(original_path)
-    modif = _get_metrics(overlay_path)
+    orig, fps = _get_metrics(original_path)
+    enc_stats = load_encoder_stats(overlay_path)
+    if enc_stats is not None and len(enc_stats):
+        modif = _metrics_from_stats(overlay_path, enc_stats, fps)
+    else:
+        modif, _ = _get_metrics(overlay_path)
 
     delta = {}
     for key in orig:
@@ -44,6 +62,10 @@ def compare_compression(
         "modified": modif,
         "delta": delta,
     }
+    if enc_stats is not None and len(enc_stats):
+        result["modified_encoder_stats"] = _summarise_stats(enc_stats)
+    if COMPARE_PER_FRAME:
+        result["per_frame"] = compare_per_frame(original_path, overlay_path, output_dir)
 
     out_path = output_dir / "compression_comparison.json"
     out_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
@@ -51,9 +73,9 @@ def compare_compression(
     return result
 
 
-def _get_metrics(video_path: Path) -> dict[str, float]:
+def _get_metrics(video_path: Path) -> tuple[dict[str, float], float]:
     """
-    Extract the three key metrics we compare.
+    Extract the three key metrics we compare, plus the frame rate.
 
     - file_size_bytes: total container size
     - avg_bitrate_kbps: overall bitrate
@@ -80,4 +102,29 @@ def _get_metrics(video_path: Path) -> dict[str, float]:
         "file_size_bytes": float(file_size),
         "avg_bitrate_kbps": round(bitrate, 2),
         "avg_frame_size_bytes": round(avg_frame_size, 2),
+    }, fps
+
+
+def _metrics_from_stats(video_path: Path, stats: pd.DataFrame, fps: float) -> dict[str, float]:
+    """Same three metrics from the encoder's own frame log — no ffprobe."""
+    file_size = video_path.stat().st_size
+    total_frames = len(stats)
+    duration = total_frames / fps if fps else 1.0
+    return {
+        "file_size_bytes": float(file_size),
+        "avg_bitrate_kbps": round(file_size * 8 / duration / 1000, 2),
+        "avg_frame_size_bytes": round(file_size / total_frames, 2),
+    }
+
+
+def _summarise_stats(stats: pd.DataFrame) -> dict[str, Any]:
+    """Per-type frame count, mean QP and mean coded size from the x264 log."""
+    grouped = stats.groupby("pict_type")
+    return {
+        t: {
+            "count": int(len(g)),
+            "avg_qp": round(float(g["qp"].mean()), 2),
+            "avg_size_bytes": round(float(g["size_bytes"].mean()), 1),
+        }
+        for t, g in grouped
     }
@@ -0,0 +1,143 @@
+"""
+CRF x preset encode sweep with rate-distortion curves.
+
+``compare_compression`` looks at one encode (``CRF_VALUE`` / ``PRESET``).
+To tune those, the sweep:
+
+1. Decodes and composites the overlay once, writing the finished raw
+   ``yuv420p`` frames to one cache file (``_composited.yuv``).
+2. Encodes that cache for every CRF x preset point in a process pool.
+   Each worker maps the cache with ``np.memmap`` and pipes it into its
+   own ``FrameSink``, so nothing is decoded or drawn twice.
+3. Measures each encode: size, bitrate, encode fps, and PSNR against
+   the cached frames (FFmpeg's ``psnr`` filter).
+
+Results go to ``encode_sweep.csv`` plus an RD chart (``encode_sweep.png``).
+"""
+
+import itertools
+import logging
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config import (
+    RECT_OPACITY, RECT_COLOR, SWEEP_CRFS, SWEEP_PRESETS, SWEEP_MAX_FRAMES, SWEEP_WORKERS,
+)
+from src.ffmpeg_utils import run_ffmpeg
+from src.frame_sink import FrameSink
+from src.frame_source import FrameSource
+from src.utils.segments import default_workers
+from src.utils.thread_budget import limit_process, share
+from src.yuv_layout import frame_shape
+from .motion_logic import RectangleState, select_compositor
+from .visualizer import generate_sweep_chart
+
+logger = logging.getLogger("task3.sweep")
+
+_PSNR = re.compile(r"PSNR .*?average:(\S+)")
+
+
+class RawCache(NamedTuple):
+    """A file of back-to-back raw frames, ready for ``np.memmap``."""
+
+    path: Path
+    frames: int
+    pix_fmt: str
+    width: int
+    height: int
+    fps: float
+
+
+def composite_to_cache(input_path: Path, cache_path: Path,
+                       max_frames: Optional[int] = SWEEP_MAX_FRAMES) -> RawCache:
+    """Decode, draw the rectangle and append every frame to *cache_path*."""
+    draw, pix_fmt = select_compositor("yuv")   # half the bytes of bgr24
+    source = FrameSource(input_path, pix_fmt=pix_fmt, max_frames=max_frames)
+    state = RectangleState(source.width, source.height, source.fps)
+    count = 0
+    with open(cache_path, "wb") as f:
+        for frame in source:
+            cx, cy, angle, _, _ = state.update(frame.frame_number)
+            f.write(draw(frame.image, cx, cy, angle, RECT_OPACITY, RECT_COLOR).data)
+            count += 1
+    logger.info("Cached %d composited frames (%.0f MB)", count,
+                cache_path.stat().st_size / 1e6)
+    return RawCache(cache_path, count, pix_fmt, source.width, source.height, source.fps)
+
+
+def _encode_point(job: tuple) -> dict:
+    """Encode the cache at one (crf, preset); runs in a worker process."""
+    cache, crf, preset, output, threads = job
+    limit_process(threads)
+    frames = np.memmap(cache.path, dtype=np.uint8, mode="r",
+                       shape=(cache.frames, *frame_shape(cache.pix_fmt, cache.width, cache.height)))
+    start = time.perf_counter()
+    with FrameSink(output, cache.width, cache.height, cache.fps, pix_fmt=cache.pix_fmt,
+                   crf=crf, preset=preset) as sink:
+        for image in frames:
+            sink.write(image)
+    elapsed = time.perf_counter() - start
+
+    size = output.stat().st_size
+    duration = cache.frames / cache.fps
+    return {
+        "crf": crf, "preset": preset,
+        "size_bytes": size,
+        "bitrate_kbps": round(size * 8 / duration / 1000, 2),
+        "encode_sec": round(elapsed, 2),
+        "encode_fps": round(cache.frames / elapsed, 1),
+        "psnr_db": _psnr(cache, output),
+    }
+
+
+def _psnr(cache: RawCache, encoded: Path) -> float:
+    """Average PSNR (dB) of *encoded* against the cached source frames."""
+    result = run_ffmpeg([
+        "ffmpeg", "-i", str(encoded),
+        "-f", "rawvideo", "-pix_fmt", cache.pix_fmt,
+        "-s", f"{cache.width}x{cache.height}", "-framerate", f"{cache.fps:.6f}",
+        "-i", str(cache.path),
+        "-lavfi", "[0:v][1:v]psnr", "-f", "null", "-",
+    ], timeout=600)
+    match = _PSNR.search(result.stderr)
+    return round(float(match.group(1)), 2) if match else float("nan")
+
+
+def run_sweep(
+    input_path: Path, output_dir: Path,
+    crfs=SWEEP_CRFS, presets=SWEEP_PRESETS, workers: Optional[int] = SWEEP_WORKERS,
+) -> pd.DataFrame:
+    """
+    Composite once, encode every CRF x preset point in parallel, report.
+
+    Returns:
+        One row per point: crf, preset, size_bytes, bitrate_kbps,
+        encode_sec, encode_fps, psnr_db. Saved as ``encode_sweep.csv``.
+    """
+    sweep_dir = output_dir / "encode_sweep"
+    sweep_dir.mkdir(parents=True, exist_ok=True)
+    cache = composite_to_cache(input_path, sweep_dir / "_composited.yuv")
+
+    points = [(crf, preset) for preset, crf in itertools.product(presets, crfs)]
+    workers = min(workers or default_workers(), len(points))
+    threads = share(workers)
+    jobs = [(cache, crf, preset, sweep_dir / f"crf{crf}_{preset}.mp4", threads)
+            for crf, preset in points]
+    logger.info("Encoding %d sweep points with %d workers", len(jobs), workers)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_encode_point, jobs))
+    finally:
+        cache.path.unlink()
+
+    table = pd.DataFrame(rows)
+    table.to_csv(output_dir / "encode_sweep.csv", index=False)
+    logger.info("Saved encode_sweep.csv\n%s", table.to_string(index=False))
+    generate_sweep_chart(table, output_dir)
+    return table
@@ -0,0 +1,150 @@
+"""
+Pure-FFmpeg rectangle overlay: the whole render in one filtergraph.
+
+The OpenCV engine hands every frame to Python to draw the rectangle.
+For a plain shape FFmpeg can do it natively, so this engine compiles the
+motion model and ``RECT_*`` config into a filtergraph instead::
+
+    color ─▶ format=rgba ─▶ colorchannelmixer (alpha) ─▶ rotate ─┐
+    input video ─▶ setpts(N) ────────────────────────────────▶ overlay(x(t), y(t)) ─▶ libx264
+
+The overlay position is the closed-form trajectory written as an FFmpeg
+expression of the frame number (``t`` times the frame rate), so decode,
+composite and encode all happen inside one FFmpeg process with no
+Python per-frame work.
+
+Rasterisation differs slightly from OpenCV (``rotate`` interpolates
+bilinearly), so keep ``OVERLAY_ENGINE = "opencv"`` for parity checks.
+Frames are retimed to the input's ``r_frame_rate``, which the colour
+source also runs at, while the audio is copied on its own timeline. An
+input with audio whose video is VFR or starts later than the file is
+therefore rendered by the OpenCV engine instead, with a warning.
+"""
+
+import logging
+import math
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.config import (
+    RECT_WIDTH, RECT_HEIGHT, RECT_OPACITY, RECT_COLOR, ROTATION_PERIOD,
+    CRF_VALUE, PRESET, CAPTURE_ENCODER_STATS,
+)
+from src.encoder_stats import parse_x264_stats, save_encoder_stats, x264_stats_args
+from src.ffmpeg_utils import parse_compact, run_ffmpeg, run_ffprobe_json, run_ffprobe_packets
+from .rectangle_overlay import render_overlay, write_log
+from .trajectory import BouncePlan, axis_plans, rectangle_trajectory, static_position
+
+logger = logging.getLogger("task3.ffmpeg_overlay")
+
+
+def _axis_expr(plan: Optional[BouncePlan], size: int, frame_rate: str) -> str:
+    """FFmpeg expression for one axis' centre at the current frame (see ``trajectory``)."""
+    if plan is None:
+        return f"{static_position(size)!r}"
+    # Moves so far = frame number + 1. The frame number comes from the
+    # timestamp: overlay's own ``n`` is off by one in some FFmpeg releases.
+    s = f"(round(t*{frame_rate})+1)"
+    m = f"mod({s}-{plan.first_hit},{2 * plan.leg})"
+    bounced = (f"if(lt({m},{plan.leg}),"
+               f"{plan.first_wall!r}+({plan.away!r})*{m}*{plan.speed!r},"
+               f"{plan.other_wall!r}-({plan.away!r})*({m}-{plan.leg})*{plan.speed!r})")
+    return f"if(lt({s},{plan.first_hit}),{plan.start!r}+{s}*({plan.velocity!r}),{bounced})"
+
+
+def build_filtergraph(frame_w: int, frame_h: int, frame_rate: str) -> str:
+    """
+    Compile the rectangle motion model into a ``-filter_complex`` string.
+
+    Args:
+        frame_w, frame_h: Input frame size.
+        frame_rate: Input ``r_frame_rate`` (e.g. ``"30000/1001"``).
+
+    Returns:
+        Filtergraph reading ``[0:v]`` and producing ``[v]``.
+    """
+    # Same square canvas as the OpenCV sprite: the centre is side / 2
+    side = int(math.ceil(math.hypot(RECT_WIDTH, RECT_HEIGHT))) + 2
+    b, g, r = RECT_COLOR
+    plan_x, plan_y = axis_plans(frame_w, frame_h)
+    # +0.5 then overlay's truncation == round(), like the OpenCV engine
+    x = f"{_axis_expr(plan_x, frame_w, frame_rate)}-{side // 2}+0.5"
+    y = f"{_axis_expr(plan_y, frame_h, frame_rate)}-{side // 2}+0.5"
+    angle = f"2*PI*n/({frame_rate}*{ROTATION_PERIOD!r})"
+    return (
+        f"color=c=0x{r:02X}{g:02X}{b:02X}:s={RECT_WIDTH}x{RECT_HEIGHT}:r={frame_rate},"
+        f"format=rgba,colorchannelmixer=aa={RECT_OPACITY},"
+        f"rotate=a='{angle}':ow={side}:oh={side}:c=black@0[rect];"
+        # Constant-rate timestamps from 0, like the frames the OpenCV engine
+        # pipes in — so t * frame_rate is exactly the frame number
+        f"[0:v]setpts=N/({frame_rate})/TB[main];"
+        # yuv444 overlay: no chroma alignment, so x/y land on exact pixels
+        f"[main][rect]overlay=x='{x}':y='{y}':eval=frame:shortest=1:format=yuv444[v]"
+    )
+
+
+def render_overlay_ffmpeg(input_path: Path, output_dir: Path) -> Path:
+    """
+    Render ``overlay_video.mp4`` with a single FFmpeg process.
+
+    Writes the same ``rectangle_log.csv`` as the OpenCV engine (from the
+    vectorized trajectory and the input's packet timestamps) and, with
+    ``CAPTURE_ENCODER_STATS``, the libx264 stats sidecar.
+
+    Returns:
+        Path to the final ``overlay_video.mp4``.
+    """
+    probe = run_ffprobe_json(input_path)
+    video = next(s for s in probe["streams"] if s.get("codec_type") == "video")
+    w, h = int(video["width"]), int(video["height"])
+    frame_rate = video.get("r_frame_rate", "30/1")
+    num, den = (int(v) for v in frame_rate.split("/"))
+    pts = np.sort([float(p["pts_time"]) for p in
+                   parse_compact(run_ffprobe_packets(input_path, entries="pts_time"))
+                   if p.get("pts_time", "N/A") != "N/A"])
+    shift = _retime_shift(pts, float(probe.get("format", {}).get("start_time") or 0.0),
+                          num / den)
+    if shift and any(s.get("codec_type") == "audio" for s in probe["streams"]):
+        logger.warning("%s: retimed video would drift from the copied audio; "
+                       "using the OpenCV engine", shift)
+        return render_overlay(input_path, output_dir)
+
+    final_path = output_dir / "overlay_video.mp4"
+    stats_prefix = output_dir / "_overlay_x264"
+    run_ffmpeg([
+        "ffmpeg", "-y",
+        "-i", str(input_path),
+        "-filter_complex", build_filtergraph(w, h, frame_rate),
+        "-map", "[v]", "-map", "0:a?",
+        "-fps_mode", "passthrough",   # one output frame per input frame
+        "-c:v", "libx264", "-crf", str(CRF_VALUE), "-preset", PRESET,
+        "-pix_fmt", "yuv420p",
+        "-c:a", "copy",
+        *(x264_stats_args(stats_prefix) if CAPTURE_ENCODER_STATS else []),
+        str(final_path),
+    ], timeout=600)
+
+    cx, cy, angle, vx, vy = rectangle_trajectory(w, h, num / den, np.arange(len(pts)))
+    write_log([[n, round(float(pts[n]), 4), round(float(cx[n]), 1), round(float(cy[n]), 1),
+                 round(float(angle[n]), 2), round(float(vx[n]), 1), round(float(vy[n]), 1)]
+                for n in range(len(pts))], output_dir)
+
+    if CAPTURE_ENCODER_STATS:
+        save_encoder_stats(parse_x264_stats(stats_prefix), final_path)
+    logger.info("Created %s (FFmpeg filtergraph engine)", final_path.name)
+    return final_path
+
+
+def _retime_shift(pts: np.ndarray, file_start: float, fps: float) -> Optional[str]:
+    """Why ``setpts=N/rate`` would move the video against the audio, or None."""
+    if not len(pts):
+        return None
+    offset = float(pts[0]) - file_start
+    if abs(offset) > 0.5 / fps:
+        return f"video starts {offset:.3f} s into the file"
+    drift = float(np.abs(pts - pts[0] - np.arange(len(pts)) / fps).max())
+    if drift > 0.5 / fps:
+        return f"frame times drift up to {drift:.3f} s from a constant {fps:.3f} fps"
+    return None
@@ -0,0 +1,123 @@
+"""
+Per-frame quality and size comparison of the original and overlay videos.
+
+The container-level comparison says *how much* bigger the overlay video
+is; this says *where*. One FFmpeg process decodes both videos side by
+side (each input on its own decoder thread) and runs the ``psnr`` and
+``ssim`` filters over every frame pair. Meanwhile two ffprobe packet
+listings (demux only, no decode) give the coded size of every frame in
+each file. All three run concurrently.
+
+The result is ``frame_comparison.csv`` — one compact row per frame::
+
+    frame, pts_time, key, orig_bytes, mod_bytes, delta_bytes, delta_pct, psnr_db, ssim
+
+``key`` marks keyframes of the original. Aggregates (exact mean frame
+sizes, quality spread, worst frames) are returned for
+``compression_comparison.json``.
+"""
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.ffmpeg_utils import parse_compact, run_ffmpeg, run_ffprobe_packets
+
+logger = logging.getLogger("task3.frame_compare")
+
+_FRAME = re.compile(r"frame:(\d+)\s+pts:\S+\s+pts_time:(\S+)")
+_METRIC = re.compile(r"lavfi\.(psnr\.psnr_avg|ssim\.All)=(\S+)")
+
+
+def compare_per_frame(original_path: Path, overlay_path: Path,
+                      output_dir: Path) -> dict[str, Any]:
+    """
+    Join per-frame PSNR/SSIM with per-frame coded sizes of both videos.
+
+    Saves ``frame_comparison.csv`` and returns aggregate numbers.
+    """
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        quality = pool.submit(_frame_quality, original_path, overlay_path)
+        orig = pool.submit(_frame_sizes, original_path)
+        modif = pool.submit(_frame_sizes, overlay_path)
+        table = quality.result()
+        orig_sizes, modif_sizes = orig.result(), modif.result()
+
+    count = min(len(table), len(orig_sizes), len(modif_sizes))
+    table = table.iloc[:count].copy()
+    table["key"] = orig_sizes["key"].to_numpy()[:count]
+    table["orig_bytes"] = orig_sizes["size"].to_numpy()[:count]
+    table["mod_bytes"] = modif_sizes["size"].to_numpy()[:count]
+    table["delta_bytes"] = table["mod_bytes"] - table["orig_bytes"]
+    table["delta_pct"] = (table["delta_bytes"] / table["orig_bytes"].clip(lower=1) * 100).round(2)
+    table = table[["frame", "pts_time", "key", "orig_bytes", "mod_bytes",
+                   "delta_bytes", "delta_pct", "psnr_db", "ssim"]]
+    table.to_csv(output_dir / "frame_comparison.csv", index=False)
+    logger.info("Saved frame_comparison.csv (%d frames)", count)
+    return _aggregate(table)
+
+
+def _frame_quality(original_path: Path, overlay_path: Path) -> pd.DataFrame:
+    """Per-frame PSNR (dB) and SSIM of the overlay video against the original."""
+    result = run_ffmpeg([
+        "ffmpeg", "-hide_banner", "-nostats",
+        "-i", str(original_path), "-i", str(overlay_path),
+        # psnr passes the overlay frame through, so ssim can follow it
+        "-filter_complex",
+        "[0:v]split[r1][r2];[1:v][r1]psnr[m];[m][r2]ssim,metadata=mode=print",
+        "-an", "-f", "null", "-",
+    ], timeout=1800)
+
+    rows: list[list] = []
+    for line in result.stderr.splitlines():
+        frame = _FRAME.search(line)
+        if frame:
+            rows.append([int(frame.group(1)), float(frame.group(2)), np.nan, np.nan])
+            continue
+        metric = _METRIC.search(line)
+        if metric and rows:
+            rows[-1][2 if metric.group(1).startswith("psnr") else 3] = float(metric.group(2))
+    return pd.DataFrame(rows, columns=["frame", "pts_time", "psnr_db", "ssim"]).round(4)
+
+
+def _frame_sizes(video_path: Path) -> pd.DataFrame:
+    """Coded size and keyframe flag of every video frame, in display order."""
+    packets = parse_compact(run_ffprobe_packets(video_path))
+    frame = pd.DataFrame({
+        "pts": [float(p["pts_time"]) if p.get("pts_time", "N/A") != "N/A" else np.nan
+                for p in packets],
+        "size": [int(p.get("size", 0)) for p in packets],
+        "key": [p.get("flags", "").startswith("K") for p in packets],
+    })
+    return frame.sort_values("pts", ignore_index=True)
+
+
+def _aggregate(table: pd.DataFrame) -> dict[str, Any]:
+    """Mean sizes, size growth per frame kind, quality spread, worst frames."""
+    psnr = table["psnr_db"].replace(np.inf, np.nan)
+    key = table["key"].astype(bool)
+
+    def mean_delta(mask: pd.Series) -> float:
+        return round(float(table.loc[mask, "delta_bytes"].mean()), 1) if mask.any() else 0.0
+
+    worst = table.nsmallest(5, "ssim")
+    return {
+        "frames": int(len(table)),
+        "avg_frame_size_bytes": {
+            "original": round(float(table["orig_bytes"].mean()), 2),
+            "modified": round(float(table["mod_bytes"].mean()), 2),
+        },
+        "avg_delta_bytes": {
+            "original_keyframes": mean_delta(key),
+            "other_frames": mean_delta(~key),
+        },
+        "psnr_db": {"mean": round(float(psnr.mean()), 2), "min": round(float(psnr.min()), 2)},
+        "ssim": {"mean": round(float(table["ssim"].mean()), 4),
+                 "min": round(float(table["ssim"].min()), 4)},
+        "worst_frames": worst["frame"].astype(int).tolist(),
+    }
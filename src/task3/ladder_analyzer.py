@@ -0,0 +1,126 @@
+"""
+Encoding-ladder analysis: one reference against N renditions.
+
+``compare_compression`` compares two files. An ABR ladder has 6-10
+renditions of one source, and on top of size and bitrate they must
+switch cleanly: every rendition needs its keyframes at the same
+timestamps, or a player changing rendition lands mid-GOP.
+
+Every file is probed concurrently (container JSON + a demux-only packet
+listing per file). Keyframe alignment is then pure numpy set algebra:
+keyframe times, measured from each file's first frame, are snapped to
+the reference frame grid and compared with ``intersect1d`` / ``setdiff1d``.
+
+Think of it like checking that every lane of a relay track has its
+hand-over line painted at the same spot.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.ffmpeg_utils import parse_compact, run_ffprobe_json, run_ffprobe_packets
+from src.utils.segments import default_workers
+
+logger = logging.getLogger("task3.ladder")
+
+
+def analyze_ladder(reference: Path, renditions: list[Path], output_dir: Path) -> pd.DataFrame:
+    """
+    Compare *renditions* with *reference* and write one consolidated report.
+
+    Saves ``ladder_report.json`` (per-file stats, alignment, keyframes
+    common to the whole ladder) and ``ladder_report.csv`` (one row per file).
+
+    Returns:
+        The per-file table, reference first.
+    """
+    paths = [reference, *renditions]
+    with ThreadPoolExecutor(max_workers=min(len(paths), default_workers())) as pool:
+        probes = list(pool.map(_probe, paths))
+
+    ref = probes[0]
+    grid = ref["fps"]                      # snap keyframe times to reference frames
+    ref_keys = _key_slots(ref["key_pts"], grid)
+    rows = []
+    for path, probe in zip(paths, probes):
+        keys = _key_slots(probe["key_pts"], grid)
+        missing = np.setdiff1d(ref_keys, keys)
+        extra = np.setdiff1d(keys, ref_keys)
+        rows.append({
+            "file": path.name,
+            "resolution": f"{probe['width']}x{probe['height']}",
+            "bitrate_kbps": probe["bitrate_kbps"],
+            "frames": probe["frames"],
+            "avg_frame_bytes": probe["avg_frame_bytes"],
+            "max_frame_bytes": probe["max_frame_bytes"],
+            "keyframes": int(len(keys)),
+            "avg_gop_sec": probe["avg_gop_sec"],
+            "aligned_keyframes": int(len(np.intersect1d(ref_keys, keys))),
+            "missing_keyframes": int(len(missing)),
+            "extra_keyframes": int(len(extra)),
+            "first_mismatch_sec": _first_mismatch(missing, extra, grid),
+        })
+    table = pd.DataFrame(rows)
+
+    common = reduce(np.intersect1d, (_key_slots(p["key_pts"], grid) for p in probes))
+    report: dict[str, Any] = {
+        "reference": reference.name,
+        "renditions": table.to_dict(orient="records"),
+        "ladder_aligned": bool((table["missing_keyframes"] == 0).all()
+                               and (table["extra_keyframes"] == 0).all()),
+        "common_keyframes": int(len(common)),
+        "common_keyframe_times_sec": [round(float(k / grid), 4) for k in common],
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "ladder_report.json").write_text(json.dumps(report, indent=2),
+                                                   encoding="utf-8")
+    table.to_csv(output_dir / "ladder_report.csv", index=False)
+    logger.info("Saved ladder_report.json (%d renditions, aligned=%s)",
+                len(renditions), report["ladder_aligned"])
+    return table
+
+
+def _probe(path: Path) -> dict[str, Any]:
+    """Container facts plus per-packet sizes and keyframe times of one file."""
+    raw = run_ffprobe_json(path)
+    video = next((s for s in raw.get("streams", []) if s.get("codec_type") == "video"), {})
+    num, den = (int(x) for x in video.get("r_frame_rate", "30/1").split("/"))
+    packets = parse_compact(run_ffprobe_packets(path))
+    pts = np.array([float(p.get("pts_time", "nan").replace("N/A", "nan")) for p in packets])
+    sizes = np.array([int(p.get("size", 0)) for p in packets])
+    key = np.array([p.get("flags", "").startswith("K") for p in packets], dtype=bool)
+
+    # Relative to the first frame: renditions muxed with different start
+    # offsets (edit lists, TS start_time) still line up
+    start = float(np.nanmin(pts)) if (~np.isnan(pts)).any() else 0.0
+    key_pts = np.sort(pts[key & ~np.isnan(pts)]) - start
+    duration = float(raw.get("format", {}).get("duration", 0)) or float(np.nanmax(pts, initial=0))
+    return {
+        "width": int(video.get("width", 0)),
+        "height": int(video.get("height", 0)),
+        "fps": num / den if den else 30.0,
+        "frames": int(len(sizes)),
+        "bitrate_kbps": round(sizes.sum() * 8 / duration / 1000, 2) if duration else 0.0,
+        "avg_frame_bytes": round(float(sizes.mean()), 1) if len(sizes) else 0.0,
+        "max_frame_bytes": int(sizes.max(initial=0)),
+        "avg_gop_sec": round(float(np.diff(key_pts).mean()), 3) if len(key_pts) > 1 else duration,
+        "key_pts": key_pts,
+    }
+
+
+def _key_slots(key_pts: np.ndarray, fps: float) -> np.ndarray:
+    """Keyframe times (from the first frame) as unique reference-frame indices."""
+    return np.unique(np.rint(key_pts * fps).astype(np.int64))
+
+
+def _first_mismatch(missing: np.ndarray, extra: np.ndarray, fps: float):
+    """Earliest timestamp where the keyframes disagree, or None if aligned."""
+    diff = np.union1d(missing, extra)
+    return round(float(diff[0] / fps), 4) if len(diff) else None
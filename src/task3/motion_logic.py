@@ -6,18 +6,23 @@ bounces off the frame edges, and rotates 360 degrees every 5 seconds.
 Think of it like a DVD screensaver logo bouncing around the screen.
 """
 
-import math
-from typing import Tuple
+from typing import Callable, Tuple
 
 import numpy as np
 
-from src.config import (
-    RECT_WIDTH, RECT_HEIGHT, VELOCITY_X, VELOCITY_Y, ROTATION_PERIOD,
-)
+from src.config import RECT_WIDTH, RECT_HEIGHT, VELOCITY_X, VELOCITY_Y, OVERLAY_BLEND
+from .trajectory import rectangle_at
 
 
 class RectangleState:
-    """Track position, velocity, and rotation of the overlay rectangle."""
+    """
+    Track position, velocity, and rotation of the overlay rectangle.
+
+    Along an axis shorter than the rectangle's diagonal the rectangle now
+    stays centred with zero velocity. The old per-frame clamp pinned it to
+    one wall, then the other, on alternate frames, so it jumped back and
+    forth by ``2 * half_diag - size`` pixels every frame.
+    """
 
     def __init__(self, frame_w: int, frame_h: int, fps: float) -> None:
         """
@@ -40,37 +45,16 @@ class RectangleState:
 
     def update(self, frame_num: int) -> Tuple[float, float, float, float, float]:
         """
-        Advance the rectangle by one frame.
+        Advance the rectangle to *frame_num*.
+
+        Uses the closed-form trajectory, so the state is exact for any
+        frame — segments rendered independently match a sequential run.
 
         Returns:
             (cx, cy, angle_deg, vx, vy) after the update.
         """
-        # Move
-        self.cx += self.vx
-        self.cy += self.vy
-
-        # Bounce off edges — keep rectangle fully inside the frame.
-        # The bounding box of a rotated 200x100 rect can be up to ~224 px
-        # so we use half the diagonal as safe margin.
-        half_diag = math.sqrt(RECT_WIDTH**2 + RECT_HEIGHT**2) / 2.0
-
-        if self.cx - half_diag < 0:
-            self.cx = half_diag
-            self.vx = abs(self.vx)
-        elif self.cx + half_diag > self.frame_w:
-            self.cx = self.frame_w - half_diag
-            self.vx = -abs(self.vx)
-
-        if self.cy - half_diag < 0:
-            self.cy = half_diag
-            self.vy = abs(self.vy)
-        elif self.cy + half_diag > self.frame_h:
-            self.cy = self.frame_h - half_diag
-            self.vy = -abs(self.vy)
-
-        # Rotation: 360 degrees every ROTATION_PERIOD seconds
-        angle_deg = (360.0 * frame_num) / (self.fps * ROTATION_PERIOD) % 360.0
-
+        self.cx, self.cy, angle_deg, self.vx, self.vy = rectangle_at(
+            self.frame_w, self.frame_h, self.fps, frame_num)
         return self.cx, self.cy, angle_deg, self.vx, self.vy
 
 
@@ -100,3 +84,20 @@ def draw_rotated_rectangle(
     # Alpha-blend: result = opacity * overlay + (1 - opacity) * original
     cv2.addWeighted(overlay, opacity, frame, 1 - opacity, 0, dst=frame)
     return frame
+
+
+def select_compositor(blend: str = OVERLAY_BLEND) -> Tuple[Callable[..., np.ndarray], str]:
+    """
+    Drawing function and raw frame layout for an ``OVERLAY_BLEND`` mode.
+
+    ``"full"`` and ``"roi"`` draw on ``bgr24`` frames; ``"yuv"`` blends
+    into the decoder's native ``yuv420p`` planes.
+    """
+    from .sprite_cache import draw_rotated_rectangle_roi
+    from .yuv_compositor import draw_rotated_rectangle_yuv
+
+    if blend == "yuv":
+        return draw_rotated_rectangle_yuv, "yuv420p"
+    if blend == "roi":
+        return draw_rotated_rectangle_roi, "bgr24"
+    return draw_rotated_rectangle, "bgr24"
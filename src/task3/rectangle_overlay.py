@@ -1,85 +1,128 @@
 """
 Core rendering pipeline: decompress -> draw rectangle -> recompress.
 
-Reads every frame with OpenCV, draws a semi-transparent rotating
-rectangle, writes to a temp file, then remuxes audio (if present)
-via FFmpeg to produce the final output.
+Decodes every frame through an FFmpeg pipe (``FrameSource``), draws a
+semi-transparent rotating rectangle with OpenCV, and pipes the raw frame
+straight into a single FFmpeg libx264 encode that also copies the
+original audio (if present).
 """
 
 import csv
 import logging
-import subprocess
 from pathlib import Path
-
-import cv2
-import numpy as np
+from typing import Optional
 
 from src.config import (
-    RECT_OPACITY, RECT_COLOR, CRF_VALUE, PRESET, TASK3_OUTPUT_DIR, FFMPEG_DIR,
+    RECT_OPACITY, RECT_COLOR, CAPTURE_ENCODER_STATS,
+    RENDER_WORKERS, RENDER_QUEUE_SIZE, RENDER_SEGMENT_PARALLEL, RENDER_SEGMENT_WORKERS,
+    RENDER_CHECKPOINT,
 )
-from src.ffmpeg_utils import _bin
-from .motion_logic import RectangleState, draw_rotated_rectangle
+from src.encoder_stats import parse_x264_stats, save_encoder_stats, x264_stats_args
+from src.frame_sink import FrameSink
+from src.frame_source import FrameSource
+from src.utils.segments import default_workers, plan_segments
+from src.utils.thread_budget import claim, reserve
+from .checkpoint import render_checkpointed
+from .motion_logic import RectangleState, select_compositor
+from .render_pipeline import run_pipeline
+from .segment_render import render_segmented
 
 logger = logging.getLogger("task3.overlay")
 
 
-def render_overlay(input_path: Path, output_dir: Path) -> Path:
+def render_overlay(
+    input_path: Path, output_dir: Path,
+    parallel: bool = RENDER_SEGMENT_PARALLEL,
+    workers: Optional[int] = RENDER_SEGMENT_WORKERS,
+    checkpoint: bool = RENDER_CHECKPOINT,
+) -> Path:
     """
     Render the rectangle overlay on every frame and save the result.
 
     Steps:
-    1. Open video with OpenCV, read resolution and fps.
-    2. For each frame: compute position/angle, draw rectangle, write frame.
-    3. If original has audio, remux audio track into the output via FFmpeg.
+    1. Open the video as a ``FrameSource`` (resolution, fps, exact PTS).
+    2. Start one FFmpeg libx264 encode reading raw frames from a pipe
+       and copying the original audio track.
+    3. For each frame: compute position/angle, draw rectangle, pipe frame.
+       ``OVERLAY_BLEND = "roi"`` blends a cached sprite into the bounding
+       box only; ``"full"`` keeps the original whole-frame blend;
+       ``"yuv"`` blends into the native YUV420 planes (no BGR round-trip).
+       With ``RENDER_WORKERS > 0`` decode, drawing and encoding overlap
+       in a threaded pipeline (see ``render_pipeline``).
+
+    With *parallel*, keyframe-aligned segments are rendered in separate
+    processes and concatenated (see ``segment_render``). With
+    *checkpoint*, finished segments are committed to disk and an
+    interrupted render resumes where it stopped (see ``checkpoint``).
+
+    With ``CAPTURE_ENCODER_STATS`` libx264's per-frame stats are saved
+    as a sidecar CSV, so the compression analysis needs no extra probe.
 
     Returns:
         Path to the final ``overlay_video.mp4``.
     """
-    cap = cv2.VideoCapture(str(input_path))
-    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-    w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    final_path = output_dir / "overlay_video.mp4"
 
-    # Temp output (no audio) — will be remuxed afterwards
-    temp_path = output_dir / "_temp_overlay.mp4"
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    writer = cv2.VideoWriter(str(temp_path), fourcc, fps, (w, h))
+    if checkpoint:
+        rows = render_checkpointed(input_path, final_path,
+                                   (workers or default_workers()) if parallel else 1)
+        write_log(rows, output_dir)
+        return final_path
+
+    if parallel:
+        workers = workers or default_workers()
+        segments = plan_segments(input_path, workers)
+        if len(segments) > 1:
+            rows = render_segmented(input_path, final_path, segments, workers,
+                                    CAPTURE_ENCODER_STATS)
+            write_log(rows, output_dir)
+            return final_path
+        logger.info("Only one keyframe-aligned segment — rendering in one pass")
+
+    draw, pix_fmt = select_compositor()
+    source = FrameSource(input_path, pix_fmt=pix_fmt)
+    fps, w, h = source.fps, source.width, source.height
+    stats_prefix = output_dir / "_overlay_x264"
+    stats_args = x264_stats_args(stats_prefix) if CAPTURE_ENCODER_STATS else []
 
     state = RectangleState(w, h, fps)
     log_rows: list[list] = []
 
-    for n in range(total):
-        ok, frame = cap.read()
-        if not ok:
-            break
-
+    def prepare(frame) -> tuple[float, float, float]:
+        n, pts = frame.frame_number, frame.pts_time
         cx, cy, angle, vx, vy = state.update(n)
-        draw_rotated_rectangle(frame, cx, cy, angle, RECT_OPACITY, RECT_COLOR)
-        writer.write(frame)
-
-        log_rows.append([n, round(n / fps, 4), round(cx, 1), round(cy, 1),
+        log_rows.append([n, round(pts, 4), round(cx, 1), round(cy, 1),
                          round(angle, 2), round(vx, 1), round(vy, 1)])
-
         if n % 200 == 0:
-            logger.info("Frame %d / %d", n, total)
-
-    cap.release()
-    writer.release()
+            logger.info("Frame %d", n)
+        return cx, cy, angle
+
+    def composite(image, params) -> None:
+        cx, cy, angle = params
+        draw(image, cx, cy, angle, RECT_OPACITY, RECT_COLOR)
+
+    # decode, draw and encode run at once and split the CPU budget three ways
+    with reserve(3), claim(), FrameSink(final_path, w, h, fps, audio_from=input_path,
+                                        pix_fmt=pix_fmt, extra_args=stats_args) as sink:
+        if RENDER_WORKERS > 0:
+            run_pipeline(source, sink, prepare, composite,
+                         workers=RENDER_WORKERS, queue_size=RENDER_QUEUE_SIZE)
+        else:
+            for frame in source:
+                composite(frame.image, prepare(frame))
+                sink.write(frame.image)
 
     # Save position log CSV
-    _write_log(log_rows, output_dir)
+    write_log(log_rows, output_dir)
 
-    # Remux: re-encode video with libx264 + copy audio if present
-    final_path = output_dir / "overlay_video.mp4"
-    _remux(input_path, temp_path, final_path)
-    temp_path.unlink(missing_ok=True)
+    if CAPTURE_ENCODER_STATS:
+        save_encoder_stats(parse_x264_stats(stats_prefix), final_path)
 
     logger.info("Created %s", final_path.name)
     return final_path
 
 
-def _write_log(rows: list[list], output_dir: Path) -> None:
+def write_log(rows: list[list], output_dir: Path) -> None:
     """Save per-frame rectangle state as CSV."""
     path = output_dir / "rectangle_log.csv"
     with open(path, "w", newline="", encoding="utf-8") as f:
@@ -88,19 +131,3 @@ def _write_log(rows: list[list], output_dir: Path) -> None:
                      "angle_degrees", "velocity_x", "velocity_y"])
         w.writerows(rows)
     logger.info("Saved rectangle_log.csv (%d rows)", len(rows))
-
-
-def _remux(original: Path, temp_video: Path, final: Path) -> None:
-    """Re-encode video to H.264 and copy audio from original if present."""
-    cmd = [
-        _bin("ffmpeg"), "-y",
-        "-i", str(temp_video),
-        "-i", str(original),
-        "-map", "0:v:0",
-        "-map", "1:a?",
-        "-c:v", "libx264", "-crf", str(CRF_VALUE), "-preset", PRESET,
-        "-c:a", "copy",
-        "-shortest",
-        str(final),
-    ]
-    subprocess.run(cmd, capture_output=True, text=True, timeout=600)
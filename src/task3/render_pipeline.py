@@ -0,0 +1,118 @@
+"""
+Threaded decode -> composite -> encode pipeline with bounded queues.
+
+Stages::
+
+    reader thread ──▶ [jobs queue] ──▶ N compositor threads ──▶ [done queue]
+                                                                    │
+                      writer (calling thread) ◀── reorder buffer ◀──┘
+
+- The reader pulls frames from a ``FrameSource`` and runs the cheap,
+  order-dependent ``prepare`` step (e.g. the bouncing-rectangle state).
+- Compositors run ``composite`` in parallel; OpenCV releases the GIL.
+- The writer puts frames back in order and feeds the ``FrameSink``.
+
+A semaphore caps the number of frames in flight, so a slow encoder
+stalls the reader (backpressure) and memory stays bounded. The
+source's buffer ring is sized to that cap so no buffer is reused early.
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable
+
+import numpy as np
+
+from src.frame_source import Frame, FrameSource
+from src.frame_sink import FrameSink
+
+logger = logging.getLogger("task3.pipeline")
+
+_DONE = object()
+
+
+def run_pipeline(
+    source: FrameSource,
+    sink: FrameSink,
+    prepare: Callable[[Frame], Any],
+    composite: Callable[[np.ndarray, Any], None],
+    workers: int = 2,
+    queue_size: int = 8,
+) -> int:
+    """
+    Stream every frame of *source* through *composite* into *sink*.
+
+    Args:
+        source: Decoded frames (its ring is resized to the in-flight cap).
+        sink: Encoder receiving frames in display order.
+        prepare: Called in frame order on the reader thread; returns the
+            per-frame parameters handed to *composite*.
+        composite: Draws on the frame in place, on a worker thread.
+        workers: Number of compositor threads.
+        queue_size: Max frames waiting in each queue.
+
+    Returns:
+        Number of frames written.
+    """
+    workers = max(workers, 1)
+    in_flight = 2 * queue_size + workers
+    source.resize_ring(in_flight + 1)
+
+    slots = threading.Semaphore(in_flight)
+    jobs: queue.Queue = queue.Queue(maxsize=queue_size)
+    done: queue.Queue = queue.Queue(maxsize=queue_size)
+    errors: list[BaseException] = []
+
+    def reader() -> None:
+        try:
+            for frame in source:
+                slots.acquire()
+                if errors:
+                    break
+                jobs.put((frame.frame_number, frame.image, prepare(frame)))
+        except BaseException as exc:   # surfaced by the writer
+            errors.append(exc)
+        finally:
+            for _ in range(workers):
+                jobs.put(_DONE)
+
+    def compositor() -> None:
+        while (job := jobs.get()) is not _DONE:
+            n, image, params = job
+            try:
+                composite(image, params)
+            except BaseException as exc:
+                errors.append(exc)
+            done.put((n, image))
+        done.put(_DONE)
+
+    threads = [threading.Thread(target=reader, daemon=True)]
+    threads += [threading.Thread(target=compositor, daemon=True) for _ in range(workers)]
+    for t in threads:
+        t.start()
+
+    pending: dict[int, np.ndarray] = {}
+    next_n = finished = 0
+    while finished < workers:
+        item = done.get()
+        if item is _DONE:
+            finished += 1
+            continue
+        pending[item[0]] = item[1]
+        while next_n in pending:                 # in-order reassembly
+            image = pending.pop(next_n)
+            if not errors:
+                try:
+                    sink.write(image)
+                except BaseException as exc:     # keep draining so threads exit
+                    errors.append(exc)
+            next_n += 1
+            slots.release()
+
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+    logger.info("Pipeline wrote %d frames with %d compositor(s)", next_n, workers)
+    return next_n
@@ -0,0 +1,116 @@
+"""
+Scene description for multi-object overlay stress tests.
+
+A scene is a list of ``SceneObject`` s — boxes, text labels or logo
+masks — each with its own size, colour, opacity, velocity, rotation
+speed and z-order. Objects bounce like the Task 3 rectangle, and all
+their states for a frame are computed at once with numpy.
+
+Scenes are plain JSON (a list of objects with the ``SceneObject`` field
+names), or generated at random for quick stress tests.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from .trajectory import bounce_many
+
+logger = logging.getLogger("task3.scene")
+
+
+class SceneObject(NamedTuple):
+    """One moving, rotating, semi-transparent overlay object."""
+
+    kind: str = "box"            # "box", "text" or "logo"
+    width: int = 200             # Box size; text height in px; logo scale box
+    height: int = 100
+    color: tuple[int, int, int] = (0, 0, 255)   # BGR
+    opacity: float = 0.7
+    x: float = 0.0               # Start centre (pixels)
+    y: float = 0.0
+    vx: float = 0.0              # Pixels per frame
+    vy: float = 0.0
+    rotation_period: float = 0.0  # Seconds per turn (0 = no rotation)
+    angle: float = 0.0           # Start angle (degrees)
+    z: int = 0                   # Higher is drawn on top
+    text: str = ""               # Text for "text", image path for "logo"
+
+
+def load_scene(path: Path) -> list[SceneObject]:
+    """Read a JSON list of objects (keys = ``SceneObject`` fields)."""
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    objects = [SceneObject(**{**o, "color": tuple(o.get("color", (0, 0, 255)))})
+               for o in raw]
+    for i, o in enumerate(objects):
+        if o.kind in ("text", "logo") and not o.text:
+            raise ValueError(f"Scene object {i} ({o.kind}) needs a non-empty 'text'")
+    logger.info("Loaded %d scene objects from %s", len(objects), Path(path).name)
+    return objects
+
+
+def save_scene(objects: list[SceneObject], path: Path) -> None:
+    """Write *objects* as JSON that :func:`load_scene` reads back."""
+    Path(path).write_text(json.dumps([o._asdict() for o in objects], indent=2),
+                          encoding="utf-8")
+
+
+def random_scene(count: int, frame_w: int, frame_h: int, seed: int = 0) -> list[SceneObject]:
+    """*count* random boxes and text labels spread over the frame."""
+    rng = np.random.default_rng(seed)
+    objects = []
+    for i in range(count):
+        w, h = int(rng.integers(20, 160)), int(rng.integers(12, 90))
+        objects.append(SceneObject(
+            kind="text" if i % 5 == 4 else "box",
+            width=w, height=h,
+            color=tuple(int(c) for c in rng.integers(0, 256, 3)),
+            opacity=float(rng.uniform(0.3, 0.9)),
+            x=float(rng.uniform(0, frame_w)), y=float(rng.uniform(0, frame_h)),
+            vx=float(rng.uniform(-8, 8)), vy=float(rng.uniform(-8, 8)),
+            rotation_period=float(rng.choice([0.0, 2.0, 5.0, 10.0])),
+            angle=float(rng.uniform(0, 360)),
+            z=int(rng.integers(0, 10)),
+            text=f"OBJ {i}" if i % 5 == 4 else "",
+        ))
+    return objects
+
+
+class SceneState:
+    """Vectorized motion of every object in a scene, sorted by z."""
+
+    def __init__(self, objects: list[SceneObject], frame_w: int, frame_h: int,
+                 fps: float) -> None:
+        from .scene_sprites import object_size   # imports this module
+
+        self.objects = sorted(objects, key=lambda o: o.z)   # stable: ties keep order
+        self.fps = fps
+        self._vx, self._vy = self._column("vx"), self._column("vy")
+        self._period, self._angle0 = self._column("rotation_period"), self._column("angle")
+
+        # Keep each object inside the frame at any angle: half the diagonal
+        # of what is drawn (a text label's size comes from its font)
+        half = np.array([math.hypot(*object_size(o)) / 2.0 for o in self.objects])
+        self._lo = half
+        self._hi_x, self._hi_y = frame_w - half, frame_h - half
+        self._x = np.clip(self._column("x"), half, np.maximum(self._hi_x, half))
+        self._y = np.clip(self._column("y"), half, np.maximum(self._hi_y, half))
+
+    def _column(self, name: str) -> np.ndarray:
+        return np.array([getattr(o, name) for o in self.objects], dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def at(self, frame_num: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Arrays ``(cx, cy, angle_deg)`` for all objects at *frame_num*."""
+        steps = frame_num + 1
+        cx = bounce_many(steps, self._x, self._vx, self._lo, self._hi_x)
+        cy = bounce_many(steps, self._y, self._vy, self._lo, self._hi_y)
+        turns = np.divide(frame_num, self.fps * self._period,
+                          out=np.zeros_like(self._period), where=self._period > 0)
+        return cx, cy, (self._angle0 + 360.0 * turns) % 360.0
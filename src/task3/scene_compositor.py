@@ -0,0 +1,101 @@
+"""
+Blend every object of a ``SceneState`` into a frame in one z-ordered pass.
+
+Per frame the compositor:
+
+1. Updates all object states at once (``SceneState.at``, numpy) and
+   places and culls every sprite box in one vectorized step.
+2. Walks the visible objects in z-order and blends each into its own
+   ROI only — frame-sized work never happens.
+
+Sprites come from ``scene_sprites``: cached per ``(object, quantised
+angle)`` and cropped to their visible box, so one blend is just two
+saturating ``uint8`` OpenCV ops.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.config import (
+    SCENE_SEED, CAPTURE_ENCODER_STATS, RENDER_WORKERS, RENDER_QUEUE_SIZE,
+)
+from src.encoder_stats import parse_x264_stats, save_encoder_stats, x264_stats_args
+from src.frame_sink import FrameSink
+from src.frame_source import FrameSource
+from .render_pipeline import run_pipeline
+from .scene import SceneState, load_scene, random_scene, save_scene
+from .scene_sprites import object_patch
+from .sprite_cache import quantise_angle
+
+logger = logging.getLogger("task3.scene_compositor")
+
+
+class SceneCompositor:
+    """Draw a whole scene per frame, in z-order, touching only object ROIs."""
+
+    def __init__(self, state: SceneState, frame_w: int, frame_h: int) -> None:
+        self.state = state
+        self.frame_w, self.frame_h = frame_w, frame_h
+
+    def composite(self, frame: np.ndarray, frame_num: int) -> np.ndarray:
+        """Blend every object at *frame_num* into the BGR *frame*, in place."""
+        import cv2
+
+        cx, cy, angle = self.state.at(frame_num)
+        patches = [object_patch(o, quantise_angle(a))
+                   for o, a in zip(self.state.objects, angle.tolist())]
+
+        # Place and clip every box at once
+        x0 = np.rint(cx).astype(int) + [p.dx for p in patches]
+        y0 = np.rint(cy).astype(int) + [p.dy for p in patches]
+        x1 = x0 + [p.paint.shape[1] for p in patches]
+        y1 = y0 + [p.paint.shape[0] for p in patches]
+        fx0, fy0 = np.maximum(x0, 0), np.maximum(y0, 0)
+        fx1, fy1 = np.minimum(x1, self.frame_w), np.minimum(y1, self.frame_h)
+        visible = np.flatnonzero((fx0 < fx1) & (fy0 < fy1))
+
+        for i in visible.tolist():             # ascending index == ascending z
+            p = patches[i]
+            crop = (slice(fy0[i] - y0[i], fy1[i] - y0[i]),
+                    slice(fx0[i] - x0[i], fx1[i] - x0[i]))
+            roi = frame[fy0[i]:fy1[i], fx0[i]:fx1[i]]
+            keep = cv2.multiply(roi, p.inverse[crop], scale=1 / 255.0)
+            cv2.add(keep, p.paint[crop], dst=roi)
+        return frame
+
+
+def render_scene(
+    input_path: Path, output_dir: Path,
+    scene_path: Optional[Path] = None, num_objects: int = 0,
+) -> Path:
+    """
+    Render a multi-object scene over the video into ``overlay_video.mp4``.
+
+    The scene comes from *scene_path* (JSON) or is *num_objects* random
+    objects; the resolved scene is saved as ``scene.json`` next to the video.
+    """
+    source = FrameSource(input_path)
+    fps, w, h = source.fps, source.width, source.height
+    objects = (load_scene(scene_path) if scene_path is not None
+               else random_scene(num_objects, w, h, SCENE_SEED))
+    save_scene(objects, output_dir / "scene.json")
+    compositor = SceneCompositor(SceneState(objects, w, h, fps), w, h)
+
+    final_path = output_dir / "overlay_video.mp4"
+    stats_prefix = output_dir / "_overlay_x264"
+    stats_args = x264_stats_args(stats_prefix) if CAPTURE_ENCODER_STATS else []
+    logger.info("Rendering scene of %d objects", len(objects))
+
+    with FrameSink(final_path, w, h, fps, audio_from=input_path,
+                   extra_args=stats_args) as sink:
+        run_pipeline(source, sink, lambda frame: frame.frame_number,
+                     compositor.composite, workers=max(RENDER_WORKERS, 1),
+                     queue_size=RENDER_QUEUE_SIZE)
+
+    if CAPTURE_ENCODER_STATS:
+        save_encoder_stats(parse_x264_stats(stats_prefix), final_path)
+    logger.info("Created %s (%d-object scene)", final_path.name, len(objects))
+    return final_path
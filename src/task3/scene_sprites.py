@@ -0,0 +1,96 @@
+"""
+Sprites of scene objects, cropped and premultiplied for blending.
+
+Each object kind (box, text label, logo mask) becomes one unrotated
+alpha mask, which is rotated into a square sprite with the object's
+opacity baked in. ``object_patch`` crops that sprite to its
+non-transparent box and stores the inverse alpha and the premultiplied
+colour, so the compositor's blend is just two saturating ``uint8``
+OpenCV ops.
+
+Everything is LRU-cached on ``(object, quantised angle)``: objects that
+do not rotate hit the cache on every frame.
+"""
+
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from src.config import SCENE_SPRITE_CACHE
+from .scene import SceneObject
+from .sprite_cache import rotated_sprite
+
+
+@lru_cache(maxsize=64)
+def _base_mask(kind: str, text: str, width: int, height: int) -> np.ndarray:
+    """Unrotated alpha mask (0-255) of a text label or logo."""
+    import cv2
+
+    if kind == "logo":
+        img = cv2.imread(text, cv2.IMREAD_UNCHANGED)
+        if img is None:
+            raise FileNotFoundError(text)
+        mask = img[..., 3] if img.ndim == 3 and img.shape[2] == 4 else (
+            img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY))
+        return cv2.resize(mask, (width, height), interpolation=cv2.INTER_AREA)
+
+    scale = cv2.getFontScaleFromHeight(cv2.FONT_HERSHEY_SIMPLEX, height, 2)
+    (tw, th), base = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)
+    mask = np.zeros((th + base + 4, tw + 4), dtype=np.uint8)
+    cv2.putText(mask, text, (2, th + 2), cv2.FONT_HERSHEY_SIMPLEX, scale, 255, 2,
+                lineType=cv2.LINE_AA)
+    return mask
+
+
+def object_size(obj: SceneObject) -> tuple[int, int]:
+    """Unrotated ``(width, height)`` of *obj* as drawn (text size comes from the font)."""
+    if obj.kind == "box":
+        return obj.width, obj.height
+    h, w = _base_mask(obj.kind, obj.text, obj.width, obj.height).shape
+    return w, h
+
+
+@lru_cache(maxsize=4096)
+def object_sprite(obj: SceneObject, angle_deg: float) -> np.ndarray:
+    """Square alpha sprite (opacity baked in) of *obj* rotated by *angle_deg*."""
+    import cv2
+
+    if obj.kind == "box":
+        return rotated_sprite(angle_deg, obj.opacity, obj.width, obj.height)
+
+    base = _base_mask(obj.kind, obj.text, obj.width, obj.height)
+    h, w = base.shape
+    side = int(math.ceil(math.hypot(w, h))) + 2
+    m = cv2.getRotationMatrix2D((w / 2.0, h / 2.0), -angle_deg, 1.0)
+    m[:, 2] += (side - w) / 2.0, (side - h) / 2.0
+    sprite = cv2.warpAffine(base, m, (side, side), flags=cv2.INTER_LINEAR)
+    sprite = (sprite.astype(np.float32) * obj.opacity).round().astype(np.uint8)
+    sprite.setflags(write=False)
+    return sprite
+
+
+class Patch(NamedTuple):
+    """A sprite cropped to its visible box, ready to blend (0x0 if fully transparent)."""
+
+    inverse: np.ndarray   # 255 - alpha, 3 channels
+    paint: np.ndarray     # colour * alpha / 255, 3 channels
+    dx: int               # crop offset from the object centre
+    dy: int
+
+
+@lru_cache(maxsize=SCENE_SPRITE_CACHE)
+def object_patch(obj: SceneObject, angle_deg: float) -> Patch:
+    """*obj*'s sprite at *angle_deg*, cropped and premultiplied for blending."""
+    import cv2
+
+    sprite = object_sprite(obj, angle_deg)
+    x, y, w, h = cv2.boundingRect(sprite)
+    if w == 0 or h == 0:               # nothing visible: the compositor skips it
+        empty = np.zeros((0, 0, 3), dtype=np.uint8)
+        return Patch(empty, empty, 0, 0)
+    alpha = cv2.cvtColor(np.ascontiguousarray(sprite[y:y + h, x:x + w]), cv2.COLOR_GRAY2BGR)
+    paint = cv2.multiply(alpha, (*obj.color, 0), scale=1 / 255.0)
+    half = sprite.shape[0] // 2
+    return Patch(255 - alpha, paint, x - half, y - half)
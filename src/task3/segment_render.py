@@ -0,0 +1,102 @@
+"""
+Segment-parallel Task 3 render: split at keyframes, render, concat.
+
+With the closed-form trajectory every frame's rectangle is known without
+replaying earlier frames, so the video can be cut at keyframes and each
+segment decoded, drawn and encoded in its own process. The parts are
+joined losslessly (``-c copy``) and the original audio is copied in.
+
+Each process draws exactly the pixels a sequential render would; only
+the libx264 GOP boundaries follow the segment cuts.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config import RECT_OPACITY, RECT_COLOR
+from src.encoder_stats import parse_x264_stats, save_encoder_stats, x264_stats_args
+from src.frame_sink import FrameSink
+from src.frame_source import FrameSource
+from src.utils.segments import Segment, concat_segments, seek_args
+from src.utils.thread_budget import limit_process, reserve, share
+from .motion_logic import select_compositor
+from .trajectory import rectangle_trajectory
+
+logger = logging.getLogger("task3.segments")
+
+
+def render_segmented(
+    input_path: Path, output_path: Path, segments: list[Segment], workers: int,
+    capture_stats: bool,
+) -> list[list]:
+    """
+    Render *segments* in a process pool and concat them into *output_path*.
+
+    Returns:
+        Rectangle log rows for every frame, in frame order.
+    """
+    seg_dir = output_path.parent / "_overlay_segments"
+    seg_dir.mkdir(exist_ok=True)
+    threads = share(workers)
+    jobs = [(input_path, seg_dir, seg, capture_stats, threads) for seg in segments]
+
+    logger.info("Rendering %d segments with %d processes", len(segments), workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(render_segment, jobs))
+
+    parts = [part for part, _, _ in results]
+    concat_segments(parts, output_path, audio_from=input_path)
+    if capture_stats:
+        save_encoder_stats(pd.concat([st for _, _, st in results], ignore_index=True),
+                           output_path)
+
+    for part in parts:
+        part.unlink(missing_ok=True)
+    seg_dir.rmdir()
+    logger.info("Created %s (segment-parallel)", output_path.name)
+    return [row for _, rows, _ in results for row in rows]
+
+
+def render_segment(
+    job: tuple[Path, Path, Segment, bool, int],
+) -> tuple[Path, list[list], Optional[pd.DataFrame]]:
+    """Worker process: decode one segment, draw the rectangle, encode it."""
+    input_path, seg_dir, seg, capture_stats, threads = job
+    if threads:
+        limit_process(threads)       # this worker's share; 0 = keep the whole budget
+    part = seg_dir / f"seg_{seg.index:04d}.mp4"
+    prefix = seg_dir / f"seg_{seg.index:04d}_x264"
+    stats_args = x264_stats_args(prefix) if capture_stats else []
+
+    draw, pix_fmt = select_compositor()
+    # -copyts keeps absolute PTS after the seek; subtracting the file's
+    # start_time gives the timestamps a sequential render logs
+    source = FrameSource(input_path, pix_fmt=pix_fmt,
+                         input_args=[*seek_args(seg), "-copyts"],
+                         max_frames=seg.num_frames, start_frame=seg.start_frame)
+    w, h = source.width, source.height
+    frames = np.arange(seg.start_frame, seg.start_frame + seg.num_frames)
+    cx, cy, angle, vx, vy = (a.tolist() for a in
+                             rectangle_trajectory(w, h, source.fps, frames))
+
+    rows: list[list] = []
+    # Decoder and encoder run together: each gets half of this worker's share
+    with reserve(2), FrameSink(part, w, h, source.fps, pix_fmt=pix_fmt,
+                               extra_args=stats_args) as sink:
+        for n, pts, _, image in source:
+            i = n - seg.start_frame
+            draw(image, cx[i], cy[i], angle[i], RECT_OPACITY, RECT_COLOR)
+            sink.write(image)
+            rows.append([n, round(pts - source.start_time, 4), round(cx[i], 1), round(cy[i], 1),
+                         round(angle[i], 2), round(vx[i], 1), round(vy[i], 1)])
+
+    if source.frames_read != seg.num_frames:
+        logger.warning("Segment %d decoded %d frames, expected %d",
+                       seg.index, source.frames_read, seg.num_frames)
+    stats = parse_x264_stats(prefix, seg.start_frame) if capture_stats else None
+    return part, rows, stats
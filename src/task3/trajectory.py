@@ -0,0 +1,150 @@
+"""
+Closed-form rectangle trajectory — the state at any frame, no history.
+
+``RectangleState`` used to move the rectangle one step per frame and
+clamp it at the walls, so frame *n* could only be reached by replaying
+frames 0..n-1. The same motion has a closed form per axis:
+
+1. Before the first bounce the centre moves linearly from the start.
+2. From then on it repeats a fixed cycle: one leg from the far wall to
+   the near wall, then back. A leg lasts ``floor(span / speed) + 1``
+   frames — each leg starts exactly on the wall, like the clamp did.
+
+Think of it like a bus timetable: you don't need to ride every earlier
+bus to know where the 5:40 will be, just the start time and the loop.
+"""
+
+import math
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from src.config import RECT_WIDTH, RECT_HEIGHT, VELOCITY_X, VELOCITY_Y, ROTATION_PERIOD
+
+# The bounding box of a rotated rectangle never exceeds its diagonal,
+# so half the diagonal keeps it fully inside the frame at any angle.
+HALF_DIAG = math.sqrt(RECT_WIDTH**2 + RECT_HEIGHT**2) / 2.0
+
+
+class BouncePlan(NamedTuple):
+    """Constants of one axis' motion; see the module docstring."""
+
+    start: float
+    velocity: float
+    first_wall: float   # wall hit first
+    other_wall: float
+    away: float         # direction (+1/-1) after the first bounce
+    speed: float
+    first_hit: int      # move count at which the first wall is reached
+    leg: int            # moves per wall-to-wall leg
+
+
+def bounce_plan(start: float, velocity: float, lo: float, hi: float) -> Optional[BouncePlan]:
+    """Motion constants for one axis, or None if the rectangle never moves."""
+    span = hi - lo
+    if velocity == 0 or span <= 0:
+        return None
+    speed = abs(velocity)
+    first_wall, other_wall = (hi, lo) if velocity > 0 else (lo, hi)
+    return BouncePlan(
+        start, velocity, first_wall, other_wall,
+        away=-1.0 if velocity > 0 else 1.0,
+        speed=speed,
+        first_hit=max(int(math.floor(abs(first_wall - start) / speed)) + 1, 1),
+        leg=int(math.floor(span / speed)) + 1,
+    )
+
+
+def axis_plans(frame_w: int, frame_h: int) -> tuple[Optional[BouncePlan], Optional[BouncePlan]]:
+    """Bounce plans for the x and y axes of a *frame_w* x *frame_h* frame."""
+    return (
+        bounce_plan(frame_w / 2.0, float(VELOCITY_X), HALF_DIAG, frame_w - HALF_DIAG),
+        bounce_plan(frame_h / 2.0, float(VELOCITY_Y), HALF_DIAG, frame_h - HALF_DIAG),
+    )
+
+
+def static_position(size: int) -> float:
+    """Centre used when the rectangle cannot move along an axis of *size* px."""
+    return size / 2.0
+
+
+def _bounce_axis(
+    steps: np.ndarray, plan: Optional[BouncePlan], size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Position and velocity after *steps* moves along one axis."""
+    steps = np.asarray(steps, dtype=np.int64)
+    if plan is None:
+        # Static, or frame smaller than the rectangle: centred (no wall-to-wall jitter)
+        return np.full(steps.shape, static_position(size)), np.zeros(steps.shape)
+
+    m = np.mod(steps - plan.first_hit, 2 * plan.leg)
+    first_leg = m < plan.leg
+    pos = np.where(first_leg, plan.first_wall + plan.away * m * plan.speed,
+                   plan.other_wall - plan.away * (m - plan.leg) * plan.speed)
+    vel = np.where(first_leg, plan.away * plan.speed, -plan.away * plan.speed)
+
+    before = steps < plan.first_hit
+    pos = np.where(before, plan.start + steps * plan.velocity, pos)
+    vel = np.where(before, plan.velocity, vel)
+    return pos, vel
+
+
+def rectangle_trajectory(
+    frame_w: int, frame_h: int, fps: float, frames: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rectangle state for every frame number in *frames*, vectorized.
+
+    Frame *n* is the state after ``n + 1`` moves from the frame centre,
+    exactly what ``RectangleState.update(n)`` returns.
+
+    Returns:
+        Arrays (cx, cy, angle_deg, vx, vy), one entry per frame.
+    """
+    frames = np.asarray(frames, dtype=np.int64)
+    steps = frames + 1
+    plan_x, plan_y = axis_plans(frame_w, frame_h)
+    cx, vx = _bounce_axis(steps, plan_x, frame_w)
+    cy, vy = _bounce_axis(steps, plan_y, frame_h)
+    # Rotation: 360 degrees every ROTATION_PERIOD seconds
+    angle = (360.0 * frames) / (fps * ROTATION_PERIOD) % 360.0
+    return cx, cy, angle, vx, vy
+
+
+def rectangle_at(
+    frame_w: int, frame_h: int, fps: float, frame_num: int,
+) -> tuple[float, float, float, float, float]:
+    """Rectangle state ``(cx, cy, angle_deg, vx, vy)`` at a single frame."""
+    state = rectangle_trajectory(frame_w, frame_h, fps, np.array([frame_num]))
+    return tuple(float(a[0]) for a in state)
+
+
+def bounce_many(
+    steps: int, start: np.ndarray, velocity: np.ndarray, lo: np.ndarray, hi: np.ndarray,
+) -> np.ndarray:
+    """
+    Positions of many independent objects along one axis after *steps* moves.
+
+    Same motion as :func:`bounce_plan`, vectorized across objects: every
+    argument except *steps* is an array with one entry per object.
+    Objects that cannot move (zero velocity, or larger than the frame)
+    stay at *start*, or at the middle of the frame respectively.
+    """
+    start, velocity = np.asarray(start, float), np.asarray(velocity, float)
+    lo, hi = np.asarray(lo, float), np.asarray(hi, float)
+    span = hi - lo
+    moving = (velocity != 0) & (span > 0)
+    speed = np.where(moving, np.abs(velocity), 1.0)
+
+    forward = velocity > 0
+    first_wall = np.where(forward, hi, lo)
+    other_wall = np.where(forward, lo, hi)
+    away = np.where(forward, -1.0, 1.0)
+    first_hit = np.maximum(np.floor(np.abs(first_wall - start) / speed) + 1, 1)
+    leg = np.floor(np.where(moving, span, 0.0) / speed) + 1
+
+    m = np.mod(steps - first_hit, 2 * leg)
+    pos = np.where(m < leg, first_wall + away * m * speed,
+                   other_wall - away * (m - leg) * speed)
+    pos = np.where(steps < first_hit, start + steps * velocity, pos)
+    return np.where(moving, pos, np.where(span > 0, start, (lo + hi) / 2.0))
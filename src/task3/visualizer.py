@@ -2,7 +2,8 @@
 Task 3 visualization — compression impact bar chart.
 
 Grouped bar chart comparing original vs. modified video for:
-file size, average bitrate, and average frame size.
+file size, average bitrate, and average frame size. Also the
+rate-distortion chart of an encode sweep.
 """
 
 import logging
@@ -12,6 +13,7 @@ from typing import Any
 
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 
 from src.config import GRAPH_DPI, FIGURE_SIZE, GRAPHS_DIR
 
@@ -70,3 +72,38 @@ def generate_compression_chart(
     shutil.copy(output_dir / name, GRAPHS_DIR / name)
     plt.close(fig)
     logger.info("Saved %s", name)
+
+
+def generate_sweep_chart(table: pd.DataFrame, output_dir: Path) -> None:
+    """
+    Rate-distortion and speed chart for an encode sweep.
+
+    Left: PSNR vs. bitrate, one curve per preset, points labelled with
+    their CRF. Right: encode fps vs. bitrate for the same points.
+    """
+    fig, (rd_ax, fps_ax) = plt.subplots(1, 2, figsize=(FIGURE_SIZE[0] * 1.4, FIGURE_SIZE[1]))
+    for preset, group in table.groupby("preset", sort=False):
+        group = group.sort_values("bitrate_kbps")
+        rd_ax.plot(group["bitrate_kbps"], group["psnr_db"], marker="o", label=preset)
+        fps_ax.plot(group["bitrate_kbps"], group["encode_fps"], marker="o", label=preset)
+        for _, row in group.iterrows():
+            rd_ax.annotate(f"CRF {row['crf']}", xy=(row["bitrate_kbps"], row["psnr_db"]),
+                           xytext=(4, -10), textcoords="offset points", fontsize=8)
+
+    rd_ax.set_title("Rate-Distortion", fontsize=14, fontweight="bold")
+    rd_ax.set_xlabel("Bitrate (kbps)")
+    rd_ax.set_ylabel("PSNR (dB)")
+    fps_ax.set_title("Encode Speed", fontsize=14, fontweight="bold")
+    fps_ax.set_xlabel("Bitrate (kbps)")
+    fps_ax.set_ylabel("Encode fps")
+    for ax in (rd_ax, fps_ax):
+        ax.legend(title="Preset")
+        ax.grid(alpha=0.3, linestyle="--")
+
+    plt.tight_layout()
+    name = "encode_sweep.png"
+    fig.savefig(output_dir / name, dpi=GRAPH_DPI, bbox_inches="tight")
+    GRAPHS_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.copy(output_dir / name, GRAPHS_DIR / name)
+    plt.close(fig)
+    logger.info("Saved %s", name)
@@ -0,0 +1,96 @@
+"""
+Blend the rectangle straight into planar YUV420 (I420) frames.
+
+The BGR path converts every frame twice: YUV -> BGR for OpenCV, then
+BGR -> YUV again inside the encoder, resampling chroma both times. Here
+frames stay in the decoder's native ``yuv420p`` layout end to end:
+
+- the rectangle colour is converted to one ``(Y, U, V)`` triple, once;
+- the sprite alpha is blended into the full-resolution Y plane;
+- a 2x2-averaged copy of the alpha is blended into the half-resolution
+  U and V planes.
+
+Only the sprite's bounding box is touched, as in ``sprite_cache``.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from src.yuv_layout import yuv_planes
+from .sprite_cache import quantise_angle, rotated_sprite
+
+# BT.601 limited range — what FFmpeg's swscale uses for untagged
+# BGR -> YUV, so the colour matches the BGR engines' encodes.
+_BT601 = np.array([
+    [65.481, 128.553, 24.966],
+    [-37.797, -74.203, 112.0],
+    [112.0, -93.786, -18.214],
+])
+_OFFSET = np.array([16.0, 128.0, 128.0])
+
+
+@lru_cache(maxsize=16)
+def yuv_color(color: tuple[int, int, int]) -> tuple[int, int, int]:
+    """Convert a BGR colour to a limited-range ``(Y, U, V)`` triple."""
+    b, g, r = color
+    yuv = _OFFSET + _BT601 @ (np.array([r, g, b], dtype=np.float64) / 255.0)
+    return tuple(int(v) for v in np.clip(np.round(yuv), 0, 255))
+
+
+def _blend_plane(plane: np.ndarray, x0: int, y0: int, alpha: np.ndarray, value: int) -> None:
+    """``plane = plane * (1 - a) + value * a`` over *alpha*'s box at (x0, y0), in place."""
+    import cv2
+
+    fx0, fy0 = max(x0, 0), max(y0, 0)
+    fx1 = min(x0 + alpha.shape[1], plane.shape[1])
+    fy1 = min(y0 + alpha.shape[0], plane.shape[0])
+    if fx0 >= fx1 or fy0 >= fy1:
+        return
+    a = alpha[fy0 - y0: fy1 - y0, fx0 - x0: fx1 - x0]
+    roi = plane[fy0:fy1, fx0:fx1]
+    keep = cv2.multiply(roi, 255 - a, scale=1 / 255.0)
+    paint = cv2.multiply(np.full_like(roi, value), a, scale=1 / 255.0)
+    cv2.add(keep, paint, dst=roi)
+
+
+@lru_cache(maxsize=4096)
+def _chroma_sprite(angle_deg: float, opacity: float, odd_x: bool, odd_y: bool) -> np.ndarray:
+    """2x2-averaged alpha for the chroma planes, aligned to the sprite's parity."""
+    import cv2
+
+    sprite = rotated_sprite(angle_deg, opacity)
+    # Pad so the sprite starts on an even luma position, and to even size
+    top, left = int(odd_y), int(odd_x)
+    h = sprite.shape[0] + top
+    w = sprite.shape[1] + left
+    padded = np.zeros((h + h % 2, w + w % 2), dtype=np.uint8)
+    padded[top:h, left:w] = sprite
+    half = cv2.resize(padded, (padded.shape[1] // 2, padded.shape[0] // 2),
+                      interpolation=cv2.INTER_AREA)
+    half.setflags(write=False)
+    return half
+
+
+def draw_rotated_rectangle_yuv(
+    frame: np.ndarray,
+    cx: float, cy: float,
+    angle_deg: float,
+    opacity: float,
+    color: tuple[int, int, int],
+) -> np.ndarray:
+    """Drop-in ``draw_rotated_rectangle`` for I420 buffers; *color* is BGR."""
+    angle = quantise_angle(angle_deg)
+    sprite = rotated_sprite(angle, opacity)
+    y_plane, u_plane, v_plane = yuv_planes(frame)
+    y, u, v = yuv_color(color)
+
+    side = sprite.shape[0]
+    x0 = int(round(cx)) - side // 2
+    y0 = int(round(cy)) - side // 2
+    _blend_plane(y_plane, x0, y0, sprite, y)
+
+    chroma = _chroma_sprite(angle, opacity, bool(x0 % 2), bool(y0 % 2))
+    _blend_plane(u_plane, x0 // 2, y0 // 2, chroma, u)
+    _blend_plane(v_plane, x0 // 2, y0 // 2, chroma, v)
+    return frame
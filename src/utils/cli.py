@@ -0,0 +1,62 @@
+"""
+Command-line interface of ``main.py``: the option parser and the live
+analysis entry point.
+
+``--live`` needs neither an input file nor the task loop, so it runs
+from here; every other option is handed to the task runners by
+``main._run_task``.
+"""
+
+import argparse
+import logging
+
+from src.config import TASK1_OUTPUT_DIR
+from src.utils.logger import print_log_status
+from src.utils.paths import ensure_output_dirs
+from src.utils.validators import validate_live_source
+
+
+def run_live(source: str, logger: logging.Logger) -> None:
+    """Analyse a live MPEG-TS feed until it ends (or Ctrl+C)."""
+    from src.task1 import analyze_live
+
+    validate_live_source(source)
+    ensure_output_dirs()
+    logger.info("Starting live analysis — source=%s", source)
+    print(f"  Live source: {source} (Ctrl+C to stop)")
+    lines = analyze_live(source, TASK1_OUTPUT_DIR)
+    print(f"  Wrote {lines} JSON lines to live_stats.jsonl")
+    print_log_status(logger)
+
+
+def parse_args() -> argparse.Namespace:
+    """The command-line options of ``main.py``."""
+    parser = argparse.ArgumentParser(description="L35 Video Compression Toolkit")
+    parser.add_argument("--task", type=int, choices=[1, 2, 3],
+                        help="Run a single task (1, 2, or 3)")
+    parser.add_argument("--input", type=str,
+                        help="Path to input MP4 video")
+    parser.add_argument("--sample", type=int, default=0, metavar="N",
+                        help="Task 1: approximate stats from N sampled GOP-aligned intervals")
+    parser.add_argument("--stream", action="store_true",
+                        help="Task 1: single pass in constant memory (no frame table)")
+    parser.add_argument("--live", type=str, metavar="SOURCE",
+                        help="Rolling stats of live MPEG-TS: '-' (stdin), a FIFO or "
+                             "udp://127.0.0.1:PORT")
+    parser.add_argument("--preview", type=float, nargs=2, metavar=("START", "DURATION"),
+                        help="Task 2: render a fast low-res MV proxy of this window (seconds)")
+    parser.add_argument("--preview-height", type=int,
+                        help="Task 2 proxy height in pixels (0 = original)")
+    parser.add_argument("--scene", type=str,
+                        help="Task 3: render this JSON scene of overlay objects")
+    parser.add_argument("--scene-objects", type=int, default=0, metavar="N",
+                        help="Task 3: render N random moving objects (stress test)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Task 3: checkpoint the render and resume an interrupted one")
+    parser.add_argument("--sweep", action="store_true",
+                        help="Task 3: encode a CRF x preset grid and chart rate vs. distortion")
+    parser.add_argument("--ladder", type=str, nargs="+", metavar="RENDITION",
+                        help="Task 3: compare these ABR renditions against the input video")
+    parser.add_argument("--plan", action="store_true",
+                        help="Tasks 2/3: predict render time and size from sample encodes")
+    return parser.parse_args()
@@ -0,0 +1,34 @@
+"""
+Small-sample confidence intervals for estimates built from a few samples.
+
+Render planning and sampled Task 1 analysis both measure a handful of
+samples and extrapolate. With so few samples a normal approximation is
+too optimistic, so bounds use Student's t quantiles.
+"""
+
+import math
+
+import numpy as np
+
+# Two-sided 95% Student's t quantiles by degrees of freedom
+_T95 = {1: 12.71, 2: 4.30, 3: 3.18, 4: 2.78, 5: 2.57, 6: 2.45, 7: 2.36, 8: 2.31,
+        9: 2.26, 10: 2.23, 15: 2.13, 20: 2.09, 30: 2.04}
+
+
+def t95(dof: int) -> float:
+    """Two-sided 95% t quantile for *dof* degrees of freedom (conservative)."""
+    if dof > 30:
+        return 1.96
+    return _T95[max(d for d in _T95 if d <= dof)]
+
+
+def mean_interval(values: np.ndarray) -> tuple[float, float]:
+    """``(mean, half_width)`` of a 95% confidence interval for the mean."""
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return float("nan"), float("nan")
+    if len(values) == 1:
+        return float(values[0]), float("nan")
+    half = t95(len(values) - 1) * float(values.std(ddof=1)) / math.sqrt(len(values))
+    return float(values.mean()), half
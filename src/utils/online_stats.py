@@ -0,0 +1,150 @@
+"""
+Online (single-pass, constant-memory) statistics.
+
+Task 1 used to load every frame into a DataFrame before computing
+anything. These accumulators see each value once and keep only a few
+numbers, so the input can be arbitrarily long:
+
+- ``RunningStats``: count, mean, variance (Welford's update), min, max;
+- ``P2Quantile``: one quantile, exact while it has seen at most *exact*
+  values, then tracked with five markers (the P-square algorithm of
+  Jain & Chlamtac) seeded from those values;
+- ``BoxSketch``: the quartiles, whiskers and notch of a box plot;
+- ``RateBins``: a bitrate timeline that halves its resolution instead of
+  growing once it reaches ``max_bins`` windows.
+
+Think of it like a cashier keeping a running total instead of every receipt.
+"""
+
+import math
+from bisect import bisect_right, insort
+from typing import Any
+
+
+class RunningStats:
+    """Count, mean, population variance, min and max, updated one value at a time."""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count, self.mean, self._m2 = 0, 0.0, 0.0
+        self.min, self.max = math.inf, -math.inf
+
+    def add(self, x: float) -> None:
+        """Fold *x* into the count, mean, variance and range."""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)        # Welford: numerically stable
+        self.min, self.max = min(self.min, x), max(self.max, x)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (``np.std`` with ``ddof=0``)."""
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+
+class P2Quantile:
+    """Streaming estimate of the *p* quantile in O(*exact*) memory."""
+
+    def __init__(self, p: float, exact: int = 1000) -> None:
+        self.p, self._exact = p, max(exact, 5)
+        self._buf: list[float] = []                # sorted values while exact
+        self._q: list[float] = []                  # marker heights (empty while exact)
+        self._n: list[int] = []                    # marker positions
+        self._want: list[float] = []               # desired marker positions
+        self._step = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float) -> None:
+        """Buffer *x* while exact, else move the markers (P-square update)."""
+        if not self._q:
+            insort(self._buf, x)
+            if len(self._buf) > self._exact:
+                self._start_markers()
+            return
+        q, n = self._q, self._n
+        q[0], q[4] = min(q[0], x), max(q[4], x)
+        k = min(max(bisect_right(q, x) - 1, 0), 3)  # cell containing x
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._want[i] += self._step[i]
+        for i in (1, 2, 3):
+            d = self._want[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                h = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < h < q[i + 1]:    # parabola overshoots: go linear
+                    h = q[i] + s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+                q[i], n[i] = h, n[i] + s
+
+    def _start_markers(self) -> None:
+        """Seed the five markers at their quantile ranks in the exact buffer."""
+        last = len(self._buf) - 1
+        self._want = [last * s for s in self._step]
+        self._n = [round(w) for w in self._want]
+        for i in (1, 2, 3):                        # keep positions strictly increasing
+            self._n[i] = min(max(self._n[i], self._n[i - 1] + 1), last - 4 + i)
+        self._q = [self._buf[i] for i in self._n]
+        self._buf = []
+
+    @property
+    def value(self) -> float:
+        """Current estimate of the *p* quantile (NaN before any value)."""
+        if not self._q:                            # exact, interpolated like np.percentile
+            buf = self._buf
+            if not buf:
+                return math.nan
+            pos = self.p * (len(buf) - 1)
+            lo = int(pos)
+            return buf[lo] + (buf[min(lo + 1, len(buf) - 1)] - buf[lo]) * (pos - lo)
+        return self._q[2]
+
+
+class BoxSketch:
+    """Everything ``Axes.bxp`` needs to draw one notched box, from a stream."""
+
+    def __init__(self, exact: int = 1000) -> None:
+        self.stats = RunningStats()
+        self.quartiles = [P2Quantile(p, exact) for p in (0.25, 0.5, 0.75)]
+
+    def add(self, x: float) -> None:
+        """Feed *x* to the running stats and all three quartiles."""
+        self.stats.add(x)
+        for q in self.quartiles:
+            q.add(x)
+
+    def bxp_stats(self, label: str) -> dict[str, Any]:
+        """Box-plot stats; whiskers reach 1.5 IQR, clipped to the observed range."""
+        q1, med, q3 = (q.value for q in self.quartiles)
+        iqr, lo, hi = q3 - q1, self.stats.min, self.stats.max
+        notch = 1.57 * iqr / math.sqrt(self.stats.count)
+        whislo, whishi = max(q1 - 1.5 * iqr, lo), min(q3 + 1.5 * iqr, hi)
+        return {"label": label, "med": med, "q1": q1, "q3": q3,
+                "whislo": whislo, "whishi": whishi, "cilo": med - notch, "cihi": med + notch,
+                "fliers": [v for v in (lo, hi) if v < whislo or v > whishi]}
+
+
+class RateBins:
+    """Bytes per time window (plus an I-frame flag), at most *max_bins* windows."""
+
+    def __init__(self, window_sec: float, max_bins: int) -> None:
+        self.window_sec, self.max_bins = window_sec, max_bins
+        self.bytes: list[float] = []
+        self.has_i: list[bool] = []
+
+    def add(self, t: float, size: float, is_i: bool) -> None:
+        """Add *size* bytes at time *t* to its window, merging windows when full."""
+        i = max(int(t // self.window_sec), 0)
+        while i >= self.max_bins:                  # full: merge neighbours, double width
+            self.bytes = [sum(self.bytes[j:j + 2]) for j in range(0, len(self.bytes), 2)]
+            self.has_i = [any(self.has_i[j:j + 2]) for j in range(0, len(self.has_i), 2)]
+            self.window_sec *= 2
+            i = int(t // self.window_sec)
+        if i >= len(self.bytes):
+            self.bytes.extend([0.0] * (i + 1 - len(self.bytes)))
+            self.has_i.extend([False] * (i + 1 - len(self.has_i)))
+        self.bytes[i] += size
+        self.has_i[i] = self.has_i[i] or is_i
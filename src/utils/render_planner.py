@@ -0,0 +1,109 @@
+"""
+Predict a render's runtime and output size from a few sample encodes.
+
+Before a multi-hour ``render_overlay`` or ``generate_mv_video`` run, the
+planner encodes ``PLAN_SAMPLES`` short samples, each ``PLAN_SAMPLE_SEC``
+long and starting on a keyframe, spread evenly over the video. It uses
+the real pipeline and the configured CRF and preset. Each sample gives
+one measurement of seconds per frame and bits per frame, and the
+per-sample spread gives 95% confidence bounds (Student's t) on the
+extrapolated totals.
+
+Think of it like timing a few laps before estimating the whole race.
+
+Estimates are for a single sequential render. Each sample also pays
+FFmpeg's start-up cost, so the runtime estimate leans pessimistic.
+"""
+
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.config import CRF_VALUE, PRESET, PLAN_SAMPLES, PLAN_SAMPLE_SEC
+from src.utils.confidence import mean_interval
+from src.utils.segments import Segment, probe_keyframes
+
+logger = logging.getLogger("utils.render_planner")
+
+
+def sample_segments(input_path: Path, count: int = PLAN_SAMPLES,
+                    sample_sec: float = PLAN_SAMPLE_SEC) -> tuple[list[Segment], int]:
+    """Up to *count* evenly spaced keyframe-aligned samples, and the total frame count."""
+    pts, keys = probe_keyframes(input_path)
+    total = len(pts)
+    if total == 0:
+        return [], 0
+    if len(keys) == 0 or keys[0] != 0:
+        keys = np.concatenate(([0], keys))
+    fps = (total - 1) / (pts[-1] - pts[0]) if total > 1 and pts[-1] > pts[0] else 30.0
+    length = max(int(round(sample_sec * fps)), 1)
+
+    wanted = np.linspace(0, max(total - length, 0), max(count, 1))
+    starts = np.unique(keys[np.abs(keys[:, None] - wanted).argmin(axis=0)])
+    margin = 0.25 * float(np.median(np.diff(pts))) if total > 1 else 0.0
+    return [Segment(i, int(s), int(min(length, total - s)), float(pts[s]) + margin)
+            for i, s in enumerate(starts)], total
+
+
+def predict_render(input_path: Path, job: str, output_dir: Path) -> dict[str, Any]:
+    """
+    Estimate runtime and size of a full *job* render (``"overlay"`` or ``"mv"``).
+
+    Saves ``render_plan.json`` in *output_dir* and returns the same dict.
+    """
+    segments, total = sample_segments(input_path)
+    spf, bpf = [], []
+    with tempfile.TemporaryDirectory(dir=output_dir) as tmp:
+        for seg in segments:
+            start = time.perf_counter()
+            part = _encode_sample(job, input_path, Path(tmp), seg)
+            spf.append((time.perf_counter() - start) / seg.num_frames)
+            bpf.append(part.stat().st_size * 8 / seg.num_frames)
+
+    runtime = _extrapolate(np.array(spf), total)
+    size = _extrapolate(np.array(bpf) / 8, total)
+    plan = {
+        "job": job,
+        "crf": CRF_VALUE,
+        "preset": PRESET,
+        "total_frames": total,
+        "samples": len(segments),
+        "sampled_frames": int(sum(s.num_frames for s in segments)),
+        "encode_fps": round(1 / float(np.mean(spf)), 1) if spf else 0.0,
+        "runtime_sec": runtime,
+        "output_bytes": {k: int(v) for k, v in size.items()},
+    }
+    (output_dir / "render_plan.json").write_text(json.dumps(plan, indent=2), encoding="utf-8")
+    logger.info("Predicted %s render: %.0f s (%.0f-%.0f), %.1f MB", job,
+                runtime["estimate"], runtime["low"], runtime["high"],
+                size["estimate"] / 1e6)
+    return plan
+
+
+def _encode_sample(job: str, input_path: Path, tmp: Path, seg: Segment) -> Path:
+    """Render one sample with the real pipeline of *job*; return the encoded part."""
+    if job == "mv":
+        from src.task2.mv_visualizer import render_mv_segment
+
+        return render_mv_segment(input_path, tmp / f"sample_{seg.index:02d}.mp4", seg)
+
+    from src.task3.segment_render import render_segment
+
+    part, _, _ = render_segment((input_path, tmp, seg, False, 0))   # 0 = whole CPU budget
+    return part
+
+
+def _extrapolate(per_frame: np.ndarray, total: int) -> dict[str, float]:
+    """``total`` times the per-frame mean, with a 95% confidence interval."""
+    if len(per_frame) == 0:
+        return {"estimate": 0.0, "low": 0.0, "high": 0.0}
+    mean, half = mean_interval(per_frame)
+    half = 0.0 if np.isnan(half) else half
+    return {"estimate": round(mean * total, 1),
+            "low": round(max(mean - half, 0.0) * total, 1),
+            "high": round((mean + half) * total, 1)}
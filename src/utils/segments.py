@@ -0,0 +1,150 @@
+"""
+Keyframe-aligned segment planning and lossless concatenation.
+
+Long encodes can be split at keyframes, rendered in parallel, and
+stitched back together with the concat demuxer (``-c copy``). Cuts are
+made only at keyframes that start a closed GOP (see ``probe_keyframes``),
+so the decoder sees exactly the same frames, and the same motion
+vectors, as a single sequential pass.
+
+Think of it like splitting a book into chapters so several people can
+copy it at once, then binding the chapters back in order.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional, TypeVar
+
+import numpy as np
+
+from src.ffmpeg_utils import parse_compact, run_ffmpeg, run_ffprobe_packets
+from src.utils.thread_budget import cpu_budget, reserve
+
+logger = logging.getLogger("utils.segments")
+T = TypeVar("T")
+
+
+class Segment(NamedTuple):
+    """A keyframe-aligned slice of the video, in display-order frames."""
+
+    index: int
+    start_frame: int
+    num_frames: int
+    seek_sec: float    # absolute seek point, just past the segment's keyframe
+
+
+def probe_keyframes(input_path: Path) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return ``(pts_times, keyframe_indices)`` in display order.
+
+    Only keyframes that start a closed GOP are returned. In an open GOP,
+    leading B-frames (after the keyframe in decode order, before it in
+    display order) reference the previous GOP and are lost after a seek.
+    Uses a packet listing only (demux, no decode), so it is cheap.
+    """
+    rows = parse_compact(run_ffprobe_packets(input_path, "pts_time,flags"))
+    rows = [r for r in rows if r.get("pts_time", "N/A") != "N/A"]
+    pts = np.array([float(r["pts_time"]) for r in rows])
+    key = np.array([r.get("flags", "").startswith("K") for r in rows], dtype=bool)
+
+    # Clean cut: nothing decoded after the keyframe is displayed before it
+    later_min = np.append(np.minimum.accumulate(pts[::-1])[::-1][1:], np.inf)
+    clean = key & (later_min >= pts)
+    if clean.sum() < key.sum():
+        logger.info("Skipping %d open-GOP keyframes as cut points", key.sum() - clean.sum())
+
+    order = np.argsort(pts, kind="stable")   # decode order -> display order
+    return pts[order], np.flatnonzero(clean[order])
+
+
+def plan_segments(input_path: Path, target_count: int,
+                  segment_sec: Optional[float] = None) -> list[Segment]:
+    """
+    Group GOPs into about *target_count* segments of similar frame count.
+
+    With *segment_sec*, the count is instead chosen so segments last
+    about that many seconds. Returns a single segment when the video has
+    only one clean keyframe.
+    """
+    pts, keys = probe_keyframes(input_path)
+    total = len(pts)
+    if total == 0:
+        return []
+    if segment_sec:
+        target_count = int(np.ceil((pts[-1] - pts[0]) / segment_sec)) or 1
+    if len(keys) == 0 or keys[0] != 0:
+        keys = np.concatenate(([0], keys))
+    if len(keys) < 2:
+        return [Segment(0, 0, total, 0.0)]
+
+    # Cut at the keyframe nearest to each ideal (equal-length) point
+    ideal = np.linspace(0, total, max(target_count, 1) + 1)[1:-1]
+    pos = np.searchsorted(keys, ideal).clip(1, len(keys) - 1)
+    left, right = keys[pos - 1], keys[pos]
+    cuts = np.where(ideal - left <= right - ideal, left, right)
+    bounds = np.unique(np.concatenate(([0], cuts, [total])))
+
+    # A quarter frame past the keyframe absorbs ffprobe's 6-decimal rounding
+    margin = 0.25 * float(np.median(np.diff(pts))) if total > 1 else 0.0
+    return [
+        Segment(i, int(a), int(b - a), float(pts[a]) + margin)
+        for i, (a, b) in enumerate(zip(bounds[:-1], bounds[1:]))
+    ]
+
+
+def seek_args(segment: Segment) -> list[str]:
+    """
+    FFmpeg input options that start decoding exactly at *segment*'s
+    closed-GOP keyframe: ``-noaccurate_seek`` keeps the keyframe the
+    demuxer lands on rather than decoding up to the seek point, and
+    ``-seek_timestamp 1`` makes ``-ss`` an absolute PTS, as ffprobe reports.
+    """
+    if segment.start_frame == 0:
+        return []
+    return ["-seek_timestamp", "1", "-noaccurate_seek",
+            "-ss", f"{segment.seek_sec:.6f}"]
+
+
+def default_workers() -> int:
+    """Number of parallel segment jobs — one per core of the CPU budget."""
+    return cpu_budget()
+
+
+def run_parallel(fn: Callable[[Segment], T], segments: list[Segment],
+                 workers: int) -> list[T]:
+    """
+    Run *fn* on every segment concurrently, results in segment order.
+
+    Each job spends its time inside its own FFmpeg child process, so a
+    thread pool suffices; it reserves its size in the thread budget.
+    """
+    with reserve(workers), ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        return list(pool.map(fn, segments))
+
+
+def concat_segments(parts: list[Path], output: Path, timeout: int = 600,
+                    audio_from: Optional[Path] = None) -> Path:
+    """
+    Losslessly join *parts* (same codec settings) into *output*, plus
+    the audio track of *audio_from* (if given and present).
+    """
+    list_file = output.with_suffix(".concat.txt")
+    list_file.write_text(
+        "".join(f"file '{p.resolve().as_posix()}'\n" for p in parts),
+        encoding="utf-8",
+    )
+    try:
+        run_ffmpeg([
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0",
+            "-i", str(list_file),
+            *(["-i", str(audio_from), "-map", "0:v:0", "-map", "1:a?", "-shortest"]
+              if audio_from is not None else []),
+            "-c", "copy",
+            str(output),
+        ], timeout=timeout)
+    finally:
+        list_file.unlink(missing_ok=True)
+    logger.info("Concatenated %d segments into %s", len(parts), output.name)
+    return output
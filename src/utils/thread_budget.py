@@ -0,0 +1,118 @@
+"""
+One CPU budget shared by every concurrent FFmpeg, libx264 and OpenCV job.
+
+Left alone, every libx264 encode, every FFmpeg decoder and filter graph
+and OpenCV each start one thread per core. With several of them running
+at once the machine is oversubscribed and throughput drops. Here each
+running job claims a slot, and every job gets an equal share of
+``THREAD_BUDGET`` threads (all cores by default):
+
+- ``run_ffmpeg`` and ``FrameSink`` claim a slot per FFmpeg process and
+  pass the share as ``-threads`` / ``-filter_threads``, which libx264
+  uses as its thread count; sampled Task 1 ffprobes do the same;
+- worker pools ``reserve`` their size up front, so the first job of a
+  pool does not grab every core before its siblings start;
+- process pools start each worker with ``limit_process``, which gives
+  that process its share of the parent's budget;
+- ``cv2.setNumThreads`` follows the share whenever the job count changes.
+
+Think of it like seats at a table: more guests, smaller slices.
+"""
+
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from src.config import THREAD_BUDGET
+
+_lock = threading.Lock()
+_budget: Optional[int] = None      # set in pool workers by limit_process
+_active = 0                        # slots claimed in this process
+_reserved = 0                      # slots promised to running worker pools
+
+
+def cpu_budget() -> int:
+    """Threads this process may use in total."""
+    if _budget is not None:
+        return _budget
+    return max(THREAD_BUDGET or os.cpu_count() or 1, 1)
+
+
+def share(jobs: int) -> int:
+    """Threads for each of *jobs* concurrent jobs (at least one)."""
+    return max(cpu_budget() // max(jobs, 1), 1)
+
+
+def acquire(jobs: int = 1) -> int:
+    """Claim *jobs* slots; return the threads each claimed job may use."""
+    global _active
+    with _lock:
+        _active += jobs
+        threads = share(max(_active, _reserved))
+    _apply_cv2()
+    return threads
+
+
+def release(jobs: int = 1) -> None:
+    """Give back slots claimed with :func:`acquire`."""
+    global _active
+    with _lock:
+        _active = max(_active - jobs, 0)
+    _apply_cv2()
+
+
+@contextmanager
+def claim(jobs: int = 1) -> Iterator[int]:
+    """``acquire``/``release`` around a block; yields the per-job thread count."""
+    threads = acquire(jobs)
+    try:
+        yield threads
+    finally:
+        release(jobs)
+
+
+@contextmanager
+def reserve(workers: int) -> Iterator[int]:
+    """Hold *workers* slots for a pool's lifetime; yields each worker's share."""
+    global _reserved
+    with _lock:
+        _reserved += workers
+    try:
+        yield share(workers)
+    finally:
+        with _lock:
+            _reserved = max(_reserved - workers, 0)
+
+
+def limit_process(threads: int) -> None:
+    """Pool initializer: this worker process may use *threads* threads in total."""
+    global _budget, _active, _reserved
+    _budget, _active, _reserved = max(threads, 1), 0, 0
+    _apply_cv2()
+
+
+def ffmpeg_thread_args(args: list[str], threads: int) -> list[str]:
+    """
+    *args* with ``-filter_threads`` (global), ``-threads`` before every
+    input (decoders) and before the last output (encoder) added.
+
+    Commands that already set ``-threads`` are returned unchanged.
+    """
+    if "-threads" in args:
+        return args
+    n = str(threads)
+    out = [args[0], "-filter_threads", n]
+    for arg in args[1:-1]:
+        if arg == "-i":
+            out += ["-threads", n]
+        out.append(arg)
+    return out + ["-threads", n, args[-1]]
+
+
+def _apply_cv2() -> None:
+    """Match OpenCV's pool to the current share (only if cv2 is already loaded)."""
+    cv2 = sys.modules.get("cv2")
+    if cv2 is not None:
+        cv2.setNumThreads(share(max(_active, _reserved, 1)))
@@ -1,12 +1,15 @@
 """
 Input and environment validation for the L35 toolkit.
 
-Checks that the input video exists and is MP4, and that FFmpeg/FFprobe
-are installed with the features we need (libx264 encoder, codecview filter).
+Checks that the input video exists and is MP4 (or that a live source is
+usable), and that FFmpeg/FFprobe are installed with the features we need
+(libx264 encoder, codecview filter).
 """
 
+import stat
 import subprocess
 from pathlib import Path
+from urllib.parse import urlparse
 
 from src.config import FFMPEG_DIR
 
@@ -42,6 +45,40 @@ def validate_input_video(path: Path) -> Path:
     return path
 
 
+def validate_live_source(source: str) -> str:
+    """
+    Verify a live MPEG-TS source: ``-`` (stdin), a FIFO or ``.ts`` file,
+    or ``udp://`` on a localhost address with a port.
+
+    Returns:
+        The validated source string (unchanged).
+
+    Raises:
+        FileNotFoundError: FIFO or file does not exist.
+        ValueError: Unsupported source.
+        RuntimeError: PyAV, which live mode reads with, is not installed.
+    """
+    try:
+        import av  # noqa: F401
+    except ImportError:
+        raise RuntimeError("Live mode needs PyAV: pip install av")
+
+    if source == "-":
+        return source
+    if source.startswith("udp://"):
+        url = urlparse(source)
+        if url.hostname not in ("127.0.0.1", "localhost", "::1") or not url.port:
+            raise ValueError(f"Expected udp://127.0.0.1:PORT, got '{source}'.")
+        return source
+
+    path = Path(source)
+    if not path.exists():
+        raise FileNotFoundError(f"Live source not found: {path}")
+    if not stat.S_ISFIFO(path.stat().st_mode) and path.suffix.lower() not in (".ts", ".m2ts"):
+        raise ValueError(f"Expected '-', a FIFO, a .ts file or udp://, got '{source}'.")
+    return source
+
+
 def validate_ffmpeg() -> None:
     """
     Ensure FFmpeg and FFprobe are accessible and have required features.
@@ -0,0 +1,39 @@
+"""
+Memory layout of raw frames piped to and from FFmpeg.
+
+``bgr24`` frames are packed ``(height, width, 3)`` arrays, as OpenCV
+expects. ``yuv420p`` (planar I420) frames are one ``height * 3/2`` x
+``width`` byte buffer: the full-size Y plane followed by the
+quarter-size U and V planes. ``FrameSource`` and the encode cache size
+their buffers with ``frame_shape``; the YUV compositor reaches into the
+planes with ``yuv_planes``, all without copying.
+"""
+
+import numpy as np
+
+
+def frame_shape(pix_fmt: str, width: int, height: int) -> tuple[int, ...]:
+    """
+    Numpy shape of one raw frame.
+
+    ``yuv420p`` is planar I420: a full-size Y plane followed by quarter-size
+    U and V planes, i.e. ``height * 3 / 2`` rows of *width* bytes. Packed
+    formats (``bgr24``, ``rgb24``) are ``(height, width, 3)``.
+    """
+    if pix_fmt == "yuv420p":
+        return (height * 3 // 2, width)
+    return (height, width, 3)
+
+
+def yuv_planes(frame: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Views of the Y, U and V planes of an I420 buffer (``h * 3/2`` x ``w``)."""
+    width = frame.shape[1]
+    height = frame.shape[0] * 2 // 3
+    flat = frame.reshape(-1)
+    luma = width * height
+    chroma = (width // 2) * (height // 2)
+    return (
+        flat[:luma].reshape(height, width),
+        flat[luma:luma + chroma].reshape(height // 2, width // 2),
+        flat[luma + chroma:luma + 2 * chroma].reshape(height // 2, width // 2),
+    )